@@ -0,0 +1,46 @@
+"""Benchmark combining many results into one.
+
+Folds a list of prebuilt Ok results, each with one message, into a single
+Ok of all values two ways: a hand-written loop that concatenates message
+tuples and rebuilds the result through the constructor at the end, and
+`collect()`. The hand-written loop is quadratic in the number of messages.
+
+Run with:
+    python -m benchmarks.bench_aggregate
+"""
+import timeit
+
+from resokerr import Err, Ok, collect
+
+SIZES = (100, 1_000, 10_000)
+NUMBER = 5
+
+
+def _hand_written(results):
+    values = []
+    messages = ()
+    for result in results:
+        messages = messages + result.messages
+        if isinstance(result, Err):
+            return Err(cause=result.cause, messages=messages)
+        values.append(result.value)
+    return Ok(value=values, messages=messages)
+
+
+def _per_call_ms(stmt, number: int = NUMBER) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e3
+
+
+def main() -> None:
+    print(f"{'results':>8} | {'hand-written (ms)':>17} | {'collect (ms)':>12} | {'speedup':>7}")
+    print("-" * 55)
+    for size in SIZES:
+        results = [Ok(value=i).with_info("loaded") for i in range(size)]
+        assert _hand_written(results) == collect(results)
+        manual = _per_call_ms(lambda: _hand_written(results))
+        collected = _per_call_ms(lambda: collect(results))
+        print(f"{size:>8} | {manual:>17.2f} | {collected:>12.2f} | {manual / collected:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
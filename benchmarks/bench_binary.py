@@ -0,0 +1,58 @@
+"""Benchmark the binary codec against JSON.
+
+Compares payload size, encoding time and decoding time of
+`resokerr.binary` with the JSON route (`to_json()` + `json.loads` +
+`result_from_dict`) for a few typical result shapes.
+
+The codec is pure Python: payloads are much smaller and results with
+repeated messages and codes encode and decode faster, but large values
+made only of plain data decode faster through the C JSON parser.
+
+Run with:
+    python -m benchmarks.bench_binary
+"""
+import json
+import timeit
+
+from resokerr import Ok, Err, result_from_dict
+from resokerr import binary
+
+
+def _cases():
+    rows = [{"id": i, "name": f"user {i}", "score": i * 0.5, "active": i % 2 == 0} for i in range(200)]
+    log = Ok(value=1)
+    for i in range(500):
+        log = log.with_info("batch processed", code="I_BATCH", details={"batch": i})
+    err = Err(cause={"status": 503}, metadata={"request_id": "abc", "attempts": 3})
+    for _ in range(50):
+        err = err.with_error("upstream timed out", code="E_TIMEOUT", details={"service": "billing"})
+    return [
+        ("small Ok", Ok(value=42).with_info("done")),
+        ("200-row value", Ok(value=rows, metadata={"page": 1})),
+        ("500-message log", log),
+        ("Err, repeated errors", err),
+    ]
+
+
+def _per_call_us(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'case':<22} | {'json B':>8} | {'binary B':>8} | {'enc json':>9} | {'enc bin':>8} | "
+          f"{'dec json':>9} | {'dec bin':>8}")
+    print("-" * 90)
+    for name, result in _cases():
+        text = result.to_json()
+        payload = binary.dumps(result)
+        number = 2_000 if len(text) < 1_000 else 100
+        encode_json = _per_call_us(result.to_json, number)
+        encode_binary = _per_call_us(lambda: binary.dumps(result), number)
+        decode_json = _per_call_us(lambda: result_from_dict(json.loads(text)), number)
+        decode_binary = _per_call_us(lambda: binary.loads(payload), number)
+        print(f"{name:<22} | {len(text):>8} | {len(payload):>8} | {encode_json:>7.1f}us | {encode_binary:>6.1f}us | "
+              f"{decode_json:>7.1f}us | {decode_binary:>6.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark deriving new results from validated ones.
+
+Compares `map` and `with_metadata` (which reuse the already-normalized
+message log and frozen metadata) against rebuilding the same instance
+through the public constructor, which re-runs `__post_init__`.
+
+Run with:
+    python -m benchmarks.bench_derive
+"""
+import timeit
+
+from resokerr import Ok, Err, MessageTrace
+
+SIZES = (0, 10, 100, 1_000)
+NUMBER = 2_000
+
+
+def _build(size: int):
+    messages = [MessageTrace.info(f"message {i}") for i in range(size)]
+    metadata = {f"key_{i}": i for i in range(size)}
+    return Ok(value=1, messages=messages, metadata=metadata), Err(cause="x", messages=messages, metadata=metadata)
+
+
+def _per_call_us(stmt, number: int = NUMBER) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'size':>6} | {'operation':<22} | {'constructor (us)':>16} | {'derived (us)':>12} | {'speedup':>7}")
+    print("-" * 76)
+    for size in SIZES:
+        ok, err = _build(size)
+        new_metadata = {"request_id": "abc"}
+        cases = [
+            ("Ok.map",
+             lambda: Ok(value=ok.value + 1, messages=ok.messages, metadata=ok.metadata),
+             lambda: ok.map(lambda v: v + 1)),
+            ("Err.map",
+             lambda: Err(cause=err.cause.upper(), messages=err.messages, metadata=err.metadata),
+             lambda: err.map(str.upper)),
+            ("Ok.with_metadata",
+             lambda: Ok(value=ok.value, messages=ok.messages, metadata=new_metadata),
+             lambda: ok.with_metadata(new_metadata)),
+            ("Ok.with_info",
+             lambda: Ok(value=ok.value, messages=ok.messages + (MessageTrace.info("x"),), metadata=ok.metadata),
+             lambda: ok.with_info("x")),
+        ]
+        for name, constructor, derived in cases:
+            baseline = _per_call_us(constructor)
+            fast = _per_call_us(derived)
+            print(f"{size:>6} | {name:<22} | {baseline:>16.2f} | {fast:>12.2f} | {baseline / fast:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
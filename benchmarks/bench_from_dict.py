@@ -0,0 +1,39 @@
+"""Benchmark loading serialized results back with from_dict().
+
+Compares the validating path (which rebuilds every message through the
+MessageTrace and Ok/Err constructors, including the severity conversion
+in `__post_init__`) against the trusted path for data known to come from
+`to_dict()`.
+
+Run with:
+    python -m benchmarks.bench_from_dict
+"""
+import timeit
+
+from resokerr import Ok, MessageTrace, result_from_dict
+
+SIZES = (0, 10, 100, 1_000, 10_000)
+
+
+def _serialized(size: int):
+    messages = [MessageTrace.info(f"message {i}", code="I001", details={"index": i}) for i in range(size)]
+    return Ok(value={"rows": size}, messages=messages, metadata={"source": "bench"}).to_dict()
+
+
+def _per_call_us(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'messages':>8} | {'validated (us)':>14} | {'trusted (us)':>12} | {'speedup':>7}")
+    print("-" * 52)
+    for size in SIZES:
+        data = _serialized(size)
+        number = max(10, 20_000 // max(size, 1))
+        validated = _per_call_us(lambda: result_from_dict(data), number)
+        trusted = _per_call_us(lambda: result_from_dict(data, trusted=True), number)
+        print(f"{size:>8} | {validated:>14.2f} | {trusted:>12.2f} | {validated / trusted:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
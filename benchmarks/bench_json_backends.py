@@ -0,0 +1,51 @@
+"""Benchmark the JSON backends on to_json() and NDJSON output.
+
+Encodes 20k small results (one NDJSON line each) and one large result
+holding 100k records with every installed backend.
+
+Run with:
+    python -m benchmarks.bench_json_backends
+"""
+import io
+import timeit
+
+from resokerr import Err, NDJSONWriter, Ok, set_json_backend
+
+RECORDS = 100_000
+LINES = 20_000
+
+
+def _small_results() -> list:
+    return [
+        Ok(value={"id": i, "name": f"item {i}", "score": i / 7}).with_info("loaded", code="I1")
+        if i % 10 else Err(cause=f"failure {i}").with_error("failed", details={"id": i})
+        for i in range(LINES)
+    ]
+
+
+def _write_ndjson(results: list) -> None:
+    with NDJSONWriter(io.BytesIO(), flush_interval=None) as writer:
+        writer.write_many(results)
+
+
+def _best_ms(stmt, number: int = 3) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e3
+
+
+def main() -> None:
+    large = Ok(value=[{"id": i, "name": f"record {i}", "tags": ["a", "b"]} for i in range(RECORDS)])
+    small = _small_results()
+    print(f"{'backend':>8} | {'large to_json (ms)':>18} | {'ndjson lines (ms)':>17}")
+    print("-" * 50)
+    for name in ("json", "orjson"):
+        try:
+            set_json_backend(name)
+        except ImportError:
+            print(f"{name:>8} | {'not installed':>18} |")
+            continue
+        print(f"{name:>8} | {_best_ms(large.to_json):>18.1f} | {_best_ms(lambda: _write_ndjson(small)):>17.1f}")
+    set_json_backend("json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark LazyResult against eager chains.
+
+Runs a chain of `map` and `with_info` calls eagerly, and recorded on a
+LazyResult then forced. Forcing builds one result at the end instead of
+one per step; recording alone (a branch that is never read) shows the
+cost of deferring.
+
+Run with:
+    python -m benchmarks.bench_lazy
+"""
+import timeit
+
+from resokerr import LazyResult, Ok
+
+LENGTHS = (5, 20, 100)
+NUMBER = 2_000
+
+
+def _eager(length: int):
+    result = Ok(value=0)
+    for _ in range(length):
+        result = result.map(_increment).with_info("step")
+    return result
+
+
+def _lazy(length: int):
+    result = LazyResult(Ok(value=0))
+    for _ in range(length):
+        result = result.map(_increment).with_info("step")
+    return result
+
+
+def _increment(value: int) -> int:
+    return value + 1
+
+
+def _per_call_us(stmt, number: int = NUMBER) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'steps':>6} | {'eager (us)':>10} | {'record only (us)':>16} | {'record + force (us)':>19}")
+    print("-" * 62)
+    for length in LENGTHS:
+        eager = _per_call_us(lambda: _eager(length))
+        recorded = _per_call_us(lambda: _lazy(length))
+        forced = _per_call_us(lambda: _lazy(length).force())
+        print(f"{length:>6} | {eager:>10.1f} | {recorded:>16.1f} | {forced:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark the memory footprint of MessageTrace instances.
+
+Reports the bytes allocated per trace (measured with tracemalloc) for the
+current slotted MessageTrace and for a replica of the previous layout: a
+frozen dataclass with a per-instance ``__dict__`` and ``details`` held as a
+MappingProxyType around a copied dict. Message strings are shared between
+both runs so only the trace layout itself is compared.
+
+Run with:
+    python -m benchmarks.bench_message_trace_memory
+"""
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Generic, Mapping, Optional, TypeVar
+
+from resokerr import MessageTrace, TraceSeverityLevel
+
+M = TypeVar('M')
+
+COUNT = 200_000
+
+
+@dataclass(frozen=True)
+class LegacyMessageTrace(Generic[M]):
+    """Replica of the MessageTrace layout before it was slotted."""
+    message: M
+    severity: TraceSeverityLevel
+    code: Optional[str] = None
+    details: Optional[Mapping[str, Any]] = None
+    stack_trace: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.details is not None and not isinstance(self.details, MappingProxyType):
+            object.__setattr__(self, 'details', MappingProxyType(dict(self.details)))
+
+
+def _bytes_per_trace(factory, messages, details) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    traces = [factory(message, detail) for message, detail in zip(messages, details)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del traces
+    return (after - before) / len(messages)
+
+
+def main() -> None:
+    messages = [f"record {i} reconciled" for i in range(COUNT)]
+    scenarios = {
+        "no details": [None] * COUNT,
+        "2 details": [{"row": i, "source": "ledger"} for i in range(COUNT)],
+        "5 details": [{"row": i, "source": "ledger", "batch": 7, "retry": False, "stage": "merge"}
+                      for i in range(COUNT)],
+    }
+    print(f"{'scenario':<12} | {'legacy (B/trace)':>16} | {'current (B/trace)':>17} | {'saved':>6}")
+    print("-" * 62)
+    for name, details in scenarios.items():
+        legacy = _bytes_per_trace(
+            lambda m, d: LegacyMessageTrace(m, TraceSeverityLevel.INFO, "CODE", d), messages, details)
+        current = _bytes_per_trace(
+            lambda m, d: MessageTrace(m, TraceSeverityLevel.INFO, "CODE", d), messages, details)
+        print(f"{name:<12} | {legacy:>16.1f} | {current:>17.1f} | {1 - current / legacy:>5.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark chaining fallible steps.
+
+Runs a chain of steps that each return a prebuilt Ok with one message,
+so only the cost of chaining is measured, merging the messages into the
+final result three ways: a hand-written loop that
+concatenates message tuples and rebuilds the result through the
+constructor (what a `match` block per step amounts to), chained
+`and_then` calls, and `pipeline()`.
+
+Run with:
+    python -m benchmarks.bench_pipeline
+"""
+import timeit
+
+from resokerr import Err, Ok, pipeline
+
+LENGTHS = (3, 10, 50)
+NUMBER = 2_000
+
+
+_STEP_RESULT = Ok(value=1).with_info("step done")
+
+
+def _step(n: int):
+    return _STEP_RESULT
+
+
+def _hand_written(steps, value):
+    messages = ()
+    result = Ok(value=value)
+    for step in steps:
+        result = step(value)
+        messages = messages + result.messages
+        if isinstance(result, Err):
+            return Err(cause=result.cause, messages=messages)
+        value = result.value
+    return Ok(value=value, messages=messages)
+
+
+def _and_then(steps, value):
+    result = Ok(value=value)
+    for step in steps:
+        result = result.and_then(step)
+    return result
+
+
+def _per_call_us(stmt, number: int = NUMBER) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'steps':>6} | {'hand-written (us)':>17} | {'and_then (us)':>13} | {'pipeline (us)':>13} | {'speedup':>7}")
+    print("-" * 70)
+    for length in LENGTHS:
+        steps = [_step] * length
+        composed = pipeline(*steps)
+        baseline = _per_call_us(lambda: _hand_written(steps, 0))
+        chained = _per_call_us(lambda: _and_then(steps, 0))
+        fused = _per_call_us(lambda: composed(0))
+        print(f"{length:>6} | {baseline:>17.1f} | {chained:>13.1f} | {fused:>13.1f} | {baseline / fused:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
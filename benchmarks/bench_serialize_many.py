@@ -0,0 +1,55 @@
+"""Benchmark serialize_many() scaling across worker processes.
+
+Serializes a batch of Ok/Err results with 1, 2, 4 and 8 workers and
+reports the speedup over in-process serialization (workers=1), for both
+`to_dict()` and `to_json()` output. Speedups are bounded by the number of
+CPU cores available, and by the cost of pickling results to the workers
+and output back.
+
+Run with:
+    python -m benchmarks.bench_serialize_many
+"""
+import os
+import time
+
+from resokerr import Ok, Err, serialize_many
+
+RESULTS = 200_000
+WORKERS = (1, 2, 4, 8)
+
+
+def _results():
+    results = []
+    for i in range(RESULTS):
+        if i % 10 == 0:
+            results.append(Err(cause=f"failure {i}", metadata={"row": i})
+                           .with_error("validation failed", code="E100", details={"field": "name", "row": i}))
+        else:
+            results.append(Ok(value={"id": i, "name": f"record {i}", "tags": ["a", "b"], "score": i / 3})
+                           .with_info("processed", details={"row": i}))
+    return results
+
+
+def _seconds(results, workers: int, output: str) -> float:
+    started = time.perf_counter()
+    for _ in serialize_many(results, workers=workers, chunk_size=2_000, output=output):
+        pass
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    results = _results()
+    print(f"{RESULTS} results, {os.cpu_count()} CPUs")
+    print(f"{'output':>6} | {'workers':>7} | {'seconds':>8} | {'results/s':>10} | {'speedup':>7}")
+    print("-" * 52)
+    for output in ("dict", "json"):
+        baseline = None
+        for workers in WORKERS:
+            seconds = min(_seconds(results, workers, output) for _ in range(2))
+            baseline = baseline or seconds
+            print(f"{output:>6} | {workers:>7} | {seconds:>8.2f} | {RESULTS / seconds:>10,.0f} | "
+                  f"{baseline / seconds:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark the per-class serializers compiled for record-like types.
+
+Serializes lists of 100k homogeneous records with the compiled plan of
+their class, and with the generic path used before plans existed (the
+profile walk over each record's fields, or the `_serialize_to_dict`
+trampoline for classes with a `to_dict()` method).
+
+Run with:
+    python -m benchmarks.bench_serializer_plans
+"""
+import timeit
+from dataclasses import dataclass
+from typing import Any, Dict, NamedTuple
+
+from resokerr import Ok, invalidate_serializer, serialization_profile
+from resokerr.core import TypeUtils, _ExpandingHandler, _type_serializers
+
+RECORDS = 100_000
+
+
+@dataclass
+class DataRecord:
+    id: int
+    name: str
+    score: float
+    active: bool
+
+
+class TupleRecord(NamedTuple):
+    id: int
+    name: str
+    score: float
+    active: bool
+
+
+class SlotRecord:
+    __slots__ = ("id", "name", "score", "active")
+
+    def __init__(self, id: int, name: str, score: float, active: bool) -> None:
+        self.id = id
+        self.name = name
+        self.score = score
+        self.active = active
+
+
+class ValueRecord:
+    def __init__(self, id: int, name: str) -> None:
+        self.id = id
+        self.name = name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "name": self.name}
+
+
+def _records(cls: type) -> list:
+    if cls is ValueRecord:
+        return [ValueRecord(i, f"record {i}") for i in range(RECORDS)]
+    return [cls(i, f"record {i}", i / 7, i % 2 == 0) for i in range(RECORDS)]
+
+
+def _use_generic_path(cls: type) -> None:
+    """Replace the cached serializer of `cls` with its uncompiled form."""
+    handler = TypeUtils._resolve_serializer(cls)
+    if type(handler) is _ExpandingHandler:
+        _type_serializers[cls] = _ExpandingHandler(handler.is_dict, handler.entries, handler.size)
+    else:
+        _type_serializers[cls] = TypeUtils._serialize_to_dict
+
+
+def _best_ms(stmt, number: int = 3) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e3
+
+
+def main() -> None:
+    print(f"{'record type':>12} | {'path':>9} | {'generic (ms)':>12} | {'compiled (ms)':>13} | {'speedup':>7}")
+    print("-" * 66)
+    with serialization_profile("dataclass", "namedtuple", "slots"):
+        for cls in (DataRecord, TupleRecord, SlotRecord, ValueRecord):
+            records = _records(cls)
+            result = Ok(value=records)
+            for path, stmt in (("serialize", lambda: TypeUtils.serialize(records)),
+                               ("to_json", result.to_json)):
+                _use_generic_path(cls)
+                generic = _best_ms(stmt)
+                invalidate_serializer(cls)
+                compiled = _best_ms(stmt)
+                print(f"{cls.__name__:>12} | {path:>9} | {generic:>12.1f} | {compiled:>13.1f} | "
+                      f"{generic / compiled:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,4 +5,38 @@ from .core import (
     ResultBase,
     MessageTrace,
     TraceSeverityLevel,
-)
\ No newline at end of file
+    register_serializer,
+    unregister_serializer,
+    invalidate_serializer,
+    register_deserializer,
+    unregister_deserializer,
+    enable_serialization_profile,
+    disable_serialization_profile,
+    serialization_profile,
+    SerializationOptions,
+    SerializationBudget,
+    configure_exception_serialization,
+    pipeline,
+    result_from_dict,
+    result_from_json,
+)
+from .aggregate import (
+    collect,
+    first_err,
+    partition,
+    sequence,
+)
+from .jsonio import (
+    JSONBackend,
+    get_json_backend,
+    register_json_backend,
+    set_json_backend,
+)
+from .lazy import LazyResult
+from .ndjson import (
+    NDJSONReport,
+    NDJSONWriter,
+    write_ndjson,
+    write_ndjson_async,
+)
+from .parallel import serialize_many
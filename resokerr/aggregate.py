@@ -0,0 +1,171 @@
+"""Aggregating many Ok/Err results into one outcome.
+
+`collect` and `sequence` turn an iterable of results into a single Ok
+holding the list of values, or an Err; `partition` splits it into Oks and
+Errs, and `first_err` finds the first Err. Each consumes the iterable
+once, so generators of any length can be passed.
+
+The message logs of the consumed results are gathered and their messages
+copied once into a single list when the outcome is built, rather than
+concatenated result by result; their metadata is merged into one dict
+that is frozen at the end.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .core import (
+    E,
+    Err,
+    M,
+    Ok,
+    V,
+    _MessageLog,
+    _result_from_parts,
+)
+
+
+def _not_a_result(item: Any) -> TypeError:
+    return TypeError(f"Expected Ok or Err items, not {type(item).__name__}")
+
+
+def _collect(results: Iterable[Union[Ok[Any, Any], Err[Any, Any]]],
+             short_circuit: bool) -> Union[Ok[List[Any], Any], Err[Any, Any]]:
+    values: Optional[List[Any]] = []
+    causes: List[Any] = []
+    logs: List[_MessageLog[Any]] = []
+    metadata: Optional[Dict[str, Any]] = None
+    for result in results:
+        kind = type(result)
+        if kind is Ok:
+            if values is not None:
+                values.append(result.value)
+        elif kind is Err:
+            causes.append(result.cause)
+            # The values are not part of an Err outcome: stop keeping them
+            values = None
+        else:
+            raise _not_a_result(result)
+        if len(result._message_log):
+            logs.append(result._message_log)
+        if result.metadata is not None:
+            if metadata is None:
+                metadata = {}
+            metadata.update(result.metadata)
+        if kind is Err and short_circuit:
+            break
+
+    frozen = MappingProxyType(metadata) if metadata is not None else None
+    message_log: _MessageLog[Any] = _MessageLog.concat(logs) if logs else _MessageLog()
+    if values is not None:
+        # No Err, so no ERROR message either
+        return Ok._from_normalized(values, message_log, frozen)
+    return _result_from_parts(False, causes[0] if short_circuit else causes, message_log, frozen)  # type: ignore[return-value]
+
+
+def collect(results: Iterable[Union[Ok[V, M], Err[E, M]]],
+            short_circuit: bool = False) -> Union[Ok[List[V], M], Err[Any, M]]:
+    """Combine results into an Ok of all values, or an Err.
+
+    If every result is an Ok, returns an Ok holding the list of their
+    values. Otherwise returns an Err: with `short_circuit`, iteration
+    stops at the first Err and its cause is the cause of the outcome;
+    without it, every result is consumed and the cause is the list of all
+    Err causes, in order. Values stop being kept once an Err is seen.
+
+    The outcome carries the messages of every consumed result, in order
+    (SUCCESS messages become INFO in an Err, as in the constructor), and
+    their metadata merged, later keys winning.
+
+    Args:
+        results: An iterable of Ok/Err instances, consumed once.
+        short_circuit: Stop at the first Err instead of consuming all results.
+
+    Returns:
+        ``Ok(value=[...])`` or an Err as described above. An empty iterable
+        gives ``Ok(value=[])``.
+
+    Raises:
+        TypeError: If an item is not an Ok or Err.
+
+    Example:
+        >>> outcome = collect(validate(row) for row in rows)
+        >>> if outcome.is_err():
+        ...     report(outcome.cause, outcome.error_messages)
+    """
+    return _collect(results, short_circuit)
+
+
+def sequence(results: Iterable[Union[Ok[V, M], Err[E, M]]]) -> Union[Ok[List[V], M], Err[E, M]]:
+    """Combine results into an Ok of all values, or the first Err.
+
+    Same as ``collect(results, short_circuit=True)``: nothing after the
+    first Err is consumed, and its cause is the cause of the outcome.
+
+    Args:
+        results: An iterable of Ok/Err instances.
+
+    Returns:
+        ``Ok(value=[...])``, or an Err with the cause of the first Err and
+        the messages of every result consumed up to it.
+
+    Raises:
+        TypeError: If an item is not an Ok or Err.
+    """
+    return _collect(results, True)
+
+
+def partition(results: Iterable[Union[Ok[V, M], Err[E, M]]]
+              ) -> Tuple[List[Ok[V, M]], List[Err[E, M]]]:
+    """Split results into a list of Oks and a list of Errs, keeping their order.
+
+    The instances are returned as-is, with their own messages and metadata.
+
+    Args:
+        results: An iterable of Ok/Err instances, consumed once.
+
+    Returns:
+        A tuple ``(oks, errs)``.
+
+    Raises:
+        TypeError: If an item is not an Ok or Err.
+    """
+    oks: List[Ok[V, M]] = []
+    errs: List[Err[E, M]] = []
+    add_ok = oks.append
+    add_err = errs.append
+    for result in results:
+        kind = type(result)
+        if kind is Ok:
+            add_ok(result)  # type: ignore[arg-type]
+        elif kind is Err:
+            add_err(result)  # type: ignore[arg-type]
+        else:
+            raise _not_a_result(result)
+    return oks, errs
+
+
+def first_err(results: Iterable[Union[Ok[V, M], Err[E, M]]]) -> Optional[Err[E, M]]:
+    """Return the first Err, or None if every result is an Ok.
+
+    Nothing after the first Err is consumed.
+
+    Raises:
+        TypeError: If an item is not an Ok or Err.
+    """
+    for result in results:
+        kind = type(result)
+        if kind is Err:
+            return result  # type: ignore[return-value]
+        if kind is not Ok:
+            raise _not_a_result(result)
+    return None
+
+
+__all__ = [
+    "collect",
+    "first_err",
+    "partition",
+    "sequence",
+]
@@ -0,0 +1,592 @@
+"""Compact binary codec for Ok, Err and MessageTrace.
+
+Meant for passing results between processes and for local caches, where
+the JSON text of `to_dict()` is needlessly large and slow to parse. Only
+the standard library is used.
+
+Layout of a payload (all integers are unsigned LEB128 varints unless
+noted otherwise)::
+
+    b"RK" version:u8 body_length:u32-le
+    string_count  (length utf8-bytes) * string_count
+    kind:u8       object
+
+Every string (message texts, codes, dict keys and string values) is
+stored once in the string table and referenced by index. Values are
+tagged, and each message trace stores its severity as a single byte
+followed by a bitmask of the optional fields it carries.
+
+Values, causes, messages and metadata are encoded the way
+`TypeUtils.serialize` would convert them, so loading returns the same
+data that `from_dict()` would on the parsed JSON output (tuples come back
+as lists and custom objects in their serialized form), except that
+non-string dict keys keep their type as they do in `to_dict()`.
+
+Like pickle protocol 5, `dumps()` accepts a `buffer_callback`: bytes,
+bytearray, memoryview and array.array values are then handed to it as
+`pickle.PickleBuffer` objects instead of being serialized, and the payload
+only records their position. `loads()` takes the same buffers back in
+order and returns memoryviews over them, so large binary values cross
+process boundaries or shared memory without being copied.
+"""
+from __future__ import annotations
+
+import pickle
+import struct
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from .core import (
+    Err,
+    MessageTrace,
+    Ok,
+    TraceSeverityLevel,
+    TypeUtils,
+    _BUFFER_TYPES,
+    _ExpandingHandler,
+    _MessageLog,
+    _PRIMITIVE_TYPES,
+    _container_entries,
+    _SEVERITIES,
+    _SEVERITY_CODES,
+    _buffer_layout,
+    _cast_view,
+    _get_trace_packed_details,
+    _set_trace_code,
+    _set_trace_message,
+    _set_trace_packed_details,
+    _set_trace_severity,
+    _set_trace_stack_trace,
+    _type_serializers,
+)
+
+FORMAT_VERSION = 1
+
+_MAGIC = b'RK'
+# Magic, format version and body length; the length is 64-bit so that
+# payloads holding large in-band buffers (over 4 GiB) can be framed.
+_HEADER = struct.Struct('<2sBQ')
+_FLOAT = struct.Struct('<d')
+
+# Top-level object kinds
+_KIND_OK = 0
+_KIND_ERR = 1
+_KIND_TRACE = 2
+
+# Value tags
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3        # zigzag varint
+_TAG_FLOAT = 4      # 8-byte little-endian double
+_TAG_STR = 5        # string table index
+_TAG_LIST = 6       # count, items
+_TAG_DICT = 7       # count, (key, value) pairs
+_TAG_BUFFER = 8     # out-of-band buffer: ndim, then format index and shape if ndim > 0
+
+# Optional MessageTrace fields present in a trace record
+_HAS_CODE = 1
+_HAS_DETAILS = 2
+_HAS_STACK_TRACE = 4
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class _Encoder:
+    """Encodes one payload: a body buffer plus its string table."""
+
+    __slots__ = ('body', 'strings', 'buffer_callback')
+
+    def __init__(self, buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None) -> None:
+        self.body = bytearray()
+        self.strings: Dict[str, int] = {}
+        self.buffer_callback = buffer_callback
+
+    def uvarint(self, n: int) -> None:
+        body = self.body
+        while n >= 0x80:
+            body.append((n & 0x7F) | 0x80)
+            n >>= 7
+        body.append(n)
+
+    def string(self, text: str) -> None:
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        self.uvarint(index)
+
+    def value(self, obj: Any) -> None:
+        """Encode `obj` as ``TypeUtils.serialize(obj)`` would represent it."""
+        cls = type(obj)
+        body = self.body
+        if cls is str:
+            body.append(_TAG_STR)
+            self.string(obj)
+            return
+        if obj is None:
+            body.append(_TAG_NONE)
+            return
+        if cls in _BUFFER_TYPES and self.buffer_callback is not None:
+            self.buffer(obj)
+            return
+
+        handler = _type_serializers.get(cls)
+        if handler is None:
+            handler = TypeUtils._resolve_serializer(cls)
+
+        if handler is TypeUtils._serialize_primitive:
+            if isinstance(obj, bool):
+                body.append(_TAG_TRUE if obj else _TAG_FALSE)
+            elif isinstance(obj, int):
+                body.append(_TAG_INT)
+                n = int(obj)
+                self.uvarint((n << 1) if n >= 0 else ((-n << 1) - 1))
+            elif isinstance(obj, float):
+                body.append(_TAG_FLOAT)
+                body += _FLOAT.pack(obj)
+            else:
+                # str subclasses (including str-based Enums) keep their content
+                body.append(_TAG_STR)
+                self.string(str.__str__(obj))
+        elif handler is TypeUtils._serialize_dict:
+            self.nested(id(obj), iter(obj.items()), True, len(obj))
+        elif handler is TypeUtils._serialize_sequence:
+            self.nested(id(obj), iter(obj), False, len(obj))
+        elif type(handler) is _ExpandingHandler:
+            entries, is_dict, size = _container_entries(handler, obj)  # type: ignore[misc]
+            self.nested(id(obj), entries, is_dict, size)
+        else:
+            # Handler output (to_dict(), exceptions, str fallback, custom
+            # handlers) is already made of JSON-compatible values.
+            self.value(handler(obj))
+
+    def buffer(self, obj: Any) -> None:
+        """Hand a bytes-like value to the buffer callback and record its layout."""
+        buffer, layout = _buffer_layout(obj)
+        self.body.append(_TAG_BUFFER)
+        if layout is None:
+            self.body.append(0)
+        else:
+            format, shape = layout
+            self.uvarint(len(shape))
+            self.string(format)
+            for dim in shape:
+                self.uvarint(dim)
+        self.buffer_callback(pickle.PickleBuffer(buffer))  # type: ignore[misc]
+
+    def dict_items(self, items: Any, count: int) -> None:
+        self.nested(0, iter(items), True, count)
+
+    def nested(self, source_id: int, entries: Any, is_dict: bool, count: int) -> None:
+        """Encode nested containers with an explicit stack.
+
+        Like `TypeUtils.serialize`, a container met again inside itself is
+        encoded as `TypeUtils.CYCLE_MARKER`.
+        """
+        body = self.body
+        value = self.value
+        key = self.key
+        primitives = _PRIMITIVE_TYPES
+        active = {source_id}
+        body.append(_TAG_DICT if is_dict else _TAG_LIST)
+        self.uvarint(count)
+        stack = [(source_id, entries, is_dict)]
+        while stack:
+            source_id, entries, is_dict = stack[-1]
+            for entry in entries:
+                if is_dict:
+                    child_key, child = entry
+                    key(child_key)
+                else:
+                    child = entry
+                cls = type(child)
+                if cls in primitives:
+                    value(child)
+                    continue
+                handler = _type_serializers.get(cls) or TypeUtils._resolve_serializer(cls)
+                container = _container_entries(handler, child)
+                if container is None:
+                    value(child)
+                    continue
+                child_id = id(child)
+                if child_id in active:
+                    value(TypeUtils.CYCLE_MARKER)
+                    continue
+                child_entries, child_is_dict, child_size = container
+                body.append(_TAG_DICT if child_is_dict else _TAG_LIST)
+                self.uvarint(child_size)
+                active.add(child_id)
+                stack.append((child_id, child_entries, child_is_dict))
+                break
+            else:
+                stack.pop()
+                active.discard(source_id)
+
+    def key(self, key: Any) -> None:
+        if key is None or isinstance(key, (str, int, float)):
+            self.value(key)
+        else:
+            raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
+
+    def trace(self, trace: MessageTrace[Any]) -> None:
+        code = trace.code
+        packed = _get_trace_packed_details(trace)
+        stack_trace = trace.stack_trace
+        flags = 0
+        if code is not None:
+            flags |= _HAS_CODE
+        if packed is not None:
+            flags |= _HAS_DETAILS
+        if stack_trace is not None:
+            flags |= _HAS_STACK_TRACE
+
+        body = self.body
+        body.append(_SEVERITY_CODES[trace.severity])
+        body.append(flags)
+        self.value(trace.message)
+        if code is not None:
+            self.string(code)
+        if packed is not None:
+            items = iter(packed)
+            self.dict_items(zip(items, items), len(packed) // 2)
+        if stack_trace is not None:
+            self.string(stack_trace)
+
+    def result(self, payload: Any, messages: Any, metadata: Any) -> None:
+        self.value(payload)
+        self.uvarint(len(messages))
+        trace = self.trace
+        for message in messages:
+            trace(message)
+        if metadata is None:
+            self.body.append(_TAG_NONE)
+        else:
+            self.dict_items(metadata.items(), len(metadata))
+
+    def finish(self) -> bytes:
+        table = _Encoder()
+        table.uvarint(len(self.strings))
+        for text in self.strings:
+            encoded = text.encode('utf-8')
+            table.uvarint(len(encoded))
+            table.body += encoded
+        length = len(table.body) + len(self.body)
+        return b''.join((_HEADER.pack(_MAGIC, FORMAT_VERSION, length), table.body, self.body))
+
+
+class _Decoder:
+    """Decodes one payload from a memoryview without copying it."""
+
+    __slots__ = ('view', 'pos', 'strings', 'buffers')
+
+    def __init__(self, view: memoryview, pos: int, buffers: Optional[Iterator[Any]] = None) -> None:
+        self.view = view
+        self.pos = pos
+        self.strings: List[str] = []
+        self.buffers = buffers
+
+    def uvarint(self) -> int:
+        view = self.view
+        pos = self.pos
+        byte = view[pos]
+        pos += 1
+        if byte < 0x80:
+            self.pos = pos
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = view[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self.pos = pos
+                return result
+            shift += 7
+
+    def string_table(self) -> None:
+        view = self.view
+        strings = self.strings
+        for _ in range(self.uvarint()):
+            length = self.uvarint()
+            start = self.pos
+            end = self.pos = start + length
+            if end > len(view):
+                raise IndexError(end)
+            strings.append(str(view[start:end], 'utf-8'))
+
+    def value(self) -> Any:
+        view = self.view
+        pos = self.pos
+        tag = view[pos]
+        if tag == _TAG_STR:
+            index = view[pos + 1]
+            if index < 0x80:
+                # Single-byte index: the common case, decoded inline
+                self.pos = pos + 2
+                return self.strings[index]
+            self.pos = pos + 1
+            return self.strings[self.uvarint()]
+        if tag == _TAG_INT:
+            n = view[pos + 1]
+            if n < 0x80:
+                self.pos = pos + 2
+            else:
+                self.pos = pos + 1
+                n = self.uvarint()
+            return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+        self.pos = pos + 1
+        if tag == _TAG_DICT or tag == _TAG_LIST:
+            return self.nested(tag == _TAG_DICT)
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_FLOAT:
+            pos = self.pos
+            self.pos = pos + 8
+            return _FLOAT.unpack_from(self.view, pos)[0]
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_BUFFER:
+            return self.buffer()
+        raise ValueError(f"Unknown value tag: {tag}")
+
+    def buffer(self) -> memoryview:
+        ndim = self.uvarint()
+        layout = None
+        if ndim:
+            format = self.strings[self.uvarint()]
+            layout = (format, tuple([self.uvarint() for _ in range(ndim)]))
+        if self.buffers is None:
+            raise ValueError("Payload refers to out-of-band buffers: pass them with buffers=")
+        buffer = next(self.buffers, None)
+        if buffer is None:
+            raise ValueError("Not enough out-of-band buffers for the payload")
+        return _cast_view(buffer, layout)
+
+    def nested(self, is_dict: bool) -> Any:
+        """Decode nested containers with an explicit stack."""
+        view = self.view
+        value = self.value
+        root: Any = {} if is_dict else []
+        # Frames: [container, entries left, is_dict]
+        stack = [[root, self.uvarint(), is_dict]]
+        while stack:
+            frame = stack[-1]
+            container, remaining, is_dict = frame
+            while remaining:
+                remaining -= 1
+                if is_dict:
+                    key = value()
+                tag = view[self.pos]
+                if tag == _TAG_DICT or tag == _TAG_LIST:
+                    self.pos += 1
+                    child: Any = {} if tag == _TAG_DICT else []
+                    if is_dict:
+                        container[key] = child
+                    else:
+                        container.append(child)
+                    frame[1] = remaining
+                    stack.append([child, self.uvarint(), tag == _TAG_DICT])
+                    break
+                if is_dict:
+                    container[key] = value()
+                else:
+                    container.append(value())
+            else:
+                stack.pop()
+        return root
+
+    def trace(self, message_type: Optional[type]) -> MessageTrace[Any]:
+        view = self.view
+        pos = self.pos
+        severity = _SEVERITIES[view[pos]]
+        flags = view[pos + 1]
+        self.pos = pos + 2
+
+        trace = object.__new__(MessageTrace)
+        message = self.value()
+        _set_trace_message(trace, message if message_type is None else TypeUtils.deserialize(message, message_type))
+        _set_trace_severity(trace, severity)
+        _set_trace_code(trace, self.strings[self.uvarint()] if flags & _HAS_CODE else None)
+        packed = None
+        if flags & _HAS_DETAILS:
+            if view[self.pos] != _TAG_DICT:
+                raise ValueError("Message details must be a dict")
+            self.pos += 1
+            value = self.value
+            packed = tuple([value() for _ in range(2 * self.uvarint())])
+        _set_trace_packed_details(trace, packed)
+        _set_trace_stack_trace(trace, self.strings[self.uvarint()] if flags & _HAS_STACK_TRACE else None)
+        return trace
+
+    def result(self, kind: int, payload_type: Optional[type],
+               message_type: Optional[type]) -> Union[Ok[Any, Any], Err[Any, Any]]:
+        payload = TypeUtils.deserialize(self.value(), payload_type)
+        trace = self.trace
+        messages = tuple([trace(message_type) for _ in range(self.uvarint())])
+        metadata = self.value()
+        if metadata is not None and not isinstance(metadata, dict):
+            raise ValueError("Metadata must be a dict")
+
+        log = _MessageLog(messages)
+        if kind == _KIND_OK:
+            if log.has_severity(TraceSeverityLevel.ERROR):
+                # Not produced by dumps(): let the constructor convert them
+                return Ok(value=payload, messages=messages, metadata=metadata)
+            return Ok._from_normalized(payload, log, _freeze(metadata))
+        if log.has_severity(TraceSeverityLevel.SUCCESS):
+            return Err(cause=payload, messages=messages, metadata=metadata)
+        return Err._from_normalized(payload, log, _freeze(metadata))
+
+
+def _freeze(metadata: Optional[Dict[str, Any]]) -> Any:
+    return None if metadata is None else MappingProxyType(metadata)
+
+
+def dumps(obj: Union[Ok[Any, Any], Err[Any, Any], MessageTrace[Any]],
+          buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None) -> bytes:
+    """Encode a result or message trace to bytes.
+
+    Args:
+        obj: The Ok, Err or MessageTrace instance to encode.
+        buffer_callback: Optional callable receiving every bytes, bytearray,
+                         memoryview and array.array value, in order, as a
+                         `pickle.PickleBuffer` over its memory. Those values
+                         are left out of the payload and must be passed to
+                         `loads(..., buffers=...)`.
+
+    Returns:
+        A self-contained, length-prefixed payload.
+
+    Raises:
+        TypeError: If `obj` is not a result or trace, or a dict key is not
+                   a str, int, float, bool or None.
+    """
+    encoder = _Encoder(buffer_callback)
+    if isinstance(obj, Ok):
+        encoder.body.append(_KIND_OK)
+        encoder.result(obj.value, obj.messages, obj.metadata)
+    elif isinstance(obj, Err):
+        encoder.body.append(_KIND_ERR)
+        encoder.result(obj.cause, obj.messages, obj.metadata)
+    elif isinstance(obj, MessageTrace):
+        encoder.body.append(_KIND_TRACE)
+        encoder.trace(obj)
+    else:
+        raise TypeError(f"Cannot encode {type(obj).__name__}: expected Ok, Err or MessageTrace")
+    return encoder.finish()
+
+
+def payload_length(data: BytesLike) -> int:
+    """Return the total size of the payload starting at the beginning of `data`.
+
+    Useful to split consecutive payloads read from a pipe or a file.
+
+    Raises:
+        ValueError: If `data` does not start with a valid header.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Truncated resokerr binary header")
+    magic, version, length = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("Not a resokerr binary payload")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported resokerr binary format version: {version}")
+    return _HEADER.size + length
+
+
+def loads(data: BytesLike,
+          value_type: Optional[type] = None,
+          cause_type: Optional[type] = None,
+          message_type: Optional[type] = None,
+          buffers: Optional[Iterable[Any]] = None) -> Union[Ok[Any, Any], Err[Any, Any], MessageTrace[Any]]:
+    """Decode a payload produced by `dumps()`.
+
+    `data` may be any bytes-like object. It is read through a memoryview,
+    so passing a memoryview over a larger shared buffer (e.g. an mmap or
+    a multiprocessing.shared_memory block) does not copy it; only the
+    decoded strings are allocated. Trailing bytes after the payload are
+    ignored.
+
+    Args:
+        data: The encoded payload.
+        value_type: Optional type to rebuild an Ok value with (see
+                    `TypeUtils.deserialize`).
+        cause_type: Optional type to rebuild an Err cause with.
+        message_type: Optional type to rebuild each message with.
+        buffers: The buffers collected by the `buffer_callback` of
+                 `dumps()`, in the same order. Each one is returned as a
+                 memoryview over its memory (shared memory blocks, mmaps
+                 and PickleBuffers included), cast to the original format.
+
+    Returns:
+        The decoded Ok, Err or MessageTrace.
+
+    Raises:
+        ValueError: If `data` is not a valid payload, or it refers to
+                    out-of-band buffers that were not provided.
+    """
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    end = payload_length(view)
+    if len(view) < end:
+        raise ValueError("Truncated resokerr binary payload")
+
+    decoder = _Decoder(view[:end], _HEADER.size, None if buffers is None else iter(buffers))
+    try:
+        decoder.string_table()
+        kind = view[decoder.pos]
+        decoder.pos += 1
+        if kind == _KIND_TRACE:
+            obj: Any = decoder.trace(message_type)
+        elif kind == _KIND_OK:
+            obj = decoder.result(kind, value_type, message_type)
+        elif kind == _KIND_ERR:
+            obj = decoder.result(kind, cause_type, message_type)
+        else:
+            raise ValueError(f"Unknown object kind: {kind}")
+    except (IndexError, TypeError, struct.error, UnicodeDecodeError) as exc:
+        raise ValueError("Corrupted resokerr binary payload") from exc
+    if decoder.pos != end:
+        raise ValueError("Corrupted resokerr binary payload")
+    return obj
+
+
+def dump(obj: Union[Ok[Any, Any], Err[Any, Any], MessageTrace[Any]], fp: BinaryIO,
+         buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None) -> None:
+    """Write the binary encoding of `obj` to a binary stream."""
+    fp.write(dumps(obj, buffer_callback))
+
+
+def load(fp: BinaryIO,
+         value_type: Optional[type] = None,
+         cause_type: Optional[type] = None,
+         message_type: Optional[type] = None,
+         buffers: Optional[Iterable[Any]] = None) -> Union[Ok[Any, Any], Err[Any, Any], MessageTrace[Any]]:
+    """Read exactly one payload written by `dump()` from a binary stream.
+
+    Raises:
+        EOFError: If the stream ends before a complete payload.
+        ValueError: If the payload is invalid.
+    """
+    header = fp.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise EOFError("No resokerr binary payload to read")
+    rest = payload_length(header) - _HEADER.size
+    body = fp.read(rest)
+    if len(body) < rest:
+        raise EOFError("Truncated resokerr binary payload")
+    return loads(header + body, value_type, cause_type, message_type, buffers)
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "dump",
+    "dumps",
+    "load",
+    "loads",
+    "payload_length",
+]
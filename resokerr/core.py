@@ -1,13 +1,24 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+import array
+import binascii
+import inspect
+import keyword
+import pickle
+import sys
+from contextlib import contextmanager
+from dataclasses import InitVar, dataclass, field, fields, is_dataclass
 from enum import Enum
-from types import MappingProxyType
+from itertools import chain, islice
+from types import FunctionType, MappingProxyType, TracebackType
 from typing import (
     Any,
     Callable,
     Dict,
     final,
     Generic,
+    IO,
+    Iterable,
+    Iterator,
     Literal,
     Mapping,
     Optional,
@@ -35,21 +46,37 @@ class TraceSeverityLevel(Enum):
     WARNING = "warning"
     ERROR = "error"
 
-@dataclass(frozen=True)
+# Bit assigned to each severity in a message log's severity mask
+_SEVERITY_BITS: Dict[TraceSeverityLevel, int] = {
+    level: 1 << index for index, level in enumerate(TraceSeverityLevel)
+}
+
+# Severity for each serialized value, avoiding the Enum lookup machinery
+_SEVERITY_BY_VALUE: Dict[str, TraceSeverityLevel] = {
+    level.value: level for level in TraceSeverityLevel
+}
+
+# Severities in declaration order; compact encodings store the index
+_SEVERITIES: Tuple[TraceSeverityLevel, ...] = tuple(TraceSeverityLevel)
+_SEVERITY_CODES: Dict[TraceSeverityLevel, int] = {
+    level: index for index, level in enumerate(_SEVERITIES)
+}
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class MessageTrace(Generic[M]):
-    """Immutable message trace with severity tracking and generic message types."""
+    """Immutable message trace with severity tracking and generic message types.
+
+    Instances are slotted and keep `details` packed as a flat
+    ``(key, value, key, value, ...)`` tuple; the `details` attribute returns
+    a read-only MappingProxyType view built from it on first access and
+    cached in its place.
+    """
     message: M
     severity: TraceSeverityLevel
     code: Optional[str] = None
     details: Optional[Mapping[str, Any]] = None
     stack_trace: Optional[str] = None
     
-    def __post_init__(self) -> None:
-        """Ensure details are immutable by converting to MappingProxyType."""
-        if self.details is not None and not isinstance(self.details, MappingProxyType):
-            # Create a copy to prevent external modifications
-            object.__setattr__(self, 'details', MappingProxyType(dict(self.details)))
-    
     @classmethod
     def success(cls, message: M, code: Optional[str] = None,
                 details: Optional[Mapping[str, Any]] = None,
@@ -78,12 +105,18 @@ class MessageTrace(Generic[M]):
         """Factory method for error messages."""
         return cls(message=message, severity=TraceSeverityLevel.ERROR, code=code, details=details, stack_trace=stack_trace)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, options: Optional[SerializationOptions] = None,
+                budget: Optional[SerializationBudget] = None) -> Dict[str, Any]:
         """Serialize MessageTrace to a dictionary.
         
         Creates a serializable dictionary representation of the
         MessageTrace instance. Optional fields (code, details, stack_trace)
         are only included if they have non-None values.
+
+        Args:
+            options: Optional `SerializationOptions` selecting the fields
+                     and keys to emit.
+            budget: Optional `SerializationBudget` bounding the output size.
         
         Returns:
             A dictionary with the following structure:
@@ -100,6 +133,11 @@ class MessageTrace(Generic[M]):
             >>> msg.to_dict()
             {'message': 'Operation completed', 'severity': 'info', 'code': 'OP_001'}
         """
+        if budget is not None:
+            return (options or _DEFAULT_OPTIONS)._message_to_dict(self, _BudgetWalk(budget))
+        if options is not None:
+            return options._message_to_dict(self)
+
         result: Dict[str, Any] = {
             "message": TypeUtils.serialize(self.message),
             "severity": self.severity.value,
@@ -108,14 +146,274 @@ class MessageTrace(Generic[M]):
         # Only include optional fields if they have values
         if self.code is not None:
             result["code"] = self.code
-        if self.details is not None:
+        packed = _get_trace_packed_details(self)
+        if packed is not None:
             # Recursively serialize details values (they may contain complex objects)
-            result["details"] = TypeUtils.serialize(dict(self.details))
+            result["details"] = TypeUtils.serialize(dict(zip(packed[::2], packed[1::2])))
         if self.stack_trace is not None:
             result["stack_trace"] = self.stack_trace
 
         return result
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any],
+                  message_type: Optional[type] = None) -> MessageTrace[Any]:
+        """Rebuild a MessageTrace from the output of `to_dict()`.
+
+        Args:
+            data: A dictionary as produced by `to_dict()`.
+            message_type: Optional type to rebuild the message with (see
+                          `TypeUtils.deserialize`). Messages are kept as-is
+                          when omitted.
+
+        Returns:
+            A new MessageTrace instance.
+
+        Raises:
+            KeyError: If `message` or `severity` is missing.
+            ValueError: If `severity` is not a known severity value.
+
+        Example:
+            >>> MessageTrace.from_dict({'message': 'done', 'severity': 'info'})
+            MessageTrace(message='done', severity=<TraceSeverityLevel.INFO: 'info'>, ...)
+        """
+        severity = _SEVERITY_BY_VALUE.get(data["severity"])
+        if severity is None:
+            raise ValueError(f"Unknown severity: {data['severity']!r}")
+        return cls(
+            message=TypeUtils.deserialize(data["message"], message_type),
+            severity=severity,
+            code=data.get("code"),
+            details=data.get("details"),
+            stack_trace=data.get("stack_trace"),
+        )
+
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the raw fields: the severity as its index, details packed,
+        and trailing unset fields left out."""
+        state = (self.message, _SEVERITY_CODES[self.severity], self.code,
+                 _get_trace_packed_details(self), self.stack_trace)
+        end = len(state)
+        while end > 2 and state[end - 1] is None:
+            end -= 1
+        return (_unpickle_trace, state[:end])
+
+
+class _PackedDetails:
+    """Data descriptor storing `MessageTrace.details` as a flat tuple in its slot.
+
+    Packing the items into one tuple avoids keeping a dict plus a
+    MappingProxyType wrapper alive for every trace. Assigning a mapping
+    (done once by the dataclass `__init__`) copies its items, so later
+    changes to the original mapping are not visible through the trace.
+
+    The read-only view is built on the first read of `trace.details` and
+    then replaces the tuple in the slot, so later reads return the same
+    object at no cost. Serialization, pickling and the binary codec read
+    the items with `_get_trace_packed_details`, without building it.
+    """
+
+    __slots__ = ('_slot',)
+
+    def __init__(self, slot: Any) -> None:
+        self._slot = slot
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        details = self._slot.__get__(obj, objtype)
+        if type(details) is tuple:
+            items = iter(details)
+            details = MappingProxyType(dict(zip(items, items)))
+            self._slot.__set__(obj, details)
+        return details
+
+    def __set__(self, obj: Any, details: Optional[Mapping[str, Any]]) -> None:
+        packed = None
+        if details is not None:
+            packed = tuple(chain.from_iterable(details.items()))
+        self._slot.__set__(obj, packed)
+
+
+MessageTrace.details = _PackedDetails(MessageTrace.__dict__['details'])  # type: ignore[assignment]
+
+# Raw slot setters, used to rebuild traces from trusted serialized data
+_set_trace_message = MessageTrace.__dict__['message'].__set__
+_set_trace_severity = MessageTrace.__dict__['severity'].__set__
+_set_trace_code = MessageTrace.__dict__['code'].__set__
+_set_trace_packed_details = MessageTrace.__dict__['details']._slot.__set__
+_set_trace_stack_trace = MessageTrace.__dict__['stack_trace'].__set__
+_get_trace_details_slot = MessageTrace.__dict__['details']._slot.__get__
+
+
+def _get_trace_packed_details(trace: MessageTrace[Any]) -> Optional[Tuple[Any, ...]]:
+    """Return the details of `trace` as a flat ``(key, value, ...)`` tuple, or None."""
+    details = _get_trace_details_slot(trace)
+    if details is None or type(details) is tuple:
+        return details
+    # The view was already built by a read of `trace.details`
+    return tuple(chain.from_iterable(details.items()))
+
+
+def _unpickle_trace(message: Any, severity: int, code: Optional[str] = None,
+                    packed_details: Optional[Tuple[Any, ...]] = None,
+                    stack_trace: Optional[str] = None) -> MessageTrace[Any]:
+    """Rebuild a MessageTrace from the state produced by `MessageTrace.__reduce__`."""
+    trace = object.__new__(MessageTrace)
+    _set_trace_message(trace, message)
+    _set_trace_severity(trace, _SEVERITIES[severity])
+    _set_trace_code(trace, code)
+    _set_trace_packed_details(trace, packed_details)
+    _set_trace_stack_trace(trace, stack_trace)
+    return trace
+
+
+def _trace_from_trusted_dict(data: Mapping[str, Any],
+                             message_type: Optional[type] = None) -> MessageTrace[Any]:
+    """Rebuild a MessageTrace from `to_dict()` output without going through `__init__`.
+
+    Fills the slots directly, which roughly halves the cost per trace when
+    loading large logs. The caller guarantees `data` is well-formed.
+    """
+    trace = object.__new__(MessageTrace)
+    message = data["message"]
+    _set_trace_message(trace, message if message_type is None else TypeUtils.deserialize(message, message_type))
+    _set_trace_severity(trace, _SEVERITY_BY_VALUE[data["severity"]])
+    get = data.get
+    _set_trace_code(trace, get("code"))
+    details = get("details")
+    _set_trace_packed_details(trace, None if details is None else tuple(chain.from_iterable(details.items())))
+    _set_trace_stack_trace(trace, get("stack_trace"))
+    return trace
+
+
+class _MessageLog(Generic[M]):
+    """Persistent, append-only log of message traces.
+
+    Logs derived through `append` share one backing list: each version sees
+    only the first `_length` items, and items inside that prefix are never
+    mutated. Appending to the newest version claims the next free slot of
+    the shared list (O(1) amortized); appending to an older version whose
+    next slot was already claimed copies its prefix first. Every version
+    therefore stays valid and immutable from the outside.
+
+    The tuple view is materialized lazily and cached, so repeated reads of
+    `messages` on a result do not copy again.
+
+    Each version also carries a severity index: a bitmask of the severities
+    present (built once, updated in O(1) per append) and a cache of
+    per-severity tuples filled on first access.
+    """
+
+    __slots__ = ('_items', '_length', '_tuple', '_mask', '_views')
+
+    def __init__(self, messages: Tuple[MessageTrace[M], ...] = ()) -> None:
+        self._items: Optional[list[MessageTrace[M]]] = None
+        self._length: int = len(messages)
+        self._tuple: Optional[Tuple[MessageTrace[M], ...]] = messages
+        mask = 0
+        for message in messages:
+            mask |= _SEVERITY_BITS[message.severity]
+        self._mask: int = mask
+        self._views: Optional[Dict[TraceSeverityLevel, Tuple[MessageTrace[M], ...]]] = None
+
+    @classmethod
+    def _shared(cls, items: list[MessageTrace[M]], length: int, mask: int) -> _MessageLog[M]:
+        """Create a version viewing the first `length` items of a shared list."""
+        log = cls.__new__(cls)
+        log._items = items
+        log._length = length
+        log._tuple = None
+        log._mask = mask
+        log._views = None
+        return log
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, message: MessageTrace[M]) -> _MessageLog[M]:
+        """Return a new version of the log with `message` appended."""
+        items = self._items
+        if items is None:
+            items = self._items = list(self._tuple or ())
+        length = self._length
+        mask = self._mask | _SEVERITY_BITS[message.severity]
+        if len(items) == length:
+            # list.append is atomic, so whoever finds its message at index
+            # `length` owns that slot, even if two threads raced for it.
+            items.append(message)
+            if items[length] is message:
+                return _MessageLog._shared(items, length + 1, mask)
+        # The next slot belongs to another version: branch off a copy.
+        items = items[:length]
+        items.append(message)
+        return _MessageLog._shared(items, length + 1, mask)
+
+    def extend(self, other: _MessageLog[M]) -> _MessageLog[M]:
+        """Return a new version of the log with the messages of `other` appended.
+
+        Same sharing rules as `append`, so merging the logs of a chain of
+        results grows one backing list instead of concatenating tuples.
+        """
+        count = other._length
+        if count <= 1:
+            if not count:
+                return self
+            return self.append(other._tuple[0] if other._tuple is not None else other._items[0])  # type: ignore[index]
+        messages = other._tuple if other._tuple is not None else other._items[:count]  # type: ignore[index]
+        items = self._items
+        if items is None:
+            items = self._items = list(self._tuple or ())
+        length = self._length
+        mask = self._mask | other._mask
+        if len(items) == length:
+            items.extend(messages)
+            # Another version may have extended the list first
+            if items[length:length + count] == list(messages):
+                return _MessageLog._shared(items, length + count, mask)
+        items = items[:length]
+        items.extend(messages)
+        return _MessageLog._shared(items, length + count, mask)
+
+    @classmethod
+    def concat(cls, logs: list[_MessageLog[M]]) -> _MessageLog[M]:
+        """Create a log holding the messages of several logs, copying each once."""
+        if len(logs) == 1:
+            return logs[0]
+        items: list[MessageTrace[M]] = []
+        mask = 0
+        for log in logs:
+            items += log._tuple if log._tuple is not None else log._items[:log._length]  # type: ignore[index]
+            mask |= log._mask
+        return cls._shared(items, len(items), mask)
+
+    def as_tuple(self) -> Tuple[MessageTrace[M], ...]:
+        """Return the messages of this version as a tuple."""
+        messages = self._tuple
+        if messages is None:
+            messages = self._tuple = tuple(self._items[:self._length])
+        return messages
+
+    def has_severity(self, severity: TraceSeverityLevel) -> bool:
+        """Check if any message has the given severity, without allocating."""
+        return (self._mask & _SEVERITY_BITS[severity]) != 0
+
+    def by_severity(self, severity: TraceSeverityLevel) -> Tuple[MessageTrace[M], ...]:
+        """Get the messages with the given severity, cached per version."""
+        if not self._mask & _SEVERITY_BITS[severity]:
+            return ()
+        views = self._views
+        if views is None:
+            views = self._views = {}
+        messages = views.get(severity)
+        if messages is None:
+            messages = views[severity] = tuple(
+                message for message in self.as_tuple() if message.severity == severity
+            )
+        return messages
+
+
 # Protocols
 @runtime_checkable
 class Serializable(Protocol):
@@ -137,6 +435,11 @@ class TypeUtils:
 
     __slots__ = ()  # Prevent instantiation with instance attributes
 
+    # Serialized in place of a container that contains itself
+    CYCLE_MARKER = "<cycle>"
+    # Serialized in place of nested exceptions beyond the depth limit
+    TRUNCATED_MARKER = "<truncated>"
+
     def __new__(cls) -> None:
         raise TypeError("TypeUtils cannot be instantiated - use static methods directly")
 
@@ -191,7 +494,9 @@ class TypeUtils:
             >>> TypeUtils.has_to_dict("plain string")
             False
         """
-        return isinstance(obj, Serializable)
+        # Equivalent to isinstance(obj, Serializable) without the slow
+        # runtime protocol check.
+        return getattr(obj, 'to_dict', None) is not None
     
     @staticmethod
     def is_exception(obj: Any) -> bool:
@@ -214,6 +519,23 @@ class TypeUtils:
     def serialize_exception(exception: BaseException) -> Any:
         """Serialize an exception to a JSON-compatible representation.
 
+        The result always holds the exception `name` and `message`. Other
+        keys are only present when they apply:
+        - `cause`: the explicit cause (``raise ... from cause``)
+        - `context`: the exception being handled when this one was raised,
+          unless suppressed by ``raise ... from`` (only when `context` is
+          enabled, see `configure_exceptions()`)
+        - `exceptions`: the members of an ExceptionGroup
+        - `notes`: notes added with `add_note()` (only when `notes` is
+          enabled)
+        - `frames`: the innermost traceback frames, as dicts with `file`,
+          `line` and `function` (only when `max_frames` is set, see
+          `configure_exceptions()`)
+
+        Nested exceptions are serialized the same way, up to `max_depth`
+        levels; deeper ones are replaced with `TRUNCATED_MARKER`, and an
+        exception reached again through its own chain with `CYCLE_MARKER`.
+
         Args:
             exception: The exception instance to serialize.
 
@@ -225,18 +547,75 @@ class TypeUtils:
             ...     1 / 0
             ... except ZeroDivisionError as e:
             ...     TypeUtils.serialize_exception(e)
-            {'type': 'ZeroDivisionError', 'message': 'division by zero'}
+            {'name': 'ZeroDivisionError', 'message': 'division by zero'}
         """
-        exception_dict = {
-            'name': type(exception).__name__,
-            'message': str(exception),
-        }
-        if exception.__cause__ is not None:
-            exception_dict['cause'] = TypeUtils.serialize_exception(exception.__cause__)
-        return exception_dict
+        return _serialize_exception(exception, _exception_options, set(), 0)
+
+    @staticmethod
+    def configure_exceptions(*, max_depth: int = 32, max_frames: int = 0,
+                             context: bool = False, notes: bool = False) -> None:
+        """Configure how `serialize_exception()` represents exceptions.
+
+        Settings apply process-wide; each call resets the arguments it
+        does not pass to their defaults.
+
+        Args:
+            max_depth: Levels of nested causes, contexts and group members
+                       serialized below the outermost exception.
+            max_frames: Number of innermost traceback frames included as
+                        `frames`. 0 leaves frames out.
+            context: Include the implicit `__context__` exception.
+            notes: Include `__notes__`.
+
+        `context` and `notes` are off by default, so exceptions serialize
+        with the same keys as before unless they are enabled.
+
+        Raises:
+            ValueError: If `max_depth` or `max_frames` is negative.
+
+        Example:
+            >>> TypeUtils.configure_exceptions(max_frames=5)
+        """
+        if max_depth < 0 or max_frames < 0:
+            raise ValueError("max_depth and max_frames must not be negative")
+        _exception_options.max_depth = max_depth
+        _exception_options.max_frames = max_frames
+        _exception_options.context = context
+        _exception_options.notes = notes
+
+    @staticmethod
+    def detach_traceback(exception: BaseException) -> None:
+        """Replace the tracebacks of an exception chain with frame summaries.
+
+        A traceback keeps every frame it passes through alive, along with
+        all of their local variables. This records the file, line and
+        function of each frame on the exception (and on its causes,
+        contexts and group members), then drops the traceback. The summary
+        is used by `serialize_exception()` and survives pickling.
+
+        Args:
+            exception: The exception to detach. It can no longer be
+                       re-raised with its original traceback.
+        """
+        pending = [exception]
+        seen: set[int] = set()
+        while pending:
+            current = pending.pop()
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
+            tb = current.__traceback__
+            if tb is not None:
+                current.__dict__[_FRAMES_ATTRIBUTE] = _traceback_frames(tb)
+                current.__traceback__ = None
+            for nested in (current.__cause__, current.__context__):
+                if nested is not None:
+                    pending.append(nested)
+            if isinstance(current, BaseExceptionGroup):
+                pending.extend(current.exceptions)
     
     @staticmethod
-    def serialize(obj: Any) -> Any:
+    def serialize(obj: Any, budget: Optional[SerializationBudget] = None) -> Any:
         """Serialize an object to a JSON-compatible representation.
 
         Transforms objects to their serializable form:
@@ -247,8 +626,22 @@ class TypeUtils:
         - Exceptions: serialized via serialize_exception()
         - Other types: converted to string representation
 
+        Nested containers are walked with an explicit stack, so arbitrarily
+        deep values do not hit the recursion limit. Reference cycles are
+        replaced with `TypeUtils.CYCLE_MARKER`, and objects shared by
+        several entries are serialized once per call: every occurrence in
+        the output is the same serialized object, so mutating one of them
+        in place changes the others. Copy the output (``copy.deepcopy``)
+        before editing it if the input shares objects.
+
+        Handlers registered with `register_serializer()` take precedence over
+        these rules. The handler for each concrete type is resolved once and
+        cached, so later objects of the same class cost a single dict lookup.
+
         Args:
             obj: The object to serialize.
+            budget: Optional `SerializationBudget` limiting string lengths,
+                    collection sizes, depth and total output size.
 
         Returns:
             A JSON-serializable representation of the object.
@@ -261,31 +654,1129 @@ class TypeUtils:
             >>> TypeUtils.serialize([1, CustomObj(), "text"])
             [1, {'serialized': 'data'}, 'text']
         """
-        # Simple primitives (not containers) - return as-is
-        if obj is None or isinstance(obj, (str, int, float, bool)):
-            return obj
+        if budget is not None:
+            return _BudgetWalk(budget).serialize(obj)
+        handler = _type_serializers.get(type(obj))
+        if handler is None:
+            handler = TypeUtils._resolve_serializer(type(obj))
+        return handler(obj)
 
-        # Dict: recursively serialize values
-        if isinstance(obj, dict):
-            return {key: TypeUtils.serialize(value) for key, value in obj.items()}
-        
-        # Recurse serialization collection types
-        if isinstance(obj, (list, tuple)):
-            return [TypeUtils.serialize(item) for item in obj]
+    @staticmethod
+    def iter_serialized(obj: Any, chunk_items: int = 10_000) -> Iterator[Any]:
+        """Serialize a large container in chunks of at most `chunk_items` items.
+
+        Lists, tuples (and other containers serialized as lists) yield
+        lists; dicts (and other containers serialized as dicts) yield
+        dicts. Concatenating the lists, or merging the dicts, gives
+        ``TypeUtils.serialize(obj)``, but only one chunk is built at a
+        time. Each item follows the `serialize()` rules, including cycle
+        detection; an item referencing `obj` itself is replaced with
+        `CYCLE_MARKER`. Other objects are yielded as a single chunk.
+
+        Args:
+            obj: The object to serialize.
+            chunk_items: Maximum number of top-level items per chunk.
+
+        Yields:
+            Serialized chunks. An empty container yields nothing.
+
+        Raises:
+            ValueError: If `chunk_items` is not positive.
+
+        Example:
+            >>> list(TypeUtils.iter_serialized(list(range(5)), chunk_items=2))
+            [[0, 1], [2, 3], [4]]
+        """
+        if chunk_items <= 0:
+            raise ValueError("chunk_items must be positive")
+        return TypeUtils._iter_serialized(obj, chunk_items)
+
+    @staticmethod
+    def _iter_serialized(obj: Any, chunk_items: int) -> Iterator[Any]:
+        cls = type(obj)
+        handler = _type_serializers.get(cls) or TypeUtils._resolve_serializer(cls)
+        container = _container_entries(handler, obj)
+        if container is None:
+            yield handler(obj)
+            return
+        entries, is_dict, _ = container
+        while True:
+            # The container stays the root of each walk, so references back
+            # to it are cut exactly as in serialize().
+            chunk = TypeUtils._serialize_nested(obj, {} if is_dict else [], islice(entries, chunk_items))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def register_serializer(cls: type, handler: Callable[[Any], Any]) -> None:
+        """Register a serialization handler for a type and its subclasses.
+
+        The handler receives the object and must return a JSON-compatible
+        value. Registered handlers take precedence over the built-in rules;
+        for subclasses, the handler registered on the nearest class in the
+        MRO wins.
+
+        Args:
+            cls: The type to handle.
+            handler: Callable converting an instance of `cls`.
+
+        Example:
+            >>> TypeUtils.register_serializer(Decimal, str)
+            >>> TypeUtils.serialize(Decimal("1.50"))
+            '1.50'
+        """
+        _registered_serializers[cls] = handler
+        _type_serializers.clear()
+
+    @staticmethod
+    def unregister_serializer(cls: type) -> None:
+        """Remove a handler previously registered for `cls`.
+
+        Args:
+            cls: The type whose handler should be removed.
+
+        Raises:
+            KeyError: If no handler is registered for `cls`.
+        """
+        del _registered_serializers[cls]
+        _type_serializers.clear()
+
+    @staticmethod
+    def invalidate_serializer(cls: Optional[type] = None) -> None:
+        """Drop the cached serializer of `cls` and its subclasses.
+
+        The serializer of each type is resolved (and, for record-like
+        classes, compiled) on first use. Call this after changing a class
+        in a way that affects its serialization, e.g. replacing its
+        `to_dict()` or adding fields at runtime. Registering handlers and
+        switching profiles already invalidate the cache.
+
+        Args:
+            cls: The type whose serializer should be rebuilt. None drops
+                 the serializers of every type.
+        """
+        if cls is None:
+            _type_serializers.clear()
+            return
+        for cached in [cached for cached in _type_serializers if issubclass(cached, cls)]:
+            del _type_serializers[cached]
+
+    @staticmethod
+    def enable_profile(*names: str) -> None:
+        """Enable serialization profiles for types otherwise converted with str().
+
+        Available profiles:
+        - "dataclass": dataclass instances (without to_dict()) as a dict of fields
+        - "namedtuple": NamedTuple instances as a dict of fields
+        - "enum": Enum members as their serialized value
+        - "datetime": datetime, date and time as ISO 8601 strings
+        - "decimal": Decimal as its exact string form
+        - "uuid": UUID as its canonical string form
+        - "set": set and frozenset as lists
+        - "bytes": bytes, bytearray and memoryview as base64 strings
+        - "slots": instances of classes defining `__slots__` (and no
+          instance `__dict__`) as a dict of their set slots, except
+          classes from the standard library
+
+        "native" enables all of them. Profiles apply process-wide, after
+        handlers registered with `register_serializer()` and before the
+        built-in rules.
+
+        Args:
+            *names: Profile names to enable.
+
+        Raises:
+            ValueError: If a name is not a known profile.
+
+        Example:
+            >>> TypeUtils.enable_profile("datetime", "decimal")
+            >>> TypeUtils.serialize({"at": date(2026, 1, 23), "total": Decimal("9.90")})
+            {'at': '2026-01-23', 'total': '9.90'}
+        """
+        _enabled_profiles.update(_profile_names(names))
+        _refresh_profiles()
+
+    @staticmethod
+    def disable_profile(*names: str) -> None:
+        """Disable serialization profiles enabled with `enable_profile()`.
+
+        Disabling a profile that is not enabled has no effect.
+
+        Raises:
+            ValueError: If a name is not a known profile.
+        """
+        _enabled_profiles.difference_update(_profile_names(names))
+        _refresh_profiles()
+
+    @staticmethod
+    def active_profiles() -> Tuple[str, ...]:
+        """Return the names of the enabled serialization profiles."""
+        return tuple(name for name in _SERIALIZATION_PROFILES if name in _enabled_profiles)
 
-        # Objects with to_dict() protocol
-        if TypeUtils.has_to_dict(obj):
-            serializable: Serializable = obj
-            return serializable.to_dict()
+    @staticmethod
+    def deserialize(data: Any, cls: Optional[type] = None) -> Any:
+        """Rebuild an object of type `cls` from its serialized form.
+
+        The loader for each type is resolved once and cached:
+        - Loaders registered with `register_deserializer()` (nearest class
+          in the MRO wins)
+        - Types with a `from_dict()` classmethod: ``cls.from_dict(data)``
+        - Other types: `data` is returned if it is already an instance of
+          `cls`, otherwise ``cls(data)`` is called (e.g. for Enums)
+
+        Args:
+            data: The serialized representation.
+            cls: The type to rebuild. None returns `data` unchanged.
+
+        Returns:
+            The rebuilt object. None is always returned as None.
+
+        Example:
+            >>> TypeUtils.deserialize("info", TraceSeverityLevel)
+            <TraceSeverityLevel.INFO: 'info'>
+        """
+        if cls is None or data is None:
+            return data
+        loader = _type_deserializers.get(cls)
+        if loader is None:
+            loader = TypeUtils._resolve_deserializer(cls)
+        return loader(data)
+
+    @staticmethod
+    def register_deserializer(cls: type, loader: Callable[[Any], Any]) -> None:
+        """Register a loader rebuilding `cls` (and its subclasses) from serialized data.
+
+        Used by `from_dict()` on results and messages whenever `cls` is
+        passed as the value, cause or message type.
+
+        Args:
+            cls: The type to rebuild.
+            loader: Callable converting serialized data to an instance of `cls`.
 
-        # Exceptions
-        if TypeUtils.is_exception(obj):
-            return TypeUtils.serialize_exception(obj)
+        Example:
+            >>> TypeUtils.register_deserializer(Decimal, Decimal)
+            >>> Ok.from_dict({"is_ok": True, "value": "1.50"}, value_type=Decimal).value
+            Decimal('1.50')
+        """
+        _registered_deserializers[cls] = loader
+        _type_deserializers.clear()
+
+    @staticmethod
+    def unregister_deserializer(cls: type) -> None:
+        """Remove a loader previously registered for `cls`.
+
+        Args:
+            cls: The type whose loader should be removed.
+
+        Raises:
+            KeyError: If no loader is registered for `cls`.
+        """
+        del _registered_deserializers[cls]
+        _type_deserializers.clear()
+
+    @staticmethod
+    def _resolve_deserializer(cls: type) -> Callable[[Any], Any]:
+        """Find the loader for a type and cache it."""
+        loader: Optional[Callable[[Any], Any]] = None
+        for base in getattr(cls, '__mro__', ()):
+            loader = _registered_deserializers.get(base)
+            if loader is not None:
+                break
+        else:
+            from_dict = getattr(cls, 'from_dict', None)
+            if from_dict is not None:
+                loader = from_dict
+            else:
+                def loader(data: Any) -> Any:
+                    return data if isinstance(data, cls) else cls(data)
+        _type_deserializers[cls] = loader
+        return loader
+
+    @staticmethod
+    def _resolve_serializer(cls: type) -> Callable[[Any], Any]:
+        """Find the handler for a concrete type and cache it."""
+        handler: Optional[Callable[[Any], Any]] = None
+        for base in cls.__mro__:
+            handler = _registered_serializers.get(base)
+            if handler is not None:
+                break
+        else:
+            for resolve in _profile_resolvers:
+                handler = resolve(cls)
+                if handler is not None:
+                    break
+            else:
+                handler = TypeUtils._resolve_builtin_serializer(cls)
+        _type_serializers[cls] = handler
+        return handler
 
-        # Fallback: string representation
+    @staticmethod
+    def _resolve_builtin_serializer(cls: type) -> Callable[[Any], Any]:
+        """Pick the built-in rule for a type."""
+        if cls is type(None) or issubclass(cls, (str, int, float, bool)):
+            return TypeUtils._serialize_primitive
+        if issubclass(cls, dict):
+            return TypeUtils._serialize_dict
+        if issubclass(cls, (list, tuple)):
+            return TypeUtils._serialize_sequence
+        if getattr(cls, 'to_dict', None) is not None:
+            # Objects with to_dict() protocol (detected on the type). A plain
+            # method is called directly, saving a call and a method binding.
+            to_dict = inspect.getattr_static(cls, 'to_dict')
+            if type(to_dict) is FunctionType:
+                return to_dict
+            return TypeUtils._serialize_to_dict
+        if issubclass(cls, BaseException):
+            return TypeUtils.serialize_exception
+        return TypeUtils._serialize_fallback
+
+    @staticmethod
+    def _serialize_primitive(obj: Any) -> Any:
+        return obj
+
+    @staticmethod
+    def _serialize_dict(obj: Dict[Any, Any]) -> Dict[Any, Any]:
+        result = {}
+        primitives = _PRIMITIVE_TYPES
+        entries = iter(obj.items())
+        for key, value in entries:
+            if type(value) not in primitives:
+                # Nested content: continue with the stack-based walk
+                return TypeUtils._serialize_nested(obj, result, chain(((key, value),), entries))
+            result[key] = value
+        return result
+
+    @staticmethod
+    def _serialize_sequence(obj: Any) -> list[Any]:
+        result = []
+        primitives = _PRIMITIVE_TYPES
+        items = iter(obj)
+        for item in items:
+            if type(item) not in primitives:
+                # Nested content: continue with the stack-based walk
+                return TypeUtils._serialize_nested(obj, result, chain((item,), items))
+            result.append(item)
+        return result
+
+    @staticmethod
+    def _serialize_nested(root: Any, root_out: Any, root_entries: Any) -> Any:
+        """Serialize nested dicts, lists and tuples with an explicit stack.
+
+        A container reached again while it is still being serialized (a
+        reference cycle) is replaced with `CYCLE_MARKER`. Other objects met
+        more than once are serialized once and their output is reused,
+        except for containers whose output holds a cycle marker, since
+        that output depends on the path they were reached through.
+        """
+        memo: Dict[int, Any] = {id(root): root_out}
+        active = {id(root)}
+        tainted: set[int] = set()
+        stack = [(id(root), root_entries, root_out)]
+
+        def convert(child: Any) -> Any:
+            """Serialize a non-primitive child, or open a frame for a container."""
+            child_id = id(child)
+            if child_id in memo:
+                if child_id in active:
+                    tainted.update(active)
+                    return TypeUtils.CYCLE_MARKER
+                return memo[child_id]
+            cls = type(child)
+            handler = _type_serializers.get(cls) or TypeUtils._resolve_serializer(cls)
+            # Containers holding only primitives (the usual leaves) are
+            # filled right away; others get a frame on the stack.
+            if handler is serialize_dict:
+                value = memo[child_id] = {}
+                entries = iter(child.items())
+                for key, item in entries:
+                    if type(item) not in primitives:
+                        entries = chain(((key, item),), entries)
+                        break
+                    value[key] = item
+                else:
+                    return value
+            elif handler is serialize_sequence:
+                value = memo[child_id] = []
+                entries = iter(child)
+                append = value.append
+                for item in entries:
+                    if type(item) not in primitives:
+                        entries = chain((item,), entries)
+                        break
+                    append(item)
+                else:
+                    return value
+            elif type(handler) is _ExpandingHandler:
+                plan = handler.plan
+                if plan is not None:
+                    value = plan(child)
+                    if value is not None:
+                        memo[child_id] = value
+                        return value
+                value = memo[child_id] = {} if handler.is_dict else []
+                entries = handler.entries(child)
+            else:
+                value = memo[child_id] = handler(child)
+                return value
+            active.add(child_id)
+            stack.append((child_id, entries, value))
+            return value
+
+        serialize_dict = TypeUtils._serialize_dict
+        serialize_sequence = TypeUtils._serialize_sequence
+        primitives = _PRIMITIVE_TYPES
+        while stack:
+            depth = len(stack)
+            source_id, entries, out = stack[-1]
+            # Each loop stops as soon as `convert` opens a new frame, and
+            # resumes from the same iterator once that frame is done.
+            if type(out) is dict:
+                for key, child in entries:
+                    if type(child) in primitives:
+                        out[key] = child
+                    else:
+                        out[key] = convert(child)
+                        if len(stack) != depth:
+                            break
+                else:
+                    depth = 0
+            else:
+                append = out.append
+                for child in entries:
+                    if type(child) in primitives:
+                        append(child)
+                    else:
+                        append(convert(child))
+                        if len(stack) != depth:
+                            break
+                else:
+                    depth = 0
+            if depth == 0:
+                stack.pop()
+                active.discard(source_id)
+                if source_id in tainted:
+                    del memo[source_id]
+        return root_out
+
+    @staticmethod
+    def _serialize_to_dict(obj: Serializable) -> Dict[str, Any]:
+        return obj.to_dict()
+
+    @staticmethod
+    def _serialize_fallback(obj: Any) -> Any:
+        # to_dict() may be set on the instance only (e.g. a SimpleNamespace),
+        # which the per-type dispatch cannot see; `has_to_dict` does.
+        to_dict = getattr(obj, 'to_dict', None)
+        if to_dict is not None:
+            return to_dict()
         return str(obj)
 
 
+# Types TypeUtils.serialize returns as-is without a handler lookup
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Serializer resolved for each concrete type by TypeUtils.serialize
+_type_serializers: Dict[type, Callable[[Any], Any]] = {}
+# Handlers registered through TypeUtils.register_serializer
+_registered_serializers: Dict[type, Callable[[Any], Any]] = {}
+
+# Loader resolved for each type by TypeUtils.deserialize
+_type_deserializers: Dict[type, Callable[[Any], Any]] = {}
+# Loaders registered through TypeUtils.register_deserializer
+_registered_deserializers: Dict[type, Callable[[Any], Any]] = {}
+
+
+
+class _ExceptionOptions:
+    """Settings of `TypeUtils.serialize_exception` (see `configure_exceptions`)."""
+
+    __slots__ = ('max_depth', 'max_frames', 'context', 'notes')
+
+    def __init__(self) -> None:
+        self.max_depth = 32
+        self.max_frames = 0
+        self.context = False
+        self.notes = False
+
+
+_exception_options = _ExceptionOptions()
+
+# Name and group flag of each exception type, resolved once
+_exception_shapes: Dict[type, Tuple[str, bool]] = {}
+
+# Attribute holding the frames recorded by TypeUtils.detach_traceback
+_FRAMES_ATTRIBUTE = '_resokerr_frames'
+
+
+def _serialize_exception(exception: BaseException, options: _ExceptionOptions,
+                         active: set[int], depth: int) -> Dict[str, Any]:
+    cls = type(exception)
+    shape = _exception_shapes.get(cls)
+    if shape is None:
+        shape = _exception_shapes[cls] = (cls.__name__, issubclass(cls, BaseExceptionGroup))
+    name, is_group = shape
+    result: Dict[str, Any] = {'name': name, 'message': str(exception)}
+
+    nested: list[Tuple[str, BaseException]] = []
+    if exception.__cause__ is not None:
+        nested.append(('cause', exception.__cause__))
+    if options.context and exception.__context__ is not None and not exception.__suppress_context__:
+        nested.append(('context', exception.__context__))
+    if nested or is_group:
+        active.add(id(exception))
+        for key, child in nested:
+            result[key] = _serialize_nested_exception(child, options, active, depth)
+        if is_group:
+            result['exceptions'] = [
+                _serialize_nested_exception(child, options, active, depth)
+                for child in exception.exceptions  # type: ignore[attr-defined]
+            ]
+        active.discard(id(exception))
+
+    if options.notes:
+        notes = getattr(exception, '__notes__', None)
+        if notes:
+            result['notes'] = [note if type(note) is str else str(note) for note in notes]
+    if options.max_frames:
+        tb = exception.__traceback__
+        frames = _traceback_frames(tb) if tb is not None else exception.__dict__.get(_FRAMES_ATTRIBUTE)
+        if frames:
+            result['frames'] = [
+                {'file': file, 'line': line, 'function': function}
+                for file, line, function in frames[-options.max_frames:]
+            ]
+    return result
+
+
+def _serialize_nested_exception(exception: BaseException, options: _ExceptionOptions,
+                                active: set[int], depth: int) -> Any:
+    if id(exception) in active:
+        return TypeUtils.CYCLE_MARKER
+    if depth >= options.max_depth:
+        return TypeUtils.TRUNCATED_MARKER
+    return _serialize_exception(exception, options, active, depth + 1)
+
+
+def _traceback_frames(tb: Optional[TracebackType]) -> Tuple[Tuple[str, Optional[int], str], ...]:
+    """Return ``(file, line, function)`` for each frame of a traceback, outermost first."""
+    frames = []
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        frames.append((code.co_filename, tb.tb_lineno, code.co_name))
+        tb = tb.tb_next
+    return tuple(frames)
+
+
+class _ExpandingHandler:
+    """Handler serializing an object as a dict or list of its parts.
+
+    The parts are walked like the items of a plain dict or list, so they
+    get the same cycle detection and sharing as nested containers.
+    Record-like types also carry a compiled `plan` (see `_compile_plan`)
+    which builds the whole dict at once when every part is a primitive.
+    """
+
+    __slots__ = ('is_dict', 'entries', 'size', 'plan')
+
+    def __init__(self, is_dict: bool, entries: Callable[[Any], Iterator[Any]],
+                 size: Callable[[Any], int],
+                 plan: Optional[Callable[[Any], Optional[Dict[str, Any]]]] = None) -> None:
+        self.is_dict = is_dict
+        self.entries = entries  # Items (or key/value pairs) of an object
+        self.size = size        # Number of entries of an object
+        self.plan = plan        # Fast path for objects made of primitives
+
+    def __call__(self, obj: Any) -> Any:
+        plan = self.plan
+        if plan is not None:
+            value = plan(obj)
+            if value is not None:
+                return value
+        return TypeUtils._serialize_nested(obj, {} if self.is_dict else [], self.entries(obj))
+
+
+def _container_entries(handler: Callable[[Any], Any], obj: Any) -> Optional[Tuple[Iterator[Any], bool, int]]:
+    """Return ``(entries, is_dict, size)`` if `handler` serializes `obj` as a container.
+
+    Used by the streaming encoders to walk containers the same way
+    `TypeUtils.serialize` does; None means `handler(obj)` is a leaf.
+    """
+    if handler is TypeUtils._serialize_dict:
+        return iter(obj.items()), True, len(obj)
+    if handler is TypeUtils._serialize_sequence:
+        return iter(obj), False, len(obj)
+    if type(handler) is _ExpandingHandler:
+        plan = handler.plan
+        if plan is not None:
+            value = plan(obj)
+            if value is not None:
+                return iter(value.items()), True, len(value)
+        return handler.entries(obj), handler.is_dict, handler.size(obj)
+    return None
+
+
+def _compile_plan(keys: Tuple[str, ...], attrs: Optional[Tuple[str, ...]] = None
+                  ) -> Optional[Callable[[Any], Optional[Dict[str, Any]]]]:
+    """Generate a function serializing a record class made of primitives.
+
+    The function reads each field directly (attribute `attrs`, or tuple
+    unpacking when `attrs` is None) and checks its type inline. It returns
+    the ``{key: value}`` dict when every field holds a primitive, and None
+    otherwise (or when a slot is unset), leaving the object to the
+    generic walk. Fields that are not valid identifiers are not compiled.
+    """
+    names = keys if attrs is None else attrs
+    if not names or not all(name.isidentifier() and not keyword.iskeyword(name) for name in names):
+        return None
+    variables = [f"v{index}" for index in range(len(names))]
+    if attrs is None:
+        reads = [f"    {', '.join(variables)}, = obj"]
+    else:
+        reads = ["    try:"]
+        reads += [f"        {variable} = obj.{attr}" for variable, attr in zip(variables, attrs)]
+        reads += ["    except AttributeError:", "        return None"]
+    source = "\n".join([
+        "def plan(obj, primitives=primitives):",
+        *reads,
+        "    if " + " and ".join(f"type({variable}) in primitives" for variable in variables) + ":",
+        "        return {" + ", ".join(f"{key!r}: {variable}" for key, variable in zip(keys, variables)) + "}",
+        "    return None",
+    ])
+    namespace: Dict[str, Any] = {"primitives": _PRIMITIVE_TYPES}
+    exec(source, namespace)
+    return namespace["plan"]
+
+
+def _resolve_dataclass(cls: type) -> Optional[Callable[[Any], Any]]:
+    # Dataclasses defining to_dict() keep using it
+    if not is_dataclass(cls) or getattr(cls, 'to_dict', None) is not None:
+        return None
+    names = tuple(f.name for f in fields(cls))
+
+    # init=False fields without a default are missing until assigned
+    def entries(obj: Any) -> Iterator[Tuple[str, Any]]:
+        for name in names:
+            value = getattr(obj, name, _UNSET)
+            if value is not _UNSET:
+                yield name, value
+
+    return _ExpandingHandler(
+        True,
+        entries,
+        lambda obj: sum(1 for _ in entries(obj)),
+        _compile_plan(names, names),
+    )
+
+
+def _resolve_namedtuple(cls: type) -> Optional[Callable[[Any], Any]]:
+    names = getattr(cls, '_fields', None)
+    if not issubclass(cls, tuple) or not isinstance(names, tuple):
+        return None
+    return _ExpandingHandler(True, lambda obj: zip(names, obj), len, _compile_plan(names))
+
+
+_UNSET = object()
+
+
+def _resolve_slots(cls: type) -> Optional[Callable[[Any], Any]]:
+    if len(cls.__mro__) < 2 or getattr(cls, 'to_dict', None) is not None:
+        return None
+    # Stdlib classes (Fraction, ...) keep their str() form: their slots are
+    # private implementation details, not fields
+    if str(getattr(cls, '__module__', '')).partition('.')[0] in sys.stdlib_module_names:
+        return None
+    keys: list[str] = []
+    attrs: list[str] = []
+    # Every class but object must define __slots__, or instances have a __dict__
+    for base in reversed(cls.__mro__[:-1]):
+        slots = base.__dict__.get('__slots__')
+        if slots is None:
+            return None
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name == '__dict__':
+                return None
+            if name == '__weakref__' or name in keys:
+                continue
+            keys.append(name)
+            # Private names are stored mangled
+            if name.startswith('__') and not name.endswith('__'):
+                attrs.append(f"_{base.__name__.lstrip('_')}{name}")
+            else:
+                attrs.append(name)
+    pairs = tuple(zip(keys, attrs))
+
+    def entries(obj: Any) -> Iterator[Tuple[str, Any]]:
+        for key, attr in pairs:
+            value = getattr(obj, attr, _UNSET)
+            if value is not _UNSET:
+                yield key, value
+
+    return _ExpandingHandler(
+        True,
+        entries,
+        lambda obj: sum(1 for _ in entries(obj)),
+        _compile_plan(tuple(keys), tuple(attrs)),
+    )
+
+
+def _resolve_enum(cls: type) -> Optional[Callable[[Any], Any]]:
+    return _serialize_enum if issubclass(cls, Enum) else None
+
+
+def _serialize_enum(obj: Enum) -> Any:
+    return TypeUtils.serialize(obj.value)
+
+
+# Modules below are looked up rather than imported: if a module was never
+# imported, none of its types can be serialized, and loading it just to
+# check would slow down importing resokerr.
+def _resolve_datetime(cls: type) -> Optional[Callable[[Any], Any]]:
+    datetime = sys.modules.get('datetime')
+    if datetime is not None and issubclass(cls, (datetime.date, datetime.time)):
+        return _serialize_isoformat
+    return None
+
+
+def _serialize_isoformat(obj: Any) -> str:
+    return obj.isoformat()
+
+
+def _resolve_decimal(cls: type) -> Optional[Callable[[Any], Any]]:
+    decimal = sys.modules.get('decimal')
+    return str if decimal is not None and issubclass(cls, decimal.Decimal) else None
+
+
+def _resolve_uuid(cls: type) -> Optional[Callable[[Any], Any]]:
+    uuid = sys.modules.get('uuid')
+    return str if uuid is not None and issubclass(cls, uuid.UUID) else None
+
+
+def _resolve_set(cls: type) -> Optional[Callable[[Any], Any]]:
+    return _SET_HANDLER if issubclass(cls, (set, frozenset)) else None
+
+
+_SET_HANDLER = _ExpandingHandler(False, iter, len)
+
+
+def _resolve_bytes(cls: type) -> Optional[Callable[[Any], Any]]:
+    return _serialize_base64 if issubclass(cls, (bytes, bytearray, memoryview)) else None
+
+
+def _serialize_base64(obj: Any) -> str:
+    # b2a_base64 reads the buffer in place, even for memoryview slices
+    return binascii.b2a_base64(obj, newline=False).decode('ascii')
+
+
+# Resolver of each serialization profile, in the order they are consulted
+_SERIALIZATION_PROFILES: Dict[str, Callable[[type], Optional[Callable[[Any], Any]]]] = {
+    "dataclass": _resolve_dataclass,
+    "namedtuple": _resolve_namedtuple,
+    "enum": _resolve_enum,
+    "datetime": _resolve_datetime,
+    "decimal": _resolve_decimal,
+    "uuid": _resolve_uuid,
+    "set": _resolve_set,
+    "bytes": _resolve_bytes,
+    # Catch-all for slotted classes, so it comes after the specific profiles
+    "slots": _resolve_slots,
+}
+_enabled_profiles: set[str] = set()
+# Resolvers of the enabled profiles, consulted by TypeUtils._resolve_serializer
+_profile_resolvers: list[Callable[[type], Optional[Callable[[Any], Any]]]] = []
+
+
+def _profile_names(names: Tuple[str, ...]) -> set[str]:
+    selected: set[str] = set()
+    for name in names:
+        if name == "native":
+            selected.update(_SERIALIZATION_PROFILES)
+        elif name in _SERIALIZATION_PROFILES:
+            selected.add(name)
+        else:
+            raise ValueError(f"Unknown serialization profile: {name!r}")
+    return selected
+
+
+def _refresh_profiles() -> None:
+    _profile_resolvers[:] = [
+        resolve for name, resolve in _SERIALIZATION_PROFILES.items() if name in _enabled_profiles
+    ]
+    _type_serializers.clear()
+
+
+@contextmanager
+def serialization_profile(*names: str) -> Iterator[None]:
+    """Enable serialization profiles for the duration of a `with` block.
+
+    Profiles that were already enabled stay enabled afterwards. As with
+    `TypeUtils.enable_profile()`, the setting is process-wide.
+
+    Example:
+        >>> with serialization_profile("native"):
+        ...     payload = result.to_dict()
+    """
+    added = _profile_names(names) - _enabled_profiles
+    TypeUtils.enable_profile(*added)
+    try:
+        yield
+    finally:
+        TypeUtils.disable_profile(*added)
+
+
+_RESULT_FIELDS = ("is_ok", "is_err", "value", "cause", "messages", "metadata")
+_MESSAGE_FIELDS = ("message", "severity", "code", "details", "stack_trace")
+
+# Short keys used by SerializationOptions(compact_keys=True)
+_COMPACT_KEYS: Dict[str, str] = {
+    "is_ok": "ok", "is_err": "err", "value": "v", "cause": "c", "messages": "ms", "metadata": "md",
+    "message": "m", "severity": "s", "code": "k", "details": "d", "stack_trace": "t",
+}
+
+_ALL_SEVERITIES_MASK = sum(_SEVERITY_BITS.values())
+
+
+@dataclass(frozen=True, slots=True)
+class SerializationOptions:
+    """Projection and filtering settings for `to_dict()` on results and messages.
+
+    The settings are checked and compiled when the options are created, so
+    one instance can be built once and reused across calls. Parts that are
+    left out are skipped while serializing rather than removed afterwards.
+
+    Field names are shared by both levels: results have "is_ok", "is_err",
+    "value", "cause", "messages" and "metadata"; messages have "message",
+    "severity", "code", "details" and "stack_trace".
+
+    Args:
+        min_severity: Leave out messages below this severity (severities
+                      rank in declaration order: success, info, warning, error).
+        include: Fields to keep. A level none of whose fields are named
+                 keeps all of them, so ``{"value", "messages", "code"}``
+                 restricts both results and messages.
+        exclude: Fields to leave out, at either level.
+        stack_traces: False leaves out message stack traces.
+        max_messages: Keep at most this many messages (the first ones
+                      after severity filtering).
+        compact_keys: Emit short keys ("ok", "err", "v", "c", "ms", "md" for
+                      results; "m", "s", "k", "d", "t" for messages). Output
+                      with compact keys cannot be loaded with `from_dict()`.
+
+    Raises:
+        ValueError: On unknown field or severity names, or a negative
+                    `max_messages`.
+
+    Example:
+        >>> public = SerializationOptions(min_severity="warning", exclude={"details"}, stack_traces=False)
+        >>> result.to_dict(options=public)
+    """
+    min_severity: Optional[Union[TraceSeverityLevel, str]] = None
+    include: Optional[Iterable[str]] = None
+    exclude: Optional[Iterable[str]] = None
+    stack_traces: bool = True
+    max_messages: Optional[int] = None
+    compact_keys: bool = False
+    # Compiled form, filled in by __post_init__
+    _result_keys: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _message_keys: Tuple[Tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    _severity_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        include = None if self.include is None else frozenset(self.include)
+        exclude = frozenset(() if self.exclude is None else self.exclude)
+        object.__setattr__(self, 'include', include)
+        object.__setattr__(self, 'exclude', exclude)
+        for name in (include or frozenset()) | exclude:
+            if name not in _COMPACT_KEYS:
+                raise ValueError(f"Unknown field: {name!r}")
+        if self.max_messages is not None and self.max_messages < 0:
+            raise ValueError("max_messages must not be negative")
+
+        if not self.stack_traces:
+            exclude |= {"stack_trace"}
+        levels = []
+        for names in (_RESULT_FIELDS, _MESSAGE_FIELDS):
+            kept = [name for name in names if name not in exclude]
+            if include is not None and not include.isdisjoint(names):
+                kept = [name for name in kept if name in include]
+            levels.append([(name, _COMPACT_KEYS[name] if self.compact_keys else name) for name in kept])
+        object.__setattr__(self, '_result_keys', dict(levels[0]))
+        object.__setattr__(self, '_message_keys', tuple(levels[1]))
+
+        mask = _ALL_SEVERITIES_MASK
+        if self.min_severity is not None:
+            severity = self.min_severity
+            if not isinstance(severity, TraceSeverityLevel):
+                severity = _SEVERITY_BY_VALUE.get(severity)  # type: ignore[assignment]
+                if severity is None:
+                    raise ValueError(f"Unknown severity: {self.min_severity!r}")
+            mask = sum(_SEVERITY_BITS[level] for level in _SEVERITIES[_SEVERITY_CODES[severity]:])
+        object.__setattr__(self, '_severity_mask', mask)
+
+    # The methods below serialize with `walk` (a _BudgetWalk) when a
+    # SerializationBudget applies, and with TypeUtils.serialize otherwise.
+
+    def _message_to_dict(self, trace: MessageTrace[Any],
+                         walk: Optional[_BudgetWalk] = None) -> Dict[str, Any]:
+        serialize = TypeUtils.serialize if walk is None else walk.serialize
+        result: Dict[str, Any] = {}
+        for name, key in self._message_keys:
+            if name == "message":
+                result[key] = serialize(trace.message)
+            elif name == "severity":
+                result[key] = trace.severity.value
+            elif name == "details":
+                packed = _get_trace_packed_details(trace)
+                if packed is not None:
+                    result[key] = serialize(dict(zip(packed[::2], packed[1::2])))
+            else:
+                value = getattr(trace, name)
+                if value is not None:
+                    result[key] = value if walk is None else walk.serialize(value)
+        return result
+
+    def _result_to_dict(self, result: Any, is_ok: bool, payload: Any,
+                        walk: Optional[_BudgetWalk] = None) -> Dict[str, Any]:
+        serialize = TypeUtils.serialize if walk is None else walk.serialize
+        keys = self._result_keys
+        output: Dict[str, Any] = {}
+        if "is_ok" in keys:
+            output[keys["is_ok"]] = is_ok
+        if "is_err" in keys:
+            output[keys["is_err"]] = not is_ok
+        payload_name = "value" if is_ok else "cause"
+        if payload_name in keys:
+            output[keys[payload_name]] = serialize(payload)
+        if "messages" in keys:
+            output[keys["messages"]] = self._messages_to_list(result._message_log, walk)
+        metadata = result.metadata
+        if metadata is not None and "metadata" in keys:
+            output[keys["metadata"]] = serialize(dict(metadata))
+        return output
+
+    def _messages_to_list(self, log: _MessageLog[Any],
+                          walk: Optional[_BudgetWalk] = None) -> list[Any]:
+        mask = self._severity_mask
+        limit = self.max_messages
+        if not log._mask & mask or limit == 0:
+            return []
+        output: list[Any] = []
+        to_dict = self._message_to_dict
+        for message in log.as_tuple():
+            if _SEVERITY_BITS[message.severity] & mask:
+                if walk is not None and not walk.admit(output, len(output)):
+                    break
+                output.append(to_dict(message, walk))
+                if len(output) == limit:
+                    break
+        return output
+
+
+_DEFAULT_OPTIONS = SerializationOptions()
+
+
+@dataclass(frozen=True, slots=True)
+class SerializationBudget:
+    """Size limits enforced while serializing.
+
+    Parts over a limit are cut off and marked with
+    `TypeUtils.TRUNCATED_MARKER`, and are never serialized in full:
+    - Strings longer than `max_string` characters keep their first
+      `max_string` characters, followed by the marker
+    - Lists with more than `max_items` items keep the first ones, followed
+      by the marker; dicts keep their first entries plus a marker key whose
+      value is the number of entries left out
+    - Containers nested deeper than `max_depth` levels become the marker
+    - Once the output would exceed about `max_bytes` of JSON text, the
+      remaining items of every open container are left out and marked
+      the same way as for `max_items`
+
+    One budget applies to a whole call: in `to_dict()`, the value or cause,
+    messages and metadata share `max_bytes`. None disables a limit.
+
+    Raises:
+        ValueError: If a limit is negative.
+
+    Example:
+        >>> budget = SerializationBudget(max_string=5, max_items=2)
+        >>> TypeUtils.serialize({"rows": [1, 2, 3], "note": "abcdefgh"}, budget=budget)
+        {'rows': [1, 2, '<truncated>'], 'note': 'abcde<truncated>'}
+    """
+    max_string: Optional[int] = None
+    max_items: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_bytes: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        for name in ('max_string', 'max_items', 'max_depth', 'max_bytes'):
+            limit = getattr(self, name)
+            if limit is not None and limit < 0:
+                raise ValueError(f"{name} must not be negative")
+
+
+# Returned by _BudgetWalk steps for an item that does not fit in max_bytes
+_CUT = object()
+
+
+class _BudgetWalk:
+    """Serializes values within a SerializationBudget.
+
+    Follows the `TypeUtils.serialize` rules with an explicit stack, and
+    keeps track of the approximate JSON size of everything serialized
+    through it, so several values can share one `max_bytes` budget.
+    """
+
+    __slots__ = ('max_string', 'max_items', 'max_depth', 'remaining', 'exhausted')
+
+    def __init__(self, budget: SerializationBudget) -> None:
+        self.max_string = budget.max_string
+        self.max_items = budget.max_items
+        self.max_depth = budget.max_depth
+        self.remaining = budget.max_bytes
+        self.exhausted = False
+
+    def _take(self, cost: int) -> bool:
+        remaining = self.remaining
+        if remaining is None:
+            return True
+        if cost > remaining:
+            self.exhausted = True
+            return False
+        self.remaining = remaining - cost
+        return True
+
+    def admit(self, out: list[Any], count: int) -> bool:
+        """Check whether one more item may be added to a list being built."""
+        if self.exhausted or (self.max_items is not None and count >= self.max_items):
+            out.append(TypeUtils.TRUNCATED_MARKER)
+            return False
+        return True
+
+    def _leaf(self, value: Any) -> Any:
+        if isinstance(value, str):
+            if self.max_string is not None and len(value) > self.max_string:
+                value = value[:self.max_string] + TypeUtils.TRUNCATED_MARKER
+            cost = len(value) + 2
+        elif value is None or value is True:
+            cost = 4
+        elif value is False:
+            cost = 5
+        elif isinstance(value, int):
+            # Digits estimated from the bit length: repr() of huge ints may raise
+            cost = value.bit_length() * 30103 // 100000 + 2
+        else:
+            cost = len(repr(value))
+        return value if self._take(cost) else _CUT
+
+    def serialize(self, obj: Any) -> Any:
+        """Serialize `obj` within the remaining budget."""
+        if self.exhausted:
+            return TypeUtils.TRUNCATED_MARKER
+        # Frames: [container id, entries, output, size, item count, depth, is_dict]
+        stack: list[list[Any]] = []
+        active: set[int] = set()
+        root = self._convert(obj, 0, stack, active, False)
+        if root is _CUT:
+            return TypeUtils.TRUNCATED_MARKER
+
+        max_items = self.max_items
+        while stack:
+            frame = stack[-1]
+            if self.exhausted:
+                # Out of bytes: close every open container, marking those
+                # with items left
+                for source_id, _, out, size, count, _, is_dict in reversed(stack):
+                    if count < size:
+                        _mark_truncated(out, is_dict, size - count)
+                stack.clear()
+                break
+            _, entries, out, size, count, depth, is_dict = frame
+            height = len(stack)
+            for entry in entries:
+                if max_items is not None and count >= max_items:
+                    _mark_truncated(out, is_dict, size - count)
+                    break
+                if is_dict:
+                    key, child = entry
+                    if not self._take(len(str(key)) + 4):
+                        break
+                else:
+                    child = entry
+                    if not self._take(2):
+                        break
+                value = self._convert(child, depth, stack, active, False)
+                if value is _CUT:
+                    break
+                count += 1
+                if is_dict:
+                    out[key] = value
+                else:
+                    out.append(value)
+                if len(stack) != height:
+                    # Resume this container once the new frame is done
+                    frame[4] = count
+                    break
+            else:
+                stack.pop()
+                active.discard(frame[0])
+                continue
+            if len(stack) == height and not self.exhausted:
+                # Stopped by max_items
+                stack.pop()
+                active.discard(frame[0])
+            else:
+                frame[4] = count
+        return root
+
+    def _convert(self, child: Any, depth: int, stack: list[list[Any]],
+                 active: set[int], from_handler: bool) -> Any:
+        """Serialize a leaf, or open a frame for a container and return its output."""
+        cls = type(child)
+        if cls in _PRIMITIVE_TYPES:
+            return self._leaf(child)
+        if from_handler and not isinstance(child, (dict, list, tuple)):
+            # Handler output is expected to be JSON-compatible already
+            handler: Callable[[Any], Any] = str
+        else:
+            handler = _type_serializers.get(cls) or TypeUtils._resolve_serializer(cls)
+        if handler is TypeUtils._serialize_primitive:
+            return self._leaf(child)
+        container = _container_entries(handler, child)
+        if container is None:
+            return self._convert(handler(child), depth, stack, active, True)
+
+        if self.max_depth is not None and depth >= self.max_depth:
+            return self._leaf(TypeUtils.TRUNCATED_MARKER)
+        child_id = id(child)
+        if child_id in active:
+            return self._leaf(TypeUtils.CYCLE_MARKER)
+        if not self._take(2):
+            return _CUT
+        entries, is_dict, size = container
+        out: Any = {} if is_dict else []
+        active.add(child_id)
+        stack.append([child_id, entries, out, size, 0, depth + 1, is_dict])
+        return out
+
+
+def _mark_truncated(out: Any, is_dict: bool, omitted: int) -> None:
+    if is_dict:
+        out[TypeUtils.TRUNCATED_MARKER] = omitted
+    else:
+        out.append(TypeUtils.TRUNCATED_MARKER)
+
+
+# Public entry points for custom serialization handlers
+register_serializer = TypeUtils.register_serializer
+unregister_serializer = TypeUtils.unregister_serializer
+register_deserializer = TypeUtils.register_deserializer
+unregister_deserializer = TypeUtils.unregister_deserializer
+enable_serialization_profile = TypeUtils.enable_profile
+disable_serialization_profile = TypeUtils.disable_profile
+configure_exception_serialization = TypeUtils.configure_exceptions
+invalidate_serializer = TypeUtils.invalidate_serializer
+
+
 class HasMessages(Protocol[M]):
     """Protocol for objects that have a messages attribute."""
     @property
@@ -293,6 +1784,8 @@ class HasMessages(Protocol[M]):
     
     def _get_messages_by_severity(self, severity: TraceSeverityLevel) -> Tuple[MessageTrace[M], ...]: ...
 
+    def _has_messages_by_severity(self, severity: TraceSeverityLevel) -> bool: ...
+
 class HasSuccessMessages(Protocol[M]):
     """Protocol for objects that can handle success messages."""
     @property
@@ -303,6 +1796,8 @@ class HasSuccessMessages(Protocol[M]):
     
     def has_successes(self) -> bool: ...
 
+    def _has_messages_by_severity(self, severity: TraceSeverityLevel) -> bool: ...
+
 class HasInfoMessages(Protocol[M]):
     """Protocol for objects that can handle info messages."""
     @property
@@ -313,6 +1808,8 @@ class HasInfoMessages(Protocol[M]):
     
     def has_info(self) -> bool: ...
 
+    def _has_messages_by_severity(self, severity: TraceSeverityLevel) -> bool: ...
+
 class HasWarningMessages(Protocol[M]):
     """Protocol for objects that can handle warning messages."""
     @property
@@ -323,6 +1820,8 @@ class HasWarningMessages(Protocol[M]):
     
     def has_warnings(self) -> bool: ...
 
+    def _has_messages_by_severity(self, severity: TraceSeverityLevel) -> bool: ...
+
 class HasErrorMessages(Protocol[M]):
     """Protocol for objects that can handle error messages."""
     @property
@@ -332,6 +1831,8 @@ class HasErrorMessages(Protocol[M]):
     def error_messages(self) -> Tuple[MessageTrace[M], ...]: ...
     
     def has_errors(self) -> bool: ...
+
+    def _has_messages_by_severity(self, severity: TraceSeverityLevel) -> bool: ...
     
 class HasMetadata(Protocol):
     """Protocol for objects that have a metadata attribute."""
@@ -356,6 +1857,8 @@ class HasMappableValue(Protocol[V, M]):
     def messages(self) -> Tuple[MessageTrace[M], ...]: ...
     @property
     def metadata(self) -> Optional[Mapping[str, Any]]: ...
+    @property
+    def _message_log(self) -> _MessageLog[M]: ...
 
 class HasMappableCause(Protocol[E, M]):
     """Protocol for Err-like objects that support cause mapping."""
@@ -365,17 +1868,51 @@ class HasMappableCause(Protocol[E, M]):
     def messages(self) -> Tuple[MessageTrace[M], ...]: ...
     @property
     def metadata(self) -> Optional[Mapping[str, Any]]: ...
+    @property
+    def _message_log(self) -> _MessageLog[M]: ...
 
 # Mixins
-class BaseMixinMessageCollector(Generic[M]):
+class _ResultSlots:
+    """Slots for state resokerr derives from Ok/Err fields.
+
+    These are not dataclass fields. CPython allows only one base with
+    non-empty __slots__ in a class hierarchy, so all of them live here.
+    """
+
+    __slots__ = ('_message_log', '_serialized')
+
+
+class BaseMixinMessageCollector(_ResultSlots, Generic[M]):
     """Base class for handling messages.
     
     Expects inheriting classes to provide a 'messages' attribute of type Tuple[MessageTrace[M], ...]
+
+    Messages are backed by a persistent `_MessageLog`. Instances derived from
+    another instance (`map`, `with_*`) only store a log version and leave the
+    `messages` slot unset; the tuple is materialized on first access.
     """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when regular lookup fails, i.e. for unset slots.
+        if name == 'messages':
+            messages = object.__getattribute__(self, '_message_log').as_tuple()
+            object.__setattr__(self, 'messages', messages)
+            return messages
+        if name == '_message_log':
+            log = _MessageLog(object.__getattribute__(self, 'messages'))
+            object.__setattr__(self, '_message_log', log)
+            return log
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
     
-    def _get_messages_by_severity(self: HasMessages[M], severity: TraceSeverityLevel) -> Tuple[MessageTrace[M], ...]:
-        """Get messages filtered by severity."""
-        return tuple(message for message in self.messages if message.severity == severity)
+    def _get_messages_by_severity(self, severity: TraceSeverityLevel) -> Tuple[MessageTrace[M], ...]:
+        """Get messages filtered by severity (cached per instance)."""
+        return self._message_log.by_severity(severity)
+
+    def _has_messages_by_severity(self, severity: TraceSeverityLevel) -> bool:
+        """Check if there are messages of the given severity in O(1)."""
+        return self._message_log.has_severity(severity)
 
 class SuccessCollectorMixin(BaseMixinMessageCollector[M]):
     """Mixin for collecting success messages."""
@@ -387,7 +1924,7 @@ class SuccessCollectorMixin(BaseMixinMessageCollector[M]):
     
     def has_successes(self: HasSuccessMessages[M]) -> bool:
         """Check if there are any success messages."""
-        return len(self.success_messages) > 0
+        return self._has_messages_by_severity(TraceSeverityLevel.SUCCESS)
 
 class InfoCollectorMixin(BaseMixinMessageCollector[M]):
     """Mixin for collecting info messages."""
@@ -399,7 +1936,7 @@ class InfoCollectorMixin(BaseMixinMessageCollector[M]):
     
     def has_info(self: HasInfoMessages[M]) -> bool:
         """Check if there are any info messages."""
-        return len(self.info_messages) > 0
+        return self._has_messages_by_severity(TraceSeverityLevel.INFO)
 
 class WarningCollectorMixin(BaseMixinMessageCollector[M]):
     """Mixin for collecting warning messages."""
@@ -411,7 +1948,7 @@ class WarningCollectorMixin(BaseMixinMessageCollector[M]):
     
     def has_warnings(self: HasWarningMessages[M]) -> bool:
         """Check if there are any warning messages."""
-        return len(self.warning_messages) > 0
+        return self._has_messages_by_severity(TraceSeverityLevel.WARNING)
 
 class ErrorCollectorMixin(BaseMixinMessageCollector[M]):
     """Mixin for collecting error messages."""
@@ -423,7 +1960,7 @@ class ErrorCollectorMixin(BaseMixinMessageCollector[M]):
     
     def has_errors(self: HasErrorMessages[M]) -> bool:
         """Check if there are any error messages."""
-        return len(self.error_messages) > 0
+        return self._has_messages_by_severity(TraceSeverityLevel.ERROR)
 
 class MetadataMixin:
     """Mixin for handling metadata.
@@ -446,6 +1983,136 @@ class StatusMixin:
         """Check if this is an error result."""
         return isinstance(self, Err)
 
+class SerializationCacheMixin(_ResultSlots):
+    """Mixin memoizing serialized forms of an immutable result.
+
+    The cache is opt-in (``to_dict(cache=True)``, ``to_json(cache=True)``)
+    because values, causes and metadata values may themselves be mutable
+    objects: only use it when their contents do not change.
+    """
+
+    __slots__ = ()
+
+    def _cached_serialization(self, key: str, build: Callable[[], T]) -> T:
+        """Return the cached entry for `key`, building it on first use."""
+        try:
+            cache: Dict[str, Any] = self._serialized
+        except AttributeError:
+            cache = {}
+            object.__setattr__(self, '_serialized', cache)
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = build()
+            return value
+
+
+def _read_only(*args: Any, **kwargs: Any) -> Any:
+    raise TypeError("cached serialized output is read-only")
+
+
+class _FrozenDict(dict):  # type: ignore[type-arg]
+    """A dict that rejects mutation, returned by ``to_dict(cache=True)``.
+
+    Being a dict, it compares equal to the uncached output and can be
+    passed to any JSON encoder.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):  # type: ignore[type-arg]
+    """A list that rejects mutation, returned by ``to_dict(cache=True)``."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+def _freeze_serialized(obj: Any) -> Any:
+    """Copy serialized data into read-only dicts and lists.
+
+    Iterative, so output nested deeper than the recursion limit (which
+    `to_dict()` produces without recursing) can be frozen too.
+    """
+    if not isinstance(obj, (dict, list)):
+        return obj
+    set_item = dict.__setitem__
+    add_item = list.append
+    root = _FrozenDict() if isinstance(obj, dict) else _FrozenList()
+    stack = [(obj, root)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if isinstance(value, (dict, list)):
+                    child = _FrozenDict() if isinstance(value, dict) else _FrozenList()
+                    stack.append((value, child))
+                    value = child
+                set_item(target, key, value)
+        else:
+            for value in source:
+                if isinstance(value, (dict, list)):
+                    child = _FrozenDict() if isinstance(value, dict) else _FrozenList()
+                    stack.append((value, child))
+                    value = child
+                add_item(target, value)
+    return root
+
+
+class JsonMixin(SerializationCacheMixin):
+    """Mixin providing direct JSON output for results.
+
+    Encodes the same structure as `to_dict()` without building the
+    intermediate dictionaries (see `resokerr.jsonio`).
+    """
+
+    __slots__ = ()
+
+    def to_json(self, cache: bool = False) -> str:
+        """Serialize to a JSON string.
+
+        Args:
+            cache: If True, encode once and return the memoized string on
+                   later calls.
+
+        Returns:
+            The JSON encoding of `to_dict()` by the current backend (see
+            `resokerr.jsonio.set_json_backend`). With the default stdlib
+            backend, the same string as ``json.dumps(self.to_dict())``.
+
+        Example:
+            >>> Ok(value=42).to_json()
+            '{"is_ok": true, "is_err": false, "value": 42, "messages": []}'
+        """
+        from .jsonio import dumps, get_json_backend
+        if cache:
+            # Keyed by backend, whose output may differ in whitespace
+            key = 'json:' + get_json_backend().name
+            return self._cached_serialization(key, lambda: dumps(self))  # type: ignore[arg-type]
+        return dumps(self)  # type: ignore[arg-type]
+
+    def write_json(self, fp: IO[Any], chunk_size: Optional[int] = None) -> None:
+        """Write the JSON serialization to a text or binary stream in chunks.
+
+        Args:
+            fp: A writable text or binary file-like object.
+            chunk_size: Approximate number of characters buffered per write.
+                        Defaults to `resokerr.jsonio.DEFAULT_CHUNK_SIZE`.
+        """
+        from .jsonio import DEFAULT_CHUNK_SIZE, dump
+        dump(self, fp, DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size)  # type: ignore[arg-type]
+
 class UnwrapValueMixin(Generic[V]):
     """Mixin for unwrapping values from Ok instances.
 
@@ -468,7 +2135,8 @@ class UnwrapValueMixin(Generic[V]):
     @overload
     def unwrap(self: HasValue[V], *, as_dict: Literal[True]) -> Dict[str, Any]: ...
 
-    def unwrap(self: HasValue[V], default: Optional[V] = None, as_dict: bool = False) -> Union[Optional[V], Dict[str, Any]]:
+    def unwrap(self: HasValue[V], default: Optional[V] = None, as_dict: bool = False,
+               budget: Optional[SerializationBudget] = None) -> Union[Optional[V], Dict[str, Any]]:
         """Unwrap the contained value.
 
         Returns the contained value if present, otherwise returns the
@@ -480,6 +2148,8 @@ class UnwrapValueMixin(Generic[V]):
             as_dict: If True, returns the value serialized as a dict-compatible
                      representation. JSON primitives are returned as-is, objects
                      with to_dict() have that method called, others become strings.
+            budget: Optional `SerializationBudget` bounding the serialized
+                    output (only used with as_dict=True).
 
         Returns:
             The contained value, the default, or None. If as_dict=True, returns
@@ -494,9 +2164,23 @@ class UnwrapValueMixin(Generic[V]):
         """
         result = self.value if self.value is not None else default
         if as_dict and result is not None:
-            return TypeUtils.serialize(result)
+            return TypeUtils.serialize(result, budget)
         return result
 
+    def iter_serialized(self: HasValue[V], chunk_items: int = 10_000) -> Iterator[Any]:
+        """Serialize the value in chunks of at most `chunk_items` items.
+
+        Streams a large list or dict value with flat memory use instead of
+        building its whole serialized form as ``unwrap(as_dict=True)``
+        does; see `TypeUtils.iter_serialized()`.
+
+        Example:
+            >>> ok = Ok(value=[{"row": i} for i in range(25_000)])
+            >>> [len(chunk) for chunk in ok.iter_serialized()]
+            [10000, 10000, 5000]
+        """
+        return TypeUtils.iter_serialized(self.value, chunk_items)
+
 
 class UnwrapCauseMixin(Generic[E]):
     """Mixin for unwrapping causes from Err instances.
@@ -520,7 +2204,8 @@ class UnwrapCauseMixin(Generic[E]):
     @overload
     def unwrap(self: HasCause[E], *, as_dict: Literal[True]) -> Any: ...
 
-    def unwrap(self: HasCause[E], default: Optional[E] = None, as_dict: bool = False) -> Union[Optional[E], Any]:
+    def unwrap(self: HasCause[E], default: Optional[E] = None, as_dict: bool = False,
+               budget: Optional[SerializationBudget] = None) -> Union[Optional[E], Any]:
         """Unwrap the contained cause.
 
         Returns the contained cause if present, otherwise returns the
@@ -532,6 +2217,8 @@ class UnwrapCauseMixin(Generic[E]):
             as_dict: If True, returns the cause serialized as a dict-compatible
                      representation. JSON primitives are returned as-is, objects
                      with to_dict() have that method called, others become strings.
+            budget: Optional `SerializationBudget` bounding the serialized
+                    output (only used with as_dict=True).
 
         Returns:
             The contained cause, the default, or None. If as_dict=True, returns
@@ -546,9 +2233,23 @@ class UnwrapCauseMixin(Generic[E]):
         """
         result = self.cause if self.cause is not None else default
         if as_dict and result is not None:
-            return TypeUtils.serialize(result)
+            return TypeUtils.serialize(result, budget)
         return result
 
+    def iter_serialized(self: HasCause[E], chunk_items: int = 10_000) -> Iterator[Any]:
+        """Serialize the cause in chunks of at most `chunk_items` items.
+
+        Streams a large list or dict cause with flat memory use instead of
+        building its whole serialized form as ``unwrap(as_dict=True)``
+        does; see `TypeUtils.iter_serialized()`.
+
+        Example:
+            >>> err = Err(cause=["first", "second", "third"])
+            >>> list(err.iter_serialized(chunk_items=2))
+            [['first', 'second'], ['third']]
+        """
+        return TypeUtils.iter_serialized(self.cause, chunk_items)
+
 
 class MapValueMixin(Generic[V, M]):
     """Mixin for mapping/transforming values in Ok instances.
@@ -581,16 +2282,8 @@ class MapValueMixin(Generic[V, M]):
             10
         """
         if self.value is not None:
-            return Ok(
-                value=f(self.value),
-                messages=self.messages,
-                metadata=self.metadata
-            )
-        return Ok(
-            value=None,
-            messages=self.messages,
-            metadata=self.metadata
-        )
+            return Ok._from_normalized(f(self.value), self._message_log, self.metadata)
+        return Ok._from_normalized(None, self._message_log, self.metadata)
 
 
 class MapCauseMixin(Generic[E, M]):
@@ -624,16 +2317,95 @@ class MapCauseMixin(Generic[E, M]):
             'bad'
         """
         if self.cause is not None:
-            return Err(
-                cause=f(self.cause),
-                messages=self.messages,
-                metadata=self.metadata
-            )
-        return Err(
-            cause=None,
-            messages=self.messages,
-            metadata=self.metadata
-        )
+            return Err._from_normalized(f(self.cause), self._message_log, self.metadata)
+        return Err._from_normalized(None, self._message_log, self.metadata)
+
+
+class ChainValueMixin(Generic[V, M]):
+    """Mixin for chaining fallible steps on Ok instances.
+
+    `and_then` runs the next step on the value; `or_else` and `map_err`
+    only act on Err, so an Ok passes through them unchanged.
+    """
+
+    def and_then(self: HasMappableValue[V, M],
+                 f: Callable[[Optional[V]], Union[Ok[T, M], Err[Any, M]]]) -> Union[Ok[T, M], Err[Any, M]]:
+        """Run a step returning a result on the contained value.
+
+        Unlike `map`, `f` is also called when the value is None. The
+        messages of this instance come first in the returned result,
+        followed by those of the step; metadata is merged, with the keys
+        of the step winning.
+
+        Args:
+            f: A callable taking the value and returning an Ok or Err.
+
+        Returns:
+            The result of `f`, carrying the messages and metadata of both.
+
+        Raises:
+            TypeError: If `f` does not return an Ok or Err.
+
+        Example:
+            >>> Ok(value="42").with_info("read").and_then(parse_int).messages
+            (MessageTrace(message='read', ...), ...)
+        """
+        return _chain_result(self._message_log, self.metadata, f(self.value))
+
+    def or_else(self, f: Callable[[Any], Union[Ok[Any, M], Err[Any, M]]]) -> Self:
+        """Return this instance: there is no error to recover from."""
+        return self
+
+    def map_err(self, f: Callable[[Any], Any]) -> Self:
+        """Return this instance: there is no cause to transform."""
+        return self
+
+    def inspect(self: HasMappableValue[V, M], f: Callable[[Optional[V]], Any]) -> Self:  # type: ignore[misc]
+        """Call `f` with the value (e.g. for logging) and return this instance unchanged."""
+        f(self.value)
+        return self  # type: ignore[return-value]
+
+
+class ChainCauseMixin(Generic[E, M]):
+    """Mixin for chaining fallible steps on Err instances.
+
+    `or_else` runs a recovery step on the cause and `map_err` transforms
+    it; `and_then` and `inspect` only act on Ok, so an Err passes through
+    them unchanged.
+    """
+
+    def and_then(self, f: Callable[[Any], Union[Ok[Any, M], Err[Any, M]]]) -> Self:
+        """Return this instance without calling `f`: the chain stops at the first Err."""
+        return self
+
+    def or_else(self: HasMappableCause[E, M],
+                f: Callable[[Optional[E]], Union[Ok[T, M], Err[Any, M]]]) -> Union[Ok[T, M], Err[Any, M]]:
+        """Run a recovery step returning a result on the contained cause.
+
+        Messages and metadata are merged as in `Ok.and_then`. ERROR
+        messages carried over into a recovered Ok are converted to
+        WARNING, as the Ok constructor does.
+
+        Args:
+            f: A callable taking the cause and returning an Ok or Err.
+
+        Returns:
+            The result of `f`, carrying the messages and metadata of both.
+
+        Raises:
+            TypeError: If `f` does not return an Ok or Err.
+        """
+        return _chain_result(self._message_log, self.metadata, f(self.cause))
+
+    def map_err(self: HasMappableCause[E, M], f: Callable[[E], T]) -> Err[T, M]:
+        """Apply a transformation function to the contained cause (same as `map`)."""
+        if self.cause is not None:
+            return Err._from_normalized(f(self.cause), self._message_log, self.metadata)
+        return Err._from_normalized(None, self._message_log, self.metadata)
+
+    def inspect(self, f: Callable[[Any], Any]) -> Self:
+        """Return this instance without calling `f`: there is no value to inspect."""
+        return self
 
 
 @final
@@ -645,6 +2417,8 @@ class Ok(Generic[V, M],
          WarningCollectorMixin[M],
          UnwrapValueMixin[V],
          MapValueMixin[V, M],
+         ChainValueMixin[V, M],
+         JsonMixin,
          StatusMixin,):
     """Represents a successful result.
     
@@ -662,22 +2436,23 @@ class Ok(Generic[V, M],
     metadata: Optional[Mapping[str, Any]] = None
     
     def __post_init__(self) -> None:
-        # Ensure messages are immutable tuples.
-        if not isinstance(self.messages, tuple):
-            object.__setattr__(self, 'messages', tuple(self.messages))
-        
         # Ensure metadata is immutable by converting to MappingProxyType.
         if self.metadata is not None and not isinstance(self.metadata, MappingProxyType):
             # Create a copy to prevent external modifications
             object.__setattr__(self, 'metadata', MappingProxyType(dict(self.metadata)))
 
+        # Ensure messages are immutable tuples.
+        if not isinstance(self.messages, tuple):
+            object.__setattr__(self, 'messages', tuple(self.messages))
+
         # Convert ERROR messages to WARNING (Ok cannot contain ERROR severity).
         # This preserves the message content while maintaining semantic correctness.
         converted_messages: list[MessageTrace[M]] = []
         for msg in self.messages:
             if msg.severity == TraceSeverityLevel.ERROR:
                 # Merge existing details with converted info
-                original_details = dict(msg.details) if msg.details else {}
+                packed = _get_trace_packed_details(msg)
+                original_details = dict(zip(packed[::2], packed[1::2])) if packed else {}
                 converted_info = {
                     "_converted_from": {
                         "from": TraceSeverityLevel.ERROR.value,
@@ -696,6 +2471,71 @@ class Ok(Generic[V, M],
             else:
                 converted_messages.append(msg)
         object.__setattr__(self, 'messages', tuple(converted_messages))
+        object.__setattr__(self, '_message_log', _MessageLog(self.messages))
+
+    @classmethod
+    def _from_normalized(cls, value: Optional[V], message_log: _MessageLog[M],
+                         metadata: Optional[Mapping[str, Any]]) -> Ok[V, M]:
+        """Build an Ok from parts of an already validated instance.
+
+        Internal fast path used by `map`, `with_*` and `with_metadata`. It
+        skips `__init__`/`__post_init__`, so the caller guarantees that
+        `message_log` holds no ERROR messages and that `metadata` is None or
+        an immutable MappingProxyType.
+        """
+        ok = object.__new__(cls)
+        object.__setattr__(ok, 'value', value)
+        object.__setattr__(ok, '_message_log', message_log)
+        object.__setattr__(ok, 'metadata', metadata)
+        return ok
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any],
+                  value_type: Optional[type] = None,
+                  message_type: Optional[type] = None,
+                  trusted: bool = False) -> Ok[Any, Any]:
+        """Rebuild an Ok from the output of `to_dict()`.
+
+        Args:
+            data: A dictionary as produced by `to_dict()`.
+            value_type: Optional type to rebuild the value with (see
+                        `TypeUtils.deserialize`).
+            message_type: Optional type to rebuild each message with.
+            trusted: Skip validation for data known to come from `to_dict()`.
+                     The `is_ok` flag is not checked, and messages are
+                     rebuilt directly and stored as-is, without the
+                     severity conversion done by the constructor.
+
+        Returns:
+            A new Ok instance.
+
+        Raises:
+            ValueError: If `data` is not a serialized Ok (unless `trusted`).
+
+        Example:
+            >>> Ok.from_dict(Ok(value=42).with_info("done").to_dict()).value
+            42
+        """
+        value = TypeUtils.deserialize(data.get("value"), value_type)
+        metadata = data.get("metadata")
+        if trusted:
+            messages = tuple([_trace_from_trusted_dict(message, message_type) for message in data.get("messages", ())])
+            if metadata is not None:
+                metadata = MappingProxyType(dict(metadata))
+            return cls._from_normalized(value, _MessageLog(messages), metadata)
+
+        if data.get("is_ok") is not True:
+            raise ValueError("Data does not describe an Ok result")
+        messages = tuple([MessageTrace.from_dict(message, message_type) for message in data.get("messages", ())])
+        return cls(value=value, messages=messages, metadata=metadata)
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        """Pickle the value, messages and metadata (as a plain dict), leaving
+        out trailing empty parts. MappingProxyType itself cannot be pickled.
+
+        With protocol 5, a bytes-like value is sent as a `pickle.PickleBuffer`,
+        so it can travel out-of-band (see `_reduce_result`)."""
+        return _reduce_result(Ok, self.value, self._message_log, self.metadata, protocol)
 
     def has_value(self) -> bool:
         """Check if value is present."""
@@ -705,50 +2545,67 @@ class Ok(Generic[V, M],
                      details: Optional[Dict[str, Any]] = None,
                      stack_trace: Optional[str] = None) -> Self:
         """Add a success message and return a new Ok instance."""
-        new_message = MessageTrace[M].success(message, code, details, stack_trace)
-        return Ok(
-            value=self.value,
-            messages=self.messages + (new_message,),
-            metadata=self.metadata
-        )
+        new_message = MessageTrace.success(message, code, details, stack_trace)
+        return Ok._from_normalized(self.value, self._message_log.append(new_message), self.metadata)
     
     def with_info(self, message: M, code: Optional[str] = None,
                   details: Optional[Dict[str, Any]] = None,
                   stack_trace: Optional[str] = None) -> Self:
         """Add an info message and return a new Ok instance."""
-        new_message = MessageTrace[M].info(message, code, details, stack_trace)
-        return Ok(
-            value=self.value,
-            messages=self.messages + (new_message,),
-            metadata=self.metadata
-        )
+        new_message = MessageTrace.info(message, code, details, stack_trace)
+        return Ok._from_normalized(self.value, self._message_log.append(new_message), self.metadata)
     
     def with_warning(self, message: M, code: Optional[str] = None,
                      details: Optional[Dict[str, Any]] = None,
                      stack_trace: Optional[str] = None) -> Self:
         """Add a warning message and return a new Ok instance."""
-        new_message = MessageTrace[M].warning(message, code, details, stack_trace)
-        return Ok(
-            value=self.value,
-            messages=self.messages + (new_message,),
-            metadata=self.metadata
-        )
+        new_message = MessageTrace.warning(message, code, details, stack_trace)
+        return Ok._from_normalized(self.value, self._message_log.append(new_message), self.metadata)
     
     def with_metadata(self, metadata: Mapping[str, Any]) -> Self:
         """Return a new Ok instance with replaced metadata."""
-        return Ok(
-            value=self.value,
-            messages=self.messages,
-            metadata=metadata
-        )
+        if metadata is not None and not isinstance(metadata, MappingProxyType):
+            # Create a copy to prevent external modifications
+            metadata = MappingProxyType(dict(metadata))
+        return Ok._from_normalized(self.value, self._message_log, metadata)
 
-    def to_dict(self) -> Dict[str, Any]:
+    @overload
+    def to_dict(self) -> Dict[str, Any]: ...
+
+    @overload
+    def to_dict(self, cache: Literal[False]) -> Dict[str, Any]: ...
+
+    @overload
+    def to_dict(self, cache: Literal[True]) -> Mapping[str, Any]: ...
+
+    @overload
+    def to_dict(self, *, options: Optional[SerializationOptions] = None,
+                budget: Optional[SerializationBudget] = None) -> Dict[str, Any]: ...
+
+    def to_dict(self, cache: bool = False,
+                options: Optional[SerializationOptions] = None,
+                budget: Optional[SerializationBudget] = None) -> Union[Dict[str, Any], Mapping[str, Any]]:
         """Serialize Ok to a dictionary.
 
         Creates a serializable dictionary representation of the
         Ok instance. Optional fields (metadata) are only included
         if they have non-None values.
 
+        An object referenced from several places within the value (or
+        within the metadata) is serialized once, and its occurrences in
+        the output are the same object (see `TypeUtils.serialize`).
+
+        Args:
+            cache: If True, serialize once and return the memoized output
+                   on later calls, as dicts and lists that raise TypeError
+                   on mutation (equal to, and encodable like, the uncached
+                   output). Cannot be combined with `options` or `budget`.
+            options: Optional `SerializationOptions` projecting and filtering
+                     the output (minimum severity, fields, message count,
+                     compact keys).
+            budget: Optional `SerializationBudget` bounding the output size;
+                    the value, messages and metadata share one budget.
+
         Returns:
             A dictionary with the following structure:
             {
@@ -764,6 +2621,14 @@ class Ok(Generic[V, M],
             >>> ok.to_dict()
             {'is_ok': True, 'is_err': False, 'value': 42, 'messages': [{'message': 'done', 'severity': 'info'}]}
         """
+        if options is not None or budget is not None:
+            if cache:
+                raise ValueError("to_dict() cannot cache output produced with options or a budget")
+            return (options or _DEFAULT_OPTIONS)._result_to_dict(
+                self, True, self.value, None if budget is None else _BudgetWalk(budget))
+        if cache:
+            return self._cached_serialization('dict', lambda: _freeze_serialized(self.to_dict()))
+
         result: Dict[str, Any] = {
             "is_ok": True,
             "is_err": False,
@@ -787,6 +2652,8 @@ class Err(Generic[E, M],
           WarningCollectorMixin[M],
           UnwrapCauseMixin[E],
           MapCauseMixin[E, M],
+          ChainCauseMixin[E, M],
+          JsonMixin,
           StatusMixin,):
     """Represents an error result.
     
@@ -799,28 +2666,41 @@ class Err(Generic[E, M],
     
     Err instances can contain multiple message types to provide rich
     diagnostic information for debugging and error reporting.
+
+    Pass ``detach_traceback=True`` when the cause is an exception that may
+    outlive the failed call: its traceback (and the frames and locals it
+    keeps alive) is replaced with a summary of file, line and function
+    for each frame, see `TypeUtils.detach_traceback()`.
     """
     cause: Optional[E]
     messages: Tuple[MessageTrace[M], ...] = field(default_factory=tuple)
     metadata: Optional[Mapping[str, Any]] = None
+    detach_traceback: InitVar[bool] = False
+
+    # Positional patterns match the fields only, as for Ok
+    __match_args__ = ('cause', 'messages', 'metadata')
     
-    def __post_init__(self) -> None:
-        # Ensure messages are immutable tuples.
-        if not isinstance(self.messages, tuple):
-            object.__setattr__(self, 'messages', tuple(self.messages))
-        
+    def __post_init__(self, detach_traceback: bool = False) -> None:
+        if detach_traceback and isinstance(self.cause, BaseException):
+            TypeUtils.detach_traceback(self.cause)
+
         # Ensure metadata is immutable by converting to MappingProxyType.
         if self.metadata is not None and not isinstance(self.metadata, MappingProxyType):
             # Create a copy to prevent external modifications
             object.__setattr__(self, 'metadata', MappingProxyType(dict(self.metadata)))
-        
+
+        # Ensure messages are immutable tuples.
+        if not isinstance(self.messages, tuple):
+            object.__setattr__(self, 'messages', tuple(self.messages))
+
         # Convert SUCCESS messages to INFO (Err cannot contain SUCCESS severity).
         # This preserves the message content while maintaining semantic correctness.
         converted_messages: list[MessageTrace[M]] = []
         for msg in self.messages:
             if msg.severity == TraceSeverityLevel.SUCCESS:
                 # Merge existing details with converted info
-                original_details = dict(msg.details) if msg.details else {}
+                packed = _get_trace_packed_details(msg)
+                original_details = dict(zip(packed[::2], packed[1::2])) if packed else {}
                 converted_info = {
                     "_converted_from": {
                         "from": TraceSeverityLevel.SUCCESS.value,
@@ -839,7 +2719,72 @@ class Err(Generic[E, M],
             else:
                 converted_messages.append(msg)
         object.__setattr__(self, 'messages', tuple(converted_messages))
+        object.__setattr__(self, '_message_log', _MessageLog(self.messages))
     
+    @classmethod
+    def _from_normalized(cls, cause: Optional[E], message_log: _MessageLog[M],
+                         metadata: Optional[Mapping[str, Any]]) -> Err[E, M]:
+        """Build an Err from parts of an already validated instance.
+
+        Internal fast path used by `map`, `with_*` and `with_metadata`. It
+        skips `__init__`/`__post_init__`, so the caller guarantees that
+        `message_log` holds no SUCCESS messages and that `metadata` is None or
+        an immutable MappingProxyType.
+        """
+        err = object.__new__(cls)
+        object.__setattr__(err, 'cause', cause)
+        object.__setattr__(err, '_message_log', message_log)
+        object.__setattr__(err, 'metadata', metadata)
+        return err
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any],
+                  cause_type: Optional[type] = None,
+                  message_type: Optional[type] = None,
+                  trusted: bool = False) -> Err[Any, Any]:
+        """Rebuild an Err from the output of `to_dict()`.
+
+        Args:
+            data: A dictionary as produced by `to_dict()`.
+            cause_type: Optional type to rebuild the cause with (see
+                        `TypeUtils.deserialize`).
+            message_type: Optional type to rebuild each message with.
+            trusted: Skip validation for data known to come from `to_dict()`.
+                     The `is_err` flag is not checked, and messages are
+                     rebuilt directly and stored as-is, without the
+                     severity conversion done by the constructor.
+
+        Returns:
+            A new Err instance.
+
+        Raises:
+            ValueError: If `data` is not a serialized Err (unless `trusted`).
+
+        Example:
+            >>> Err.from_dict(Err(cause="missing").with_info("done").to_dict()).cause
+            'missing'
+        """
+        cause = TypeUtils.deserialize(data.get("cause"), cause_type)
+        metadata = data.get("metadata")
+        if trusted:
+            messages = tuple([_trace_from_trusted_dict(message, message_type) for message in data.get("messages", ())])
+            if metadata is not None:
+                metadata = MappingProxyType(dict(metadata))
+            return cls._from_normalized(cause, _MessageLog(messages), metadata)
+
+        if data.get("is_err") is not True:
+            raise ValueError("Data does not describe an Err result")
+        messages = tuple([MessageTrace.from_dict(message, message_type) for message in data.get("messages", ())])
+        return cls(cause=cause, messages=messages, metadata=metadata)
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        """Pickle the cause, messages and metadata (as a plain dict), leaving
+        out trailing empty parts. MappingProxyType itself cannot be pickled.
+
+        With protocol 5, a bytes-like cause is sent as a `pickle.PickleBuffer`,
+        so it can travel out-of-band (see `_reduce_result`)."""
+        return _reduce_result(Err, self.cause, self._message_log, self.metadata, protocol)
+
     def has_cause(self) -> bool:
         """Check if cause is present."""
         return self.cause is not None
@@ -848,50 +2793,67 @@ class Err(Generic[E, M],
                    details: Optional[Dict[str, Any]] = None,
                    stack_trace: Optional[str] = None) -> Self:
         """Add an error message and return a new Err instance."""
-        new_message = MessageTrace[M].error(message, code, details, stack_trace)
-        return Err(
-            cause=self.cause,
-            messages=self.messages + (new_message,),
-            metadata=self.metadata
-        )
+        new_message = MessageTrace.error(message, code, details, stack_trace)
+        return Err._from_normalized(self.cause, self._message_log.append(new_message), self.metadata)
     
     def with_info(self, message: M, code: Optional[str] = None,
                   details: Optional[Dict[str, Any]] = None,
                   stack_trace: Optional[str] = None) -> Self:
         """Add an info message and return a new Err instance."""
-        new_message = MessageTrace[M].info(message, code, details, stack_trace)
-        return Err(
-            cause=self.cause,
-            messages=self.messages + (new_message,),
-            metadata=self.metadata
-        )
+        new_message = MessageTrace.info(message, code, details, stack_trace)
+        return Err._from_normalized(self.cause, self._message_log.append(new_message), self.metadata)
     
     def with_warning(self, message: M, code: Optional[str] = None,
                      details: Optional[Dict[str, Any]] = None,
                      stack_trace: Optional[str] = None) -> Self:
         """Add a warning message and return a new Err instance."""
-        new_message = MessageTrace[M].warning(message, code, details, stack_trace)
-        return Err(
-            cause=self.cause,
-            messages=self.messages + (new_message,),
-            metadata=self.metadata
-        )
+        new_message = MessageTrace.warning(message, code, details, stack_trace)
+        return Err._from_normalized(self.cause, self._message_log.append(new_message), self.metadata)
     
     def with_metadata(self, metadata: Mapping[str, Any]) -> Self:
         """Return a new Err instance with replaced metadata."""
-        return Err(
-            cause=self.cause,
-            messages=self.messages,
-            metadata=metadata
-        )
+        if metadata is not None and not isinstance(metadata, MappingProxyType):
+            # Create a copy to prevent external modifications
+            metadata = MappingProxyType(dict(metadata))
+        return Err._from_normalized(self.cause, self._message_log, metadata)
 
-    def to_dict(self) -> Dict[str, Any]:
+    @overload
+    def to_dict(self) -> Dict[str, Any]: ...
+
+    @overload
+    def to_dict(self, cache: Literal[False]) -> Dict[str, Any]: ...
+
+    @overload
+    def to_dict(self, cache: Literal[True]) -> Mapping[str, Any]: ...
+
+    @overload
+    def to_dict(self, *, options: Optional[SerializationOptions] = None,
+                budget: Optional[SerializationBudget] = None) -> Dict[str, Any]: ...
+
+    def to_dict(self, cache: bool = False,
+                options: Optional[SerializationOptions] = None,
+                budget: Optional[SerializationBudget] = None) -> Union[Dict[str, Any], Mapping[str, Any]]:
         """Serialize Err to a dictionary.
 
         Creates a serializable dictionary representation of the
         Err instance. Optional fields (metadata) are only included
         if they have non-None values.
 
+        An object referenced from several places within the cause (or
+        within the metadata) is serialized once, and its occurrences in
+        the output are the same object (see `TypeUtils.serialize`).
+
+        Args:
+            cache: If True, serialize once and return the memoized output
+                   on later calls, as dicts and lists that raise TypeError
+                   on mutation (equal to, and encodable like, the uncached
+                   output). Cannot be combined with `options` or `budget`.
+            options: Optional `SerializationOptions` projecting and filtering
+                     the output (minimum severity, fields, message count,
+                     compact keys).
+            budget: Optional `SerializationBudget` bounding the output size;
+                    the cause, messages and metadata share one budget.
+
         Returns:
             A dictionary with the following structure:
             {
@@ -907,6 +2869,14 @@ class Err(Generic[E, M],
             >>> err.to_dict()
             {'is_ok': False, 'is_err': True, 'cause': 'not found', 'messages': [{'message': 'failed', 'severity': 'error'}]}
         """
+        if options is not None or budget is not None:
+            if cache:
+                raise ValueError("to_dict() cannot cache output produced with options or a budget")
+            return (options or _DEFAULT_OPTIONS)._result_to_dict(
+                self, False, self.cause, None if budget is None else _BudgetWalk(budget))
+        if cache:
+            return self._cached_serialization('dict', lambda: _freeze_serialized(self.to_dict()))
+
         result: Dict[str, Any] = {
             "is_ok": False,
             "is_err": True,
@@ -921,10 +2891,268 @@ class Err(Generic[E, M],
         return result
 
 
+# Payload types sent as raw buffers: out-of-band with pickle protocol 5,
+# and through the buffer list of the binary codec.
+_BUFFER_TYPES = frozenset((bytes, bytearray, memoryview, array.array))
+
+
+def _buffer_layout(obj: Any) -> Tuple[Any, Optional[Tuple[str, Tuple[int, ...]]]]:
+    """Return a contiguous buffer exporter for `obj` and its item layout.
+
+    The layout is None for plain byte buffers, otherwise the format and
+    shape a memoryview over the raw bytes is cast back to. Non-contiguous
+    memoryviews are copied, since only contiguous memory can be exported.
+    """
+    view = memoryview(obj)
+    if not view.c_contiguous:
+        obj = view.tobytes()
+    if view.format in ('B', 'b', 'c') and view.ndim == 1:
+        return obj, None
+    layout = (view.format, view.shape)
+    try:
+        _cast_view(obj, layout)
+    except (TypeError, ValueError):
+        # Formats memoryview.cast() cannot restore come back as raw bytes
+        return obj, None
+    return obj, layout
+
+
+def _cast_view(buffer: Any, layout: Optional[Tuple[str, Tuple[int, ...]]]) -> memoryview:
+    view = memoryview(buffer)
+    if layout is None:
+        return view if view.format == 'B' and view.ndim == 1 else view.cast('B')
+    format, shape = layout
+    if view.format == format and view.shape == shape:
+        return view
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view.cast(format, shape)
+
+
+def _reduce_result(cls: type, payload: Any, message_log: _MessageLog[Any],
+                   metadata: Optional[Mapping[str, Any]],
+                   protocol: Optional[int] = None) -> Tuple[Any, ...]:
+    """Build the pickle reduction shared by Ok and Err.
+
+    bytes, bytearray, memoryview and array.array payloads are wrapped in a
+    `pickle.PickleBuffer` with protocol 5, so that ``pickle.dumps(...,
+    buffer_callback=...)`` hands them over out-of-band instead of copying
+    them into the stream. Memoryviews, which cannot be pickled otherwise,
+    are sent as bytes with older protocols.
+    """
+    if type(payload) in _BUFFER_TYPES and (type(payload) is memoryview
+                                           or (protocol is not None and protocol >= 5)):
+        buffer, layout = _buffer_layout(payload)
+        if protocol is not None and protocol >= 5:
+            buffer = pickle.PickleBuffer(buffer)
+        else:
+            buffer = memoryview(buffer).tobytes()
+        restore: Union[type, str]
+        if type(payload) in (bytes, bytearray):
+            restore = type(payload)
+        elif type(payload) is array.array:
+            restore = payload.typecode
+        else:
+            restore = memoryview
+        state: Tuple[Any, ...] = (cls, buffer, restore, layout)
+        if metadata is not None:
+            return (_unpickle_buffer_result, (*state, message_log.as_tuple(), dict(metadata)))
+        if len(message_log):
+            return (_unpickle_buffer_result, (*state, message_log.as_tuple()))
+        return (_unpickle_buffer_result, state)
+    if metadata is not None:
+        return (_unpickle_result, (cls, payload, message_log.as_tuple(), dict(metadata)))
+    if len(message_log):
+        return (_unpickle_result, (cls, payload, message_log.as_tuple()))
+    return (_unpickle_result, (cls, payload))
+
+
+def _unpickle_result(cls: Any, payload: Any, messages: Tuple[MessageTrace[Any], ...] = (),
+                     metadata: Optional[Dict[str, Any]] = None) -> Union[Ok[Any, Any], Err[Any, Any]]:
+    """Rebuild an Ok or Err pickled by `__reduce_ex__`.
+
+    The state comes from an already validated instance, so it goes through
+    the `_from_normalized` fast path; metadata is frozen again.
+    """
+    if metadata is not None:
+        metadata = MappingProxyType(metadata)  # type: ignore[assignment]
+    return cls._from_normalized(payload, _MessageLog(messages), metadata)
+
+
+def _unpickle_buffer_result(cls: Any, buffer: Any, restore: Union[type, str],
+                            layout: Optional[Tuple[str, Tuple[int, ...]]],
+                            messages: Tuple[MessageTrace[Any], ...] = (),
+                            metadata: Optional[Dict[str, Any]] = None) -> Union[Ok[Any, Any], Err[Any, Any]]:
+    """Rebuild an Ok or Err whose payload was pickled as a buffer.
+
+    `buffer` is whatever the unpickler provides: the bytes or bytearray read
+    from the stream, or the object passed in ``pickle.loads(...,
+    buffers=...)`` for out-of-band data. `restore` is the payload type for
+    bytes and bytearray, the typecode for an array.array, and memoryview
+    otherwise.
+
+    A bytes or bytearray payload that comes back as the same type is used
+    as-is, and an array.array read from the stream (or passed back as
+    bytes or bytearray) is rebuilt from its items, so in-band data keeps
+    its type whatever the protocol. Anything else is wrapped in a
+    memoryview over the same memory, cast to the original item format.
+    """
+    if type(buffer) is restore:
+        payload = buffer
+    elif type(restore) is str and type(buffer) in (bytes, bytearray):
+        payload = array.array(restore, buffer)
+    else:
+        payload = _cast_view(buffer, layout)
+    return _unpickle_result(cls, payload, messages, metadata)
+
+
+def _merge_metadata(first: Optional[Mapping[str, Any]],
+                    second: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return MappingProxyType({**first, **second})
+
+
+def _result_from_parts(is_ok: bool, payload: Any, log: _MessageLog[Any],
+                       metadata: Optional[Mapping[str, Any]]) -> Union[Ok[Any, Any], Err[Any, Any]]:
+    """Build an Ok or Err from a merged message log and frozen metadata.
+
+    Messages an Ok or Err may not hold (ERROR in Ok, SUCCESS in Err) are
+    converted by the constructor; otherwise the fast path is used.
+    """
+    if is_ok:
+        if log.has_severity(TraceSeverityLevel.ERROR):
+            return Ok(value=payload, messages=log.as_tuple(), metadata=metadata)
+        return Ok._from_normalized(payload, log, metadata)
+    if log.has_severity(TraceSeverityLevel.SUCCESS):
+        return Err(cause=payload, messages=log.as_tuple(), metadata=metadata)
+    return Err._from_normalized(payload, log, metadata)
+
+
+def _with_log(result: Union[Ok[Any, Any], Err[Any, Any]], log: _MessageLog[Any],
+              metadata: Optional[Mapping[str, Any]]) -> Union[Ok[Any, Any], Err[Any, Any]]:
+    """Rebuild `result` with a merged message log and metadata."""
+    if isinstance(result, Ok):
+        return _result_from_parts(True, result.value, log, metadata)
+    return _result_from_parts(False, result.cause, log, metadata)
+
+
+def _check_step_result(result: Any, step: Any) -> None:
+    if not isinstance(result, (Ok, Err)):
+        raise TypeError(f"Step {getattr(step, '__qualname__', step)!r} must return Ok or Err, "
+                        f"not {type(result).__name__}")
+
+
+def _chain_result(log: _MessageLog[Any], metadata: Optional[Mapping[str, Any]],
+                  result: Any) -> Union[Ok[Any, Any], Err[Any, Any]]:
+    """Prepend `log` and merge `metadata` into the result of a chained step."""
+    _check_step_result(result, 'and_then/or_else')
+    if not len(log) and metadata is None:
+        return result
+    result_log = result._message_log
+    return _with_log(result, log.extend(result_log),
+                     _merge_metadata(metadata, result.metadata))
+
+
+def pipeline(*steps: Callable[[Any], Union[Ok[Any, Any], Err[Any, Any]]]
+             ) -> Callable[[Any], Union[Ok[Any, Any], Err[Any, Any]]]:
+    """Compose steps returning results into one function of the initial value.
+
+    The composed function passes the value of each Ok to the next step
+    and stops at the first Err. The result it returns carries the
+    messages of every step that ran, in order, and their merged metadata;
+    it is built once at the end, and the messages of all steps are copied
+    once into a single list rather than concatenated step by step. When
+    only the last step has messages or metadata, its result is returned
+    as-is.
+
+    Args:
+        steps: Callables taking a value and returning an Ok or Err.
+
+    Returns:
+        A callable taking the initial value. With no steps, it returns
+        ``Ok(value=value)``.
+
+    Raises:
+        TypeError: (When called) if a step does not return an Ok or Err.
+
+    Example:
+        >>> load_user = pipeline(parse_id, fetch_user, check_active)
+        >>> result = load_user("42")
+        >>> Ok(value="42").and_then(load_user)  # also works as a step
+    """
+    def run(value: Any) -> Union[Ok[Any, Any], Err[Any, Any]]:
+        result: Union[Ok[Any, Any], Err[Any, Any]] = Ok._from_normalized(value, _MessageLog(), None)
+        logs: list[_MessageLog[Any]] = []
+        metadata: Optional[Mapping[str, Any]] = None
+        for step in steps:
+            result = step(value)
+            if type(result) is Ok:
+                value = result.value
+            elif type(result) is not Err:
+                _check_step_result(result, step)
+            result_log = result._message_log
+            if result_log._length:
+                logs.append(result_log)
+            if result.metadata is not None:
+                metadata = _merge_metadata(metadata, result.metadata)
+            if type(result) is Err:
+                break
+        if ((not logs or (len(logs) == 1 and logs[0] is result._message_log))
+                and (metadata is None or metadata is result.metadata)):
+            # Everything came from the last result
+            return result
+        return _with_log(result, _MessageLog.concat(logs) if logs else _MessageLog(), metadata)
+
+    return run
+
+
 # Type alias
 ResultBase: TypeAlias = Union[Ok[V, M], Err[E, M]] # Flexible and generic result type for complex scenarios
 Result: TypeAlias = Union[Ok[V, str], Err[E, str]] # Common and typical result type with string messages
 
+
+
+def result_from_dict(data: Mapping[str, Any],
+                     value_type: Optional[type] = None,
+                     cause_type: Optional[type] = None,
+                     message_type: Optional[type] = None,
+                     trusted: bool = False) -> Union[Ok[Any, Any], Err[Any, Any]]:
+    """Rebuild an Ok or Err from the output of `to_dict()`.
+
+    The `is_ok`/`is_err` flags select the result type; the remaining
+    arguments are passed to `Ok.from_dict` or `Err.from_dict`.
+
+    Raises:
+        ValueError: If `data` is not a serialized result.
+    """
+    if data.get("is_ok") is True:
+        return Ok.from_dict(data, value_type, message_type, trusted)
+    if data.get("is_err") is True:
+        return Err.from_dict(data, cause_type, message_type, trusted)
+    raise ValueError("Data does not describe an Ok or Err result")
+
+
+def result_from_json(text: Union[str, bytes],
+                     value_type: Optional[type] = None,
+                     cause_type: Optional[type] = None,
+                     message_type: Optional[type] = None,
+                     trusted: bool = False) -> Union[Ok[Any, Any], Err[Any, Any]]:
+    """Rebuild an Ok or Err from the output of `to_json()`.
+
+    The text is parsed with the current JSON backend (see
+    `resokerr.jsonio.set_json_backend`).
+
+    Example:
+        >>> result_from_json(Ok(value=[1, 2]).with_info("loaded").to_json())
+        Ok(value=[1, 2], messages=(MessageTrace(message='loaded', ...),), metadata=None)
+    """
+    from .jsonio import get_json_backend
+    return result_from_dict(get_json_backend().loads(text), value_type, cause_type, message_type, trusted)
+
+
 __all__ = [
     "Ok",
     "Err",
@@ -932,4 +3160,18 @@ __all__ = [
     "ResultBase",
     "MessageTrace",
     "TraceSeverityLevel",
+    "register_serializer",
+    "unregister_serializer",
+    "invalidate_serializer",
+    "register_deserializer",
+    "unregister_deserializer",
+    "enable_serialization_profile",
+    "disable_serialization_profile",
+    "serialization_profile",
+    "SerializationOptions",
+    "SerializationBudget",
+    "configure_exception_serialization",
+    "pipeline",
+    "result_from_dict",
+    "result_from_json",
 ]
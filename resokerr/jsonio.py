@@ -0,0 +1,476 @@
+"""Streaming JSON encoding for Ok/Err results.
+
+The output is byte-for-byte identical to ``json.dumps(result.to_dict())``,
+but it is produced while walking the result: values, causes and metadata
+are encoded with the same rules as `TypeUtils.serialize` without building
+the intermediate dict tree, and the text is handed to the stream in
+chunks of roughly `chunk_size` characters.
+
+The JSON library behind `to_json()`, `write_json()`, the NDJSON writers
+and `result_from_json()` is pluggable (see `set_json_backend`). The
+stdlib backend is the default and uses the streaming encoder above;
+other backends encode the `to_dict()` output in one call. The
+``RESOKERR_JSON_BACKEND`` environment variable selects a backend when
+this module is imported ("auto" picks the fastest one installed).
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import warnings
+from collections.abc import Mapping
+from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii
+from math import isfinite
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+from .core import Err, Ok, TypeUtils, _ExpandingHandler, _container_entries, _type_serializers
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Encoder with the same settings as a bare json.dumps() call
+_encode = json.JSONEncoder().encode
+
+_INFINITY = float('inf')
+
+# Containers holding at most this many nested items are serialized and
+# encoded in one go, which lets the C encoder do the work; larger ones are
+# streamed item by item.
+_INLINE_BUDGET = 64
+
+
+def _fits_inline(obj: Any, budget: int = _INLINE_BUDGET) -> bool:
+    """Check whether a container holds at most `budget` nested items."""
+    pending = [obj]
+    while pending:
+        container = pending.pop()
+        budget -= len(container)
+        if budget < 0:
+            return False
+        # Mapping also covers the read-only metadata view
+        children = container.values() if isinstance(container, Mapping) else container
+        for child in children:
+            if isinstance(child, (dict, list, tuple)):
+                pending.append(child)
+    return True
+
+
+def _nested_entries(obj: Any) -> Tuple[Iterator[Any], bool]:
+    """Return the entries of a container `_encode_if_small` declined to encode."""
+    cls = type(obj)
+    handler = _type_serializers.get(cls) or TypeUtils._resolve_serializer(cls)
+    entries, is_dict, _ = _container_entries(handler, obj)  # type: ignore[misc]
+    return entries, is_dict
+
+
+def _float_to_json(value: float) -> str:
+    """Encode a float the way the json module does."""
+    if value != value:
+        return 'NaN'
+    if value == _INFINITY:
+        return 'Infinity'
+    if value == -_INFINITY:
+        return '-Infinity'
+    return float.__repr__(value)
+
+
+def _key_to_json(key: Any) -> str:
+    """Encode a dict key the way the json module does."""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if isinstance(key, float):
+        return '"' + _float_to_json(key) + '"'
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
+
+
+def _encode_if_small(obj: Any) -> Optional[str]:
+    """Encode ``TypeUtils.serialize(obj)`` in one go, unless `obj` is a large container.
+
+    Returns None for dicts/lists/tuples that should be streamed item by item.
+    """
+    cls = type(obj)
+    handler = _type_serializers.get(cls)
+    if handler is None:
+        handler = TypeUtils._resolve_serializer(cls)
+
+    if handler is TypeUtils._serialize_primitive:
+        # Exact primitive types are by far the most common leaves
+        if cls is str:
+            return encode_basestring_ascii(obj)
+        if obj is None:
+            return 'null'
+        if cls is int:
+            return int.__repr__(obj)
+        return _encode(obj)
+    if handler is TypeUtils._serialize_dict or handler is TypeUtils._serialize_sequence:
+        return _encode(handler(obj)) if _fits_inline(obj) else None
+    if type(handler) is _ExpandingHandler:
+        # Records made only of primitives are encoded from their compiled
+        # plan; other profile containers (dataclasses, sets, ...) are walked
+        # like dicts and lists, so cycles through them are cut as in to_dict().
+        plan = handler.plan
+        if plan is not None:
+            value = plan(obj)
+            if value is not None:
+                return _encode(value)
+        return None
+    # Handler output (to_dict(), exceptions, str fallback, custom handlers)
+    # is already JSON-compatible and is encoded as-is.
+    return _encode(handler(obj))
+
+
+class _JsonStreamWriter:
+    """Buffers encoded JSON text and hands it to `write` in chunks."""
+
+    __slots__ = ('_write', '_chunk_size', '_parts', '_size')
+
+    def __init__(self, write: Callable[[str], Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._write = write
+        self._chunk_size = chunk_size
+        self._parts: List[str] = []
+        self._size = 0
+
+    def emit(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            self._write(''.join(self._parts))
+            self._parts.clear()
+            self._size = 0
+
+    def write_serialized(self, obj: Any) -> None:
+        """Write `obj` encoded as ``TypeUtils.serialize(obj)`` would be."""
+        encoded = _encode_if_small(obj)
+        if encoded is not None:
+            self.emit(encoded)
+        else:
+            self._write_nested(obj, *_nested_entries(obj))
+
+    def write_serialized_sequence(self, obj: Any) -> None:
+        """Write a list/tuple whose items are serialized with TypeUtils rules."""
+        self._write_nested(obj, iter(obj), False)
+
+    def write_serialized_dict(self, obj: Any) -> None:
+        """Write a dict whose values are serialized with TypeUtils rules."""
+        self._write_nested(obj, iter(obj.items()), True)
+
+    def _write_nested(self, root: Any, entries: Iterator[Any], is_dict: bool) -> None:
+        """Walk nested containers with an explicit stack.
+
+        Like `TypeUtils.serialize`, a container met again inside itself is
+        written as `TypeUtils.CYCLE_MARKER`.
+        """
+        emit = self.emit
+        cycle_marker = _encode(TypeUtils.CYCLE_MARKER)
+        active = {id(root)}
+        # Frames: [container id, entries iterator, is_dict, first entry pending]
+        stack = [[id(root), entries, is_dict, True]]
+        emit('{' if is_dict else '[')
+        while stack:
+            frame = stack[-1]
+            entries = frame[1]
+            is_dict = frame[2]
+            for entry in entries:
+                if frame[3]:
+                    prefix = ''
+                    frame[3] = False
+                else:
+                    prefix = ', '
+                if is_dict:
+                    key, child = entry
+                    prefix += _key_to_json(key) + ': '
+                else:
+                    child = entry
+                if id(child) in active:
+                    emit(prefix + cycle_marker)
+                    continue
+                encoded = _encode_if_small(child)
+                if encoded is not None:
+                    emit(prefix + encoded)
+                    continue
+                child_entries, child_is_dict = _nested_entries(child)
+                emit(prefix + ('{' if child_is_dict else '['))
+                active.add(id(child))
+                stack.append([id(child), child_entries, child_is_dict, True])
+                break
+            else:
+                emit('}' if is_dict else ']')
+                stack.pop()
+                active.discard(frame[0])
+
+    def write_result(self, result: Union[Ok[Any, Any], Err[Any, Any]]) -> None:
+        """Write the JSON form of ``result.to_dict()``.
+
+        Small parts are concatenated and emitted together, so a typical
+        result costs only a handful of buffer appends.
+        """
+        if isinstance(result, Ok):
+            head = '{"is_ok": true, "is_err": false, "value": '
+            payload = result.value
+        else:
+            head = '{"is_ok": false, "is_err": true, "cause": '
+            payload = result.cause
+
+        encoded = _encode_if_small(payload)
+        if encoded is None:
+            self.emit(head)
+            self.write_serialized(payload)
+            pending = ', "messages": ['
+        else:
+            pending = head + encoded + ', "messages": ['
+
+        messages = result.messages
+        if len(messages) <= _INLINE_BUDGET:
+            pending += ', '.join([_encode(message.to_dict()) for message in messages]) + ']'
+        else:
+            self.emit(pending)
+            self.emit(_encode(messages[0].to_dict()))
+            for message in messages[1:]:
+                self.emit(', ' + _encode(message.to_dict()))
+            pending = ']'
+
+        metadata = result.metadata
+        if metadata is None:
+            self.emit(pending + '}')
+            return
+        pending += ', "metadata": '
+        if (_type_serializers.get(dict) or TypeUtils._resolve_serializer(dict)) is TypeUtils._serialize_dict:
+            # Walk the read-only view directly instead of copying it
+            if _fits_inline(metadata):
+                self.emit(pending + _encode(TypeUtils._serialize_dict(metadata)) + '}')
+                return
+            self.emit(pending)
+            self.write_serialized_dict(metadata)
+        else:
+            self.emit(pending)
+            self.write_serialized(dict(metadata))
+        self.emit('}')
+
+
+@dataclass(frozen=True, slots=True)
+class JSONBackend:
+    """A JSON library used for the JSON output and input of results.
+
+    Attributes:
+        name: Name the backend is registered under.
+        dumps: Encodes `to_dict()` output to a str: plain dicts, lists and
+               JSON primitives, where dict keys may also be int, float,
+               bool or None and are written as strings like ``json.dumps``
+               does.
+        loads: Decodes a str or bytes JSON document.
+    """
+    name: str
+    dumps: Callable[[Any], str]
+    loads: Callable[[Union[str, bytes]], Any]
+
+
+_STDLIB_BACKEND = JSONBackend("json", _encode, json.loads)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check whether serialized data holds a NaN or infinite float, as a value or key."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item)
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _orjson_backend() -> JSONBackend:
+    import orjson
+
+    encode = orjson.dumps
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        try:
+            data = encode(obj, option=option)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits and nesting deeper
+            # than 255 levels; the stdlib encoder does not
+            return _encode(obj)
+        # orjson writes NaN and infinities as null where the stdlib writes
+        # NaN/Infinity. Only output holding null can be affected.
+        if b'null' in data and _has_non_finite(obj):
+            return _encode(obj)
+        return data.decode()
+
+    # orjson.loads turns integers beyond 64 bits into floats, so documents
+    # are parsed with the stdlib to keep the structure unchanged.
+    return JSONBackend("orjson", dumps, json.loads)
+
+
+# Factories import their library when the backend is selected and raise
+# ImportError if it is not installed.
+_backend_factories: Dict[str, Callable[[], JSONBackend]] = {
+    "json": lambda: _STDLIB_BACKEND,
+    "orjson": _orjson_backend,
+}
+# Tried in order by set_json_backend("auto")
+_AUTO_BACKENDS = ("orjson",)
+
+_backend = _STDLIB_BACKEND
+
+
+def register_json_backend(name: str, factory: Callable[[], JSONBackend]) -> None:
+    """Register a JSON backend under `name`, replacing any previous one.
+
+    `factory` is called by `set_json_backend(name)` and should import the
+    library there, raising ImportError when it is not installed. The
+    backend must produce the same structure as the stdlib `json` module;
+    ``tests/test_json_backends.py`` is the conformance suite to run it
+    against.
+
+    Raises:
+        ValueError: If `name` is "json" or "auto".
+    """
+    if name in ("json", "auto"):
+        raise ValueError(f"Cannot replace the {name!r} JSON backend")
+    _backend_factories[name] = factory
+
+
+def set_json_backend(name: str = "json") -> JSONBackend:
+    """Select the JSON backend used by `to_json()`, NDJSON writers and `result_from_json()`.
+
+    The library is imported once, here. NDJSON writers keep the backend
+    that was selected when they were created.
+
+    Args:
+        name: "json" (the default, stdlib), "orjson", a name registered
+              with `register_json_backend()`, or "auto" for the first
+              installed of the faster backends, falling back to "json".
+
+    Returns:
+        The selected backend.
+
+    Raises:
+        ValueError: If `name` is unknown.
+        ImportError: If the backend's library is not installed.
+    """
+    global _backend
+    if name == "auto":
+        backend = _STDLIB_BACKEND
+        for candidate in _AUTO_BACKENDS:
+            try:
+                backend = _backend_factories[candidate]()
+            except ImportError:
+                continue
+            break
+    else:
+        try:
+            factory = _backend_factories[name]
+        except KeyError:
+            raise ValueError(f"Unknown JSON backend: {name!r}") from None
+        backend = factory()
+    _backend = backend
+    return backend
+
+
+def get_json_backend() -> JSONBackend:
+    """Return the JSON backend currently in use."""
+    return _backend
+
+
+def _is_binary_stream(fp: IO[Any]) -> bool:
+    if isinstance(fp, io.TextIOBase):
+        return False
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return 'b' in getattr(fp, 'mode', '')
+
+
+def dumps(result: Union[Ok[Any, Any], Err[Any, Any]]) -> str:
+    """Encode a result to a JSON string with the current backend.
+
+    Args:
+        result: The Ok or Err instance to encode.
+
+    Returns:
+        With the stdlib backend, the same string as
+        ``json.dumps(result.to_dict())``; other backends encode the same
+        structure, possibly with different whitespace and escaping.
+    """
+    backend = _backend
+    if backend is not _STDLIB_BACKEND:
+        try:
+            return backend.dumps(result.to_dict())
+        except RecursionError:
+            # Nested too deeply for a recursive encoder: use the streaming one
+            pass
+    parts: List[str] = []
+    writer = _JsonStreamWriter(parts.append)
+    writer.write_result(result)
+    writer.flush()
+    return ''.join(parts)
+
+
+def dump(result: Union[Ok[Any, Any], Err[Any, Any]], fp: IO[Any],
+         chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Write the JSON encoding of a result to a text or binary stream.
+
+    Text streams receive `str` chunks; binary streams receive UTF-8
+    encoded `bytes` (with the stdlib backend the output is always ASCII,
+    as with ``json.dumps``). Backends other than the stdlib one encode the
+    whole result before writing it.
+
+    Args:
+        result: The Ok or Err instance to encode.
+        fp: A writable text or binary file-like object.
+        chunk_size: Approximate number of characters buffered per write.
+    """
+    if _is_binary_stream(fp):
+        write: Callable[[str], Any] = lambda text: fp.write(text.encode('utf-8'))
+    else:
+        write = fp.write
+    backend = _backend
+    if backend is not _STDLIB_BACKEND:
+        try:
+            text = backend.dumps(result.to_dict())
+        except RecursionError:
+            pass
+        else:
+            write(text)
+            return
+    writer = _JsonStreamWriter(write, chunk_size)
+    writer.write_result(result)
+    writer.flush()
+
+
+_environment_backend = os.environ.get("RESOKERR_JSON_BACKEND")
+if _environment_backend:
+    try:
+        set_json_backend(_environment_backend)
+    except (ImportError, ValueError) as exc:
+        warnings.warn(f"RESOKERR_JSON_BACKEND ignored, using the stdlib json module: {exc}",
+                      RuntimeWarning, stacklevel=2)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "JSONBackend",
+    "dump",
+    "dumps",
+    "get_json_backend",
+    "register_json_backend",
+    "set_json_backend",
+]
@@ -0,0 +1,273 @@
+"""Deferred Ok/Err pipelines.
+
+A `LazyResult` records `map`, `and_then`, `with_*` and the other result
+operations without running them. The chain is evaluated only when its
+outcome is needed (`force()`, `is_ok()`, `unwrap()`, `to_dict()`, ...),
+and the forced result is memoized, so branches that are never read cost
+nothing.
+
+Evaluation threads the value or cause, message log and metadata through
+the operations and builds a single Ok or Err at the end instead of one
+per step. Operations on the Ok side (`map`, `and_then`, `inspect`,
+`with_success`) are skipped once the chain holds an Err, and those on the
+Err side (`or_else`, `map_err`, `with_error`) while it holds an Ok.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, Mapping, Optional, Tuple, TypeVar, Union
+
+from .core import (
+    E,
+    Err,
+    M,
+    MessageTrace,
+    Ok,
+    TraceSeverityLevel,
+    V,
+    _MessageLog,
+    _check_step_result,
+    _merge_metadata,
+    _result_from_parts,
+)
+
+T = TypeVar('T')
+
+# Recorded operations
+_MAP = 0
+_AND_THEN = 1
+_OR_ELSE = 2
+_MAP_ERR = 3
+_INSPECT = 4
+_MESSAGE = 5      # args: (trace, side) with side True (Ok only), False (Err only) or None
+_METADATA = 6
+
+
+def _normalized(is_ok: bool, log: _MessageLog[Any]) -> _MessageLog[Any]:
+    """Convert the messages a result of the new kind may not hold, as the constructors do."""
+    if log.has_severity(TraceSeverityLevel.ERROR if is_ok else TraceSeverityLevel.SUCCESS):
+        return _result_from_parts(is_ok, None, log, None)._message_log
+    return log
+
+
+class LazyResult(Generic[V, E, M]):
+    """A deferred chain of operations on an Ok or Err.
+
+    Every recording method returns a new LazyResult and leaves this one
+    untouched, so a chain can branch. Forcing keeps the evaluated state of
+    every step it runs through (without building a result for it), so a
+    step shared by several branches runs once, whether the branches were
+    recorded before or after the first of them was forced.
+
+    Unlike `Err.map`, `map` only transforms Ok values: after the first Err,
+    Ok-side operations are skipped. Exceptions raised by recorded callables
+    propagate when the chain is forced; the failing step and the ones
+    after it run again on the next force.
+
+    Args:
+        source: The Ok or Err to start from, or a callable taking no
+                arguments and returning one, called when first forced.
+
+    Raises:
+        TypeError: If `source` is neither a result nor a callable.
+
+    Example:
+        >>> lazy = LazyResult(lambda: fetch(url)).and_then(parse).map(summarize).with_info("done")
+        >>> if lazy.is_ok():            # runs fetch and parse, then summarize
+        ...     lazy.unwrap()           # memoized, nothing runs again
+    """
+
+    __slots__ = ('_parent', '_op', '_args', '_result', '_state')
+
+    def __init__(self, source: Union[Ok[V, M], Err[E, M], Callable[[], Union[Ok[V, M], Err[E, M]]]]) -> None:
+        if isinstance(source, (Ok, Err)):
+            self._result: Optional[Union[Ok[Any, Any], Err[Any, Any]]] = source
+        elif callable(source):
+            self._result = None
+        else:
+            raise TypeError(f"LazyResult needs an Ok, Err or callable, not {type(source).__name__}")
+        self._parent: Optional[LazyResult[Any, Any, Any]] = None
+        self._op = -1
+        self._args: Any = source
+        self._state: Optional[Tuple[Any, ...]] = None
+
+    def _then(self, op: int, args: Any) -> LazyResult[Any, Any, Any]:
+        node = LazyResult.__new__(LazyResult)
+        node._parent = self
+        node._op = op
+        node._args = args
+        node._result = None
+        node._state = None
+        return node
+
+    # Recorded operations
+
+    def map(self, f: Callable[[V], T]) -> LazyResult[T, E, M]:
+        """Record a transformation of the Ok value (skipped for None, as in `Ok.map`)."""
+        return self._then(_MAP, f)
+
+    def and_then(self, f: Callable[[Optional[V]], Union[Ok[T, M], Err[Any, M]]]) -> LazyResult[T, Any, M]:
+        """Record a step returning a result, run on the Ok value (see `Ok.and_then`)."""
+        return self._then(_AND_THEN, f)
+
+    def or_else(self, f: Callable[[Optional[E]], Union[Ok[Any, M], Err[Any, M]]]) -> LazyResult[Any, Any, M]:
+        """Record a recovery step returning a result, run on the Err cause (see `Err.or_else`)."""
+        return self._then(_OR_ELSE, f)
+
+    def map_err(self, f: Callable[[E], T]) -> LazyResult[V, T, M]:
+        """Record a transformation of the Err cause (skipped for None)."""
+        return self._then(_MAP_ERR, f)
+
+    def inspect(self, f: Callable[[Optional[V]], Any]) -> LazyResult[V, E, M]:
+        """Record a call of `f` with the Ok value, for side effects."""
+        return self._then(_INSPECT, f)
+
+    def with_success(self, message: M, code: Optional[str] = None,
+                     details: Optional[Dict[str, Any]] = None,
+                     stack_trace: Optional[str] = None) -> LazyResult[V, E, M]:
+        """Record a success message, added if the chain holds an Ok."""
+        return self._then(_MESSAGE, (MessageTrace.success(message, code, details, stack_trace), True))
+
+    def with_info(self, message: M, code: Optional[str] = None,
+                  details: Optional[Dict[str, Any]] = None,
+                  stack_trace: Optional[str] = None) -> LazyResult[V, E, M]:
+        """Record an info message."""
+        return self._then(_MESSAGE, (MessageTrace.info(message, code, details, stack_trace), None))
+
+    def with_warning(self, message: M, code: Optional[str] = None,
+                     details: Optional[Dict[str, Any]] = None,
+                     stack_trace: Optional[str] = None) -> LazyResult[V, E, M]:
+        """Record a warning message."""
+        return self._then(_MESSAGE, (MessageTrace.warning(message, code, details, stack_trace), None))
+
+    def with_error(self, message: M, code: Optional[str] = None,
+                   details: Optional[Dict[str, Any]] = None,
+                   stack_trace: Optional[str] = None) -> LazyResult[V, E, M]:
+        """Record an error message, added if the chain holds an Err."""
+        return self._then(_MESSAGE, (MessageTrace.error(message, code, details, stack_trace), False))
+
+    def with_metadata(self, metadata: Mapping[str, Any]) -> LazyResult[V, E, M]:
+        """Record replacing the metadata."""
+        if metadata is not None and not isinstance(metadata, MappingProxyType):
+            # Copy now, as the eager method does, so later changes are not seen
+            metadata = MappingProxyType(dict(metadata))
+        return self._then(_METADATA, metadata)
+
+    # Forcing
+
+    @property
+    def forced(self) -> bool:
+        """Whether the result has been evaluated (without evaluating it)."""
+        return self._result is not None
+
+    def force(self) -> Union[Ok[V, M], Err[E, M]]:
+        """Evaluate the recorded operations once and return the resulting Ok or Err."""
+        result = self._result
+        if result is not None:
+            return result  # type: ignore[return-value]
+
+        # Unevaluated steps, newest first, up to an evaluated one or the source
+        pending = []
+        node: LazyResult[Any, Any, Any] = self
+        while node._result is None and node._state is None and node._parent is not None:
+            pending.append(node)
+            node = node._parent  # type: ignore[assignment]
+        if node._state is not None:
+            base, changed, is_ok, payload, log, metadata = node._state
+        else:
+            base = node._result
+            if base is None:
+                base = node._args()
+                _check_step_result(base, node._args)
+                node._result = base
+            is_ok = isinstance(base, Ok)
+            payload = base.value if is_ok else base.cause  # type: ignore[union-attr]
+            log = base._message_log
+            metadata = base.metadata
+            changed = False
+
+        for node in reversed(pending):
+            op = node._op
+            args = node._args
+            if op == _MESSAGE:
+                trace, side = args
+                if side is None or side is is_ok:
+                    log = log.append(trace)
+                    changed = True
+            elif op == _MAP:
+                if is_ok and payload is not None:
+                    payload = args(payload)
+                    changed = True
+            elif op == _AND_THEN or op == _OR_ELSE:
+                if is_ok is (op == _AND_THEN):
+                    step = args(payload)
+                    _check_step_result(step, args)
+                    step_is_ok = isinstance(step, Ok)
+                    payload = step.value if step_is_ok else step.cause
+                    log = log.extend(step._message_log)
+                    metadata = _merge_metadata(metadata, step.metadata)
+                    if step_is_ok is not is_ok:
+                        is_ok = step_is_ok
+                        log = _normalized(is_ok, log)
+                    changed = True
+            elif op == _MAP_ERR:
+                if not is_ok and payload is not None:
+                    payload = args(payload)
+                    changed = True
+            elif op == _INSPECT:
+                if is_ok:
+                    args(payload)
+            else:
+                metadata = args
+                changed = True
+            if node is not self:
+                # Keep the evaluated state for branches created from this
+                # step, now or later, without building a result for it
+                node._state = (base, changed, is_ok, payload, log, metadata)
+                node._parent = None
+                node._args = None
+
+        result = _result_from_parts(is_ok, payload, log, metadata) if changed else base
+        self._result = result
+        # The chain is no longer needed to answer for this node
+        self._parent = None
+        self._args = None
+        self._state = None
+        return result  # type: ignore[return-value]
+
+    def is_ok(self) -> bool:
+        """Force the chain and check whether it produced an Ok."""
+        return isinstance(self.force(), Ok)
+
+    def is_err(self) -> bool:
+        """Force the chain and check whether it produced an Err."""
+        return isinstance(self.force(), Err)
+
+    def unwrap(self, *args: Any, **kwargs: Any) -> Any:
+        """Force the chain and unwrap the value or cause (see `Ok.unwrap`/`Err.unwrap`)."""
+        return self.force().unwrap(*args, **kwargs)
+
+    def to_dict(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Force the chain and serialize the result (see `Ok.to_dict`)."""
+        return self.force().to_dict(*args, **kwargs)
+
+    def to_json(self, *args: Any, **kwargs: Any) -> str:
+        """Force the chain and encode the result as JSON (see `Ok.to_json`)."""
+        return self.force().to_json(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Other attributes (value, cause, messages, has_errors, ...) are
+        # read from the forced result.
+        if name.startswith('_'):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return getattr(self.force(), name)
+
+    def __repr__(self) -> str:
+        if self._result is None:
+            return "LazyResult(<pending>)"
+        return f"LazyResult({self._result!r})"
+
+
+__all__ = [
+    "LazyResult",
+]
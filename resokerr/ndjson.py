@@ -0,0 +1,235 @@
+"""Batch NDJSON writer for high-volume streams of Ok/Err results.
+
+Each result becomes one line holding the JSON form of its `to_dict()`
+(the same text as ``json.dumps(result.to_dict())`` with the default
+stdlib JSON backend, see `resokerr.jsonio.set_json_backend`). Lines are appended
+to a shared buffer that is written out in bulk once it reaches
+`flush_size` characters or `flush_interval` seconds have passed, optionally
+through gzip or lzma compression.
+"""
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    BinaryIO,
+    Iterable,
+    Literal,
+    Optional,
+    Union,
+)
+
+from .core import Err, Ok
+from .jsonio import _JsonStreamWriter, get_json_backend
+
+Compression = Literal["gzip", "lzma"]
+
+DEFAULT_FLUSH_SIZE = 1024 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class NDJSONReport:
+    """Throughput summary returned when an NDJSON writer is closed."""
+    records: int
+    bytes_encoded: int      # NDJSON bytes produced, before compression
+    bytes_written: int      # Bytes that reached the destination stream
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_written / self.seconds if self.seconds > 0 else 0.0
+
+
+class _CountingStream:
+    """Binary stream wrapper counting the bytes written through it."""
+
+    __slots__ = ('_stream', 'count')
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self.count = 0
+
+    def write(self, data: Any) -> int:
+        self.count += len(data)
+        return self._stream.write(data)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+class NDJSONWriter:
+    """Buffered NDJSON sink for Ok/Err results.
+
+    Args:
+        target: A path to create, or a writable binary file-like object.
+                Streams passed in are flushed but not closed.
+        compression: Optional "gzip" or "lzma" compression.
+        flush_size: Number of characters buffered before a bulk write.
+                    With the default stdlib backend the output is ASCII,
+                    so this is also the number of bytes; non-ASCII output
+                    from other backends takes more bytes once encoded.
+        flush_interval: Maximum number of seconds buffered lines may wait
+                        before being written, checked between records.
+                        None disables time-based flushing.
+
+    Example:
+        >>> with NDJSONWriter("results.ndjson.gz", compression="gzip") as writer:
+        ...     writer.write_many(results)
+        >>> writer.report.records_per_second
+    """
+
+    def __init__(self, target: Union[str, os.PathLike[str], BinaryIO],
+                 compression: Optional[Compression] = None,
+                 flush_size: int = DEFAULT_FLUSH_SIZE,
+                 flush_interval: Optional[float] = DEFAULT_FLUSH_INTERVAL) -> None:
+        if compression not in (None, "gzip", "lzma"):
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        if flush_size <= 0:
+            raise ValueError("flush_size must be positive")
+
+        if isinstance(target, (str, os.PathLike)):
+            self._raw: BinaryIO = open(target, "wb")
+            self._owns_raw = True
+        else:
+            self._raw = target
+            self._owns_raw = False
+        self._destination = _CountingStream(self._raw)
+
+        self._stream: Any
+        # Compression modules are imported on demand: they are optional in
+        # some Python builds.
+        if compression == "gzip":
+            import gzip
+            self._stream = gzip.GzipFile(fileobj=self._destination, mode="wb")  # type: ignore[arg-type]
+        elif compression == "lzma":
+            import lzma
+            self._stream = lzma.LZMAFile(self._destination, mode="wb")  # type: ignore[arg-type]
+        else:
+            self._stream = self._destination
+
+        self._flush_interval = flush_interval
+        self._records = 0
+        self._bytes_encoded = 0
+        self._started = time.perf_counter()
+        self._last_flush = time.monotonic()
+        self._report: Optional[NDJSONReport] = None
+        self._writer = _JsonStreamWriter(self._write_chunk, flush_size)
+        self._dumps = get_json_backend().dumps
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self._bytes_encoded += len(data)
+        self._stream.write(data)
+        self._last_flush = time.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        return self._report is not None
+
+    @property
+    def report(self) -> Optional[NDJSONReport]:
+        """Throughput report, available once the writer is closed."""
+        return self._report
+
+    def write(self, result: Union[Ok[Any, Any], Err[Any, Any]]) -> None:
+        """Append one result as an NDJSON line."""
+        if self._report is not None:
+            raise ValueError("I/O operation on closed NDJSONWriter")
+        # Records are small as a rule: one C-encoder pass over to_dict() beats
+        # walking the result piece by piece.
+        try:
+            line = self._dumps(result.to_dict())
+        except RecursionError:
+            # Nested too deeply for a recursive encoder: stream it instead
+            self._writer.write_result(result)
+            self._writer.emit("\n")
+        else:
+            self._writer.emit(line + "\n")
+        self._records += 1
+        if (self._flush_interval is not None
+                and time.monotonic() - self._last_flush >= self._flush_interval):
+            self.flush()
+
+    def write_many(self, results: Iterable[Union[Ok[Any, Any], Err[Any, Any]]]) -> None:
+        """Append every result of an iterable."""
+        write = self.write
+        for result in results:
+            write(result)
+
+    async def write_many_async(self, results: AsyncIterable[Union[Ok[Any, Any], Err[Any, Any]]]) -> None:
+        """Append every result of an async iterable.
+
+        Encoding is synchronous and buffered, so the event loop is only
+        blocked while a full buffer is handed to the stream.
+        """
+        write = self.write
+        async for result in results:
+            write(result)
+
+    def flush(self) -> None:
+        """Write buffered lines and flush the underlying stream."""
+        self._writer.flush()
+        self._stream.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> NDJSONReport:
+        """Flush, finish compression and return the throughput report."""
+        if self._report is not None:
+            return self._report
+        self._writer.flush()
+        if self._stream is not self._destination:
+            self._stream.close()
+        self._destination.flush()
+        if self._owns_raw:
+            self._raw.close()
+        self._report = NDJSONReport(
+            records=self._records,
+            bytes_encoded=self._bytes_encoded,
+            bytes_written=self._destination.count,
+            seconds=time.perf_counter() - self._started,
+        )
+        return self._report
+
+    def __enter__(self) -> NDJSONWriter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_ndjson(results: Iterable[Union[Ok[Any, Any], Err[Any, Any]]],
+                 target: Union[str, os.PathLike[str], BinaryIO],
+                 compression: Optional[Compression] = None,
+                 flush_size: int = DEFAULT_FLUSH_SIZE,
+                 flush_interval: Optional[float] = DEFAULT_FLUSH_INTERVAL) -> NDJSONReport:
+    """Write an iterable of results as NDJSON and return the throughput report."""
+    with NDJSONWriter(target, compression, flush_size, flush_interval) as writer:
+        writer.write_many(results)
+    return writer.close()
+
+
+async def write_ndjson_async(results: AsyncIterable[Union[Ok[Any, Any], Err[Any, Any]]],
+                             target: Union[str, os.PathLike[str], BinaryIO],
+                             compression: Optional[Compression] = None,
+                             flush_size: int = DEFAULT_FLUSH_SIZE,
+                             flush_interval: Optional[float] = DEFAULT_FLUSH_INTERVAL) -> NDJSONReport:
+    """Write an async iterable of results as NDJSON and return the throughput report."""
+    with NDJSONWriter(target, compression, flush_size, flush_interval) as writer:
+        await writer.write_many_async(results)
+    return writer.close()
+
+
+__all__ = [
+    "NDJSONReport",
+    "NDJSONWriter",
+    "write_ndjson",
+    "write_ndjson_async",
+]
@@ -0,0 +1,151 @@
+"""Parallel batch serialization of Ok/Err results across worker processes.
+
+Results are sent to a process pool in chunks of `chunk_size` (they pickle
+compactly, see `Ok.__reduce_ex__`), serialized there with `to_dict()` or
+`to_json()`, and streamed back in input order. Only a bounded number of
+chunks is in flight at any time, so arbitrarily long iterables can be
+processed with flat memory use. Small batches are serialized in-process,
+where starting workers would cost more than it saves.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from multiprocessing.context import BaseContext
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Literal, Optional, Union
+
+from .core import Err, Ok, TypeUtils, _exception_options
+from .jsonio import get_json_backend, set_json_backend
+
+OutputFormat = Literal["dict", "json"]
+
+DEFAULT_CHUNK_SIZE = 1_000
+# Batches smaller than this are serialized in the calling process
+DEFAULT_MIN_PARALLEL = 10_000
+
+
+def _serialize_chunk(chunk: List[Union[Ok[Any, Any], Err[Any, Any]]],
+                     output: OutputFormat) -> List[Any]:
+    if output == "json":
+        return [result.to_json() for result in chunk]
+    return [result.to_dict() for result in chunk]
+
+
+def _init_worker(profiles: tuple[str, ...], exception_settings: Dict[str, Any],
+                 json_backend: str) -> None:
+    """Apply the caller's serialization settings in a worker process.
+
+    Forked workers inherit them anyway; spawned ones start from defaults.
+    """
+    TypeUtils.enable_profile(*profiles)
+    TypeUtils.configure_exceptions(**exception_settings)
+    set_json_backend(json_backend)
+
+
+def _peek(results: Iterable[Any], count: int) -> tuple[Iterator[Any], bool]:
+    """Read the first `count` results ahead.
+
+    Returns an iterator over all the results and whether there were fewer
+    than `count`. The list of results read ahead is only referenced by
+    that iterator, so it is released once they have been consumed.
+    """
+    iterator = iter(results)
+    head = list(islice(iterator, count))
+    return chain(iter(head), iterator), len(head) < count
+
+
+def serialize_many(results: Iterable[Union[Ok[Any, Any], Err[Any, Any]]],
+                   workers: Optional[int] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   min_parallel: int = DEFAULT_MIN_PARALLEL,
+                   output: OutputFormat = "dict",
+                   mp_context: Optional[BaseContext] = None) -> Iterator[Any]:
+    """Serialize many results across a process pool, in input order.
+
+    The first `min_parallel` results are read up front: if the iterable
+    ends before that (or `workers` is 1), everything is serialized in the
+    calling process. Otherwise chunks of `chunk_size` results are handed to
+    `workers` processes, with at most two chunks per worker in flight, and
+    the output is yielded as soon as the next chunk in order is done.
+
+    Serialization profiles, exception settings and the JSON backend of the
+    calling process are applied in the workers. Handlers registered with
+    `register_serializer()` (and backends registered with
+    `register_json_backend()`) are not sent to the workers: register them
+    at import time of the module defining the type, so that spawned
+    workers pick them up when unpickling the results.
+
+    Args:
+        results: Ok/Err instances to serialize.
+        workers: Number of worker processes. Defaults to ``os.cpu_count()``.
+        chunk_size: Number of results sent to a worker at a time.
+        min_parallel: Smallest batch serialized in worker processes.
+        output: "dict" yields `to_dict()` output, "json" yields `to_json()`
+                strings (cheaper to send back from the workers).
+        mp_context: Optional multiprocessing context for the pool.
+
+    Returns:
+        An iterator over the serialized results, in input order.
+
+    Raises:
+        ValueError: If `workers` or `chunk_size` is not positive, or
+                    `output` is unknown.
+
+    Example:
+        >>> with open("export.ndjson", "w") as fp:
+        ...     for line in serialize_many(results, workers=8, output="json"):
+        ...         fp.write(line + "\\n")
+    """
+    if output not in ("dict", "json"):
+        raise ValueError(f"Unsupported output: {output!r}")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be positive")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    return _serialize_many(results, workers or os.cpu_count() or 1, chunk_size,
+                           min_parallel, output, mp_context)
+
+
+def _serialize_many(results: Iterable[Union[Ok[Any, Any], Err[Any, Any]]], workers: int,
+                    chunk_size: int, min_parallel: int, output: OutputFormat,
+                    mp_context: Optional[BaseContext]) -> Iterator[Any]:
+    source, small = _peek(results, min_parallel)
+    if workers == 1 or small:
+        if output == "json":
+            for result in source:
+                yield result.to_json()
+        else:
+            for result in source:
+                yield result.to_dict()
+        return
+
+    exception_settings = {name: getattr(_exception_options, name) for name in _exception_options.__slots__}
+    pool = ProcessPoolExecutor(workers, mp_context=mp_context, initializer=_init_worker,
+                               initargs=(TypeUtils.active_profiles(), exception_settings,
+                                         get_json_backend().name))
+    try:
+        pending: Deque[Future[List[Any]]] = deque()
+        in_flight = workers * 2
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < in_flight:
+                chunk = list(islice(source, chunk_size))
+                if chunk:
+                    pending.append(pool.submit(_serialize_chunk, chunk, output))
+                else:
+                    exhausted = True
+            if not pending:
+                break
+            yield from pending.popleft().result()
+    finally:
+        # Also reached when the caller stops iterating early
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_MIN_PARALLEL",
+    "serialize_many",
+]
@@ -0,0 +1,113 @@
+"""Tests for collect, sequence, partition and first_err."""
+import pytest
+from types import MappingProxyType
+
+from resokerr import Ok, Err, TraceSeverityLevel, collect, first_err, partition, sequence
+
+
+def results_then_fail(*results):
+    """Yield `results`, then fail the test if iterated further."""
+    yield from results
+    pytest.fail("iterated past the first Err")
+
+
+class TestCollect:
+    """Test collect in accumulate-all and short-circuit modes."""
+
+    def test_all_ok(self):
+        """Test an Ok of all values, with every message in order and merged metadata."""
+        results = [
+            Ok(value=1, metadata={"a": 1}).with_success("one"),
+            Ok(value=2).with_info("two"),
+            Ok(value=3, metadata={"a": 3, "b": 2}).with_warning("three"),
+        ]
+        outcome = collect(results)
+        assert outcome.is_ok()
+        assert outcome.value == [1, 2, 3]
+        assert [m.message for m in outcome.messages] == ["one", "two", "three"]
+        assert outcome.has_successes() and outcome.has_info() and outcome.has_warnings()
+        assert outcome.metadata == {"a": 3, "b": 2}
+        assert isinstance(outcome.metadata, MappingProxyType)
+
+    def test_accumulates_all_errs(self):
+        """Test without short_circuit every cause and error message is kept."""
+        results = [Ok(value=1).with_success("ok"), Err(cause="a").with_error("first"),
+                   Ok(value=2), Err(cause="b").with_error("second")]
+        outcome = collect(iter(results))
+        assert outcome.is_err()
+        assert outcome.cause == ["a", "b"]
+        assert [m.message for m in outcome.error_messages] == ["first", "second"]
+        # SUCCESS messages are converted, as in the constructor
+        assert outcome.messages[0].severity is TraceSeverityLevel.INFO
+
+    def test_short_circuit(self):
+        """Test with short_circuit nothing after the first Err is consumed."""
+        outcome = collect(results_then_fail(Ok(value=1).with_info("read"), Err(cause="bad").with_error("failed")),
+                          short_circuit=True)
+        assert outcome.cause == "bad"
+        assert [m.message for m in outcome.messages] == ["read", "failed"]
+
+    def test_empty(self):
+        """Test an empty iterable gives an Ok of an empty list."""
+        assert collect([]) == Ok(value=[])
+        assert collect([], short_circuit=True) == Ok(value=[])
+
+    def test_shared_logs_not_corrupted(self):
+        """Test results sharing a message log keep their own messages."""
+        base = Ok(value=0).with_info("base")
+        results = [base.with_info("a"), base.with_info("b")]
+        outcome = collect(results)
+        assert [m.message for m in outcome.messages] == ["base", "a", "base", "b"]
+        assert [m.message for m in results[0].messages] == ["base", "a"]
+        assert [m.message for m in base.messages] == ["base"]
+
+    def test_non_result_rejected(self):
+        """Test items other than Ok/Err raise TypeError."""
+        with pytest.raises(TypeError):
+            collect([Ok(value=1), 2])
+
+    def test_large_generator(self):
+        """Test long generators are combined in one pass."""
+        outcome = collect(Ok(value=i).with_info(f"item {i}") for i in range(100_000))
+        assert len(outcome.value) == 100_000
+        assert len(outcome.messages) == 100_000
+        assert outcome.messages[-1].message == "item 99999"
+
+
+class TestSequence:
+    """Test sequence."""
+
+    def test_matches_short_circuit_collect(self):
+        """Test sequence stops at the first Err like collect(short_circuit=True)."""
+        results = [Ok(value=1), Err(cause="x").with_error("e"), Err(cause="y")]
+        assert sequence(results) == collect(results, short_circuit=True)
+        assert sequence(results_then_fail(Ok(value=1), Err(cause="x"))).cause == "x"
+
+    def test_all_ok(self):
+        """Test an Ok of all values."""
+        assert sequence(Ok(value=c) for c in "abc").value == ["a", "b", "c"]
+
+
+class TestPartitionAndFirstErr:
+    """Test partition and first_err."""
+
+    def test_partition(self):
+        """Test results are split in order and returned as-is."""
+        results = [Ok(value=1), Err(cause="a"), Ok(value=2).with_info("x"), Err(cause="b")]
+        oks, errs = partition(iter(results))
+        assert oks == [results[0], results[2]]
+        assert errs == [results[1], results[3]]
+        assert oks[1] is results[2]
+
+    def test_first_err(self):
+        """Test the first Err is returned without consuming the rest."""
+        err = Err(cause="first")
+        assert first_err(results_then_fail(Ok(value=1), err)) is err
+        assert first_err([Ok(value=1), Ok(value=2)]) is None
+
+    def test_non_result_rejected(self):
+        """Test items other than Ok/Err raise TypeError."""
+        with pytest.raises(TypeError):
+            partition([None])
+        with pytest.raises(TypeError):
+            first_err(["x"])
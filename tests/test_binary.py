@@ -0,0 +1,261 @@
+"""Tests for the compact binary codec."""
+import array
+import io
+import json
+import pytest
+from enum import Enum, IntEnum
+from typing import Any, Dict
+
+from resokerr import Ok, Err, MessageTrace, TraceSeverityLevel, register_serializer, unregister_serializer
+from resokerr import binary
+
+
+class Priority(IntEnum):
+    LOW = 1
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Profile:
+    """Value type implementing to_dict()/from_dict()."""
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "tags": ("a", "b")}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Profile":
+        return cls(data["name"])
+
+
+class Opaque:
+    """Value type falling back to str()."""
+    def __str__(self) -> str:
+        return "Opaque<é>"
+
+
+def _chained_error() -> Exception:
+    try:
+        try:
+            raise ValueError("inner")
+        except ValueError as inner:
+            raise RuntimeError("outer") from inner
+    except RuntimeError as exc:
+        return exc
+
+
+RESULTS = [
+    Ok(value=None),
+    Ok(value=-2**70),
+    Ok(value="naïve \"quoted\"\n 🚀"),
+    Ok(value=[1, 2.5, float("inf"), -0.0, True, False, None, (3, 4), [], {}]),
+    Ok(value={"k": {"nested": [Profile("x"), Opaque()]}, 1: "int key", 2.5: "float key",
+              None: "none key", True: "bool key"}),
+    Ok(value=Priority.LOW, metadata={"color": Color.RED, "n": [1, 2]}),
+    Ok(value=Profile("y")).with_info("loaded", code="I1", details={"rows": 3})
+                        .with_warning("slow", stack_trace="trace").with_success("done"),
+    Err(cause=None),
+    Err(cause=_chained_error(), metadata={"exc": ValueError("in metadata")}),
+    Err(cause="boom").with_error(Profile("msg")).with_info({"structured": [1, 2]}),
+    Err(cause={"code": 500}).with_error("e", code="E1").with_error("e", code="E1"),
+]
+
+
+class TestBinaryRoundTrip:
+    """Test dumps()/loads() preserve the serialized form."""
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_matches_to_dict(self, result):
+        """Test the decoded result serializes exactly like the original."""
+        decoded = binary.loads(binary.dumps(result))
+
+        assert type(decoded) is type(result)
+        assert decoded.to_json() == result.to_json()
+
+    def test_non_string_keys_preserved(self):
+        """Test dict keys keep their type, as in to_dict() (JSON turns them into strings)."""
+        value = {1: "int", 2.5: "float", None: "none", "s": "str"}
+        assert binary.loads(binary.dumps(Ok(value=value))).value == value
+
+    def test_message_trace(self):
+        """Test a standalone MessageTrace round-trips."""
+        trace = MessageTrace.warning("slow", code="W1", details={"ms": 250, "path": ["a"]}, stack_trace="tb")
+        assert binary.loads(binary.dumps(trace)) == trace
+
+    def test_decoded_result_is_immutable(self):
+        """Test metadata and details come back read-only."""
+        ok = binary.loads(binary.dumps(Ok(value=1, metadata={"a": 1}).with_info("x", details={"d": 1})))
+        with pytest.raises(TypeError):
+            ok.metadata["a"] = 2  # type: ignore[index]
+        with pytest.raises(TypeError):
+            ok.messages[0].details["d"] = 2  # type: ignore[index]
+
+    def test_decoded_result_can_be_extended(self):
+        """Test decoded results support with_* and severity queries."""
+        ok = binary.loads(binary.dumps(Ok(value=1).with_warning("w")))
+        assert ok.with_info("i").has_warnings()
+        assert ok.warning_messages[0].severity == TraceSeverityLevel.WARNING
+
+    def test_types_rebuilt(self):
+        """Test value and message types are rebuilt with from_dict()."""
+        ok = binary.loads(binary.dumps(Ok(value=Profile("p")).with_info(Profile("m"))),
+                          value_type=Profile, message_type=Profile)
+        assert isinstance(ok.value, Profile) and ok.value.name == "p"
+        assert ok.messages[0].message.name == "m"
+
+    def test_custom_serializer_respected(self):
+        """Test registered serialization handlers apply."""
+        register_serializer(Opaque, lambda obj: {"opaque": True})
+        try:
+            assert binary.loads(binary.dumps(Ok(value=Opaque()))).value == {"opaque": True}
+        finally:
+            unregister_serializer(Opaque)
+
+
+class TestBinaryFormat:
+    """Test the payload layout and input handling."""
+
+    def test_repeated_strings_interned(self):
+        """Test repeated codes and messages are stored once."""
+        err = Err(cause="x")
+        for _ in range(100):
+            err = err.with_error("request failed", code="E_TIMEOUT")
+        payload = binary.dumps(err)
+
+        assert payload.count(b"request failed") == 1
+        assert payload.count(b"E_TIMEOUT") == 1
+        assert len(payload) < len(err.to_json()) / 10
+
+    def test_zero_copy_memoryview(self):
+        """Test decoding a payload inside a larger shared buffer."""
+        first = binary.dumps(Ok(value=[1, 2]))
+        second = binary.dumps(Err(cause="x").with_error("e"))
+        buffer = bytearray(first + second)
+        view = memoryview(buffer)
+
+        size = binary.payload_length(view)
+        assert size == len(first)
+        assert binary.loads(view).value == [1, 2]
+        assert binary.loads(view[size:]).cause == "x"
+
+    def test_stream_dump_and_load(self):
+        """Test consecutive payloads written to a stream."""
+        stream = io.BytesIO()
+        for result in RESULTS:
+            binary.dump(result, stream)
+        stream.seek(0)
+
+        for result in RESULTS:
+            assert binary.load(stream).to_json() == result.to_json()
+        with pytest.raises(EOFError):
+            binary.load(stream)
+
+    def test_invalid_payloads_rejected(self):
+        """Test bad magic, versions and truncation raise ValueError."""
+        payload = binary.dumps(Ok(value="x").with_info("i"))
+        with pytest.raises(ValueError):
+            binary.loads(b"XX" + payload[2:])
+        with pytest.raises(ValueError):
+            binary.loads(payload[:2] + b"\x99" + payload[3:])
+        with pytest.raises(ValueError):
+            binary.loads(payload[:-1])
+
+    def test_lengths_beyond_32_bits_framed(self):
+        """Test the header can describe payloads over 4 GiB."""
+        header = binary.dumps(Ok(value=None))[:3] + (5 * 2 ** 30).to_bytes(8, "little")
+        assert binary.payload_length(header) == len(header) + 5 * 2 ** 30
+
+    def test_unknown_object_rejected(self):
+        """Test only results and traces can be encoded."""
+        with pytest.raises(TypeError):
+            binary.dumps({"value": 1})  # type: ignore[arg-type]
+
+    def test_invalid_key_raises(self):
+        """Test unsupported dict keys raise TypeError as json.dumps does."""
+        with pytest.raises(TypeError):
+            binary.dumps(Ok(value={(1, 2): "tuple key"}))
+
+    def test_inconsistent_severities_converted(self):
+        """Test hand-crafted payloads still go through the constructor rules."""
+        trace = binary.dumps(MessageTrace.error("bad"))
+        ok = binary.dumps(Ok(value=1).with_warning("bad"))
+        # Swap the warning severity byte for the error one
+        tampered = ok.replace(bytes([2, 0]) + b"\x05", bytes([3, 0]) + b"\x05", 1)
+
+        assert binary.loads(trace).severity == TraceSeverityLevel.ERROR
+        decoded = binary.loads(tampered)
+        assert decoded.messages[0].severity == TraceSeverityLevel.WARNING
+        assert "_converted_from" in decoded.messages[0].details
+
+
+class TestBinaryNesting:
+    """Test cyclic and deep values."""
+
+    def test_cycles_encoded_with_marker(self):
+        """Test cycles are cut like in to_dict()."""
+        data = {"rows": [1, 2]}
+        data["self"] = data
+        data["rows"].append({"back": data})
+        result = Ok(value=data, metadata={"data": data})
+
+        assert binary.loads(binary.dumps(result)).to_json() == result.to_json()
+
+    def test_deep_value(self):
+        """Test values nested beyond the recursion limit round-trip."""
+        root = node = {}
+        for _ in range(5_000):
+            node["next"] = node = {}
+
+        decoded = binary.loads(binary.dumps(Ok(value=root))).value
+        depth = 0
+        while decoded:
+            decoded = decoded["next"]
+            depth += 1
+        assert depth == 5_000
+
+
+class TestOutOfBandBuffers:
+    """Test bytes-like values passed through the buffer list."""
+
+    def test_buffers_not_copied(self):
+        """Test values are collected by the callback and decoded as views over the same memory."""
+        tile = bytearray(b"\x01" * 1_000_000)
+        buffers = []
+        payload = binary.dumps(Ok(value={"tile": tile, "name": "t1"}), buffer_callback=buffers.append)
+
+        assert len(payload) < 100
+        assert len(buffers) == 1
+        restored = binary.loads(payload, buffers=buffers).value
+        tile[0] = 7
+        assert isinstance(restored["tile"], memoryview)
+        assert restored["tile"][0] == 7
+        assert restored["name"] == "t1"
+
+    def test_layout_restored(self):
+        """Test array items and memoryview shapes come back with their format."""
+        samples = array.array("d", [0.5, 1.5, 2.5])
+        grid = memoryview(bytearray(24)).cast("i", (2, 3))
+        buffers = []
+        payload = binary.dumps(Err(cause=[samples, grid, b"raw"]), buffer_callback=buffers.append)
+
+        cause = binary.loads(payload, buffers=[memoryview(bytes(buffer.raw())) for buffer in buffers]).cause
+        assert cause[0].format == "d" and cause[0].tolist() == [0.5, 1.5, 2.5]
+        assert cause[1].shape == (2, 3) and cause[1].format == "i"
+        assert bytes(cause[2]) == b"raw"
+
+    def test_missing_buffers_rejected(self):
+        """Test payloads referring to buffers need them to decode."""
+        buffers = []
+        payload = binary.dumps(Ok(value=b"data"), buffer_callback=buffers.append)
+        with pytest.raises(ValueError):
+            binary.loads(payload)
+        with pytest.raises(ValueError):
+            binary.loads(payload, buffers=[])
+
+    def test_in_band_without_callback(self):
+        """Test bytes values are serialized as before without a callback."""
+        result = Ok(value=b"data")
+        assert binary.loads(binary.dumps(result)).to_json() == result.to_json()
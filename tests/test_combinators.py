@@ -0,0 +1,169 @@
+"""Tests for and_then, or_else, map_err, inspect and pipeline."""
+import pytest
+from types import MappingProxyType
+
+from resokerr import Ok, Err, TraceSeverityLevel, pipeline
+
+
+def parse_int(text: str):
+    try:
+        return Ok(value=int(text)).with_info("parsed")
+    except ValueError as exc:
+        return Err(cause=exc).with_error("not a number", code="E_PARSE")
+
+
+def require_positive(n: int):
+    if n > 0:
+        return Ok(value=n, metadata={"checked": True})
+    return Err(cause=n, metadata={"rejected": n}).with_error("not positive")
+
+
+def double(n: int):
+    return Ok(value=n * 2).with_success("doubled")
+
+
+class TestAndThen:
+    """Test and_then on Ok and Err."""
+
+    def test_runs_step_and_merges_messages(self):
+        """Test the step result carries the messages of both, in order."""
+        result = Ok(value="21").with_warning("slow").and_then(parse_int)
+        assert result.value == 21
+        assert [m.message for m in result.messages] == ["slow", "parsed"]
+
+    def test_step_err_returned(self):
+        """Test an Err returned by the step keeps the earlier messages."""
+        result = Ok(value="x").with_info("read").and_then(parse_int)
+        assert result.is_err()
+        assert [m.message for m in result.messages] == ["read", "not a number"]
+
+    def test_metadata_merged(self):
+        """Test metadata of the step wins over that of the instance."""
+        result = Ok(value=1, metadata={"checked": False, "id": 7}).and_then(require_positive)
+        assert result.metadata == {"checked": True, "id": 7}
+        assert isinstance(result.metadata, MappingProxyType)
+
+    def test_step_result_returned_as_is(self):
+        """Test nothing is rebuilt when the instance has no messages or metadata."""
+        step_result = Ok(value=2).with_info("x")
+        assert Ok(value=1).and_then(lambda _: step_result) is step_result
+
+    def test_called_with_none(self):
+        """Test unlike map, the step also runs for a None value."""
+        assert Ok(value=None).and_then(lambda v: Ok(value=v is None)).value is True
+
+    def test_err_short_circuits(self):
+        """Test Err.and_then returns the instance without calling the step."""
+        err = Err(cause="boom")
+        assert err.and_then(pytest.fail) is err
+
+    def test_success_messages_converted_into_err(self):
+        """Test SUCCESS messages carried into an Err become INFO."""
+        result = Ok(value=0).with_success("loaded").and_then(require_positive)
+        assert result.messages[0].severity is TraceSeverityLevel.INFO
+
+    def test_non_result_rejected(self):
+        """Test a step returning a plain value raises TypeError."""
+        with pytest.raises(TypeError):
+            Ok(value=1).and_then(lambda v: v + 1)
+
+
+class TestOrElse:
+    """Test or_else on Ok and Err."""
+
+    def test_recovers_err(self):
+        """Test the recovery step receives the cause and errors become warnings."""
+        result = Err(cause="timeout").with_error("failed").or_else(lambda cause: Ok(value=f"cached after {cause}"))
+        assert result.is_ok()
+        assert result.value == "cached after timeout"
+        assert result.messages[0].severity is TraceSeverityLevel.WARNING
+        assert result.messages[0].details["_converted_from"]["from"] == "error"
+
+    def test_recovery_can_fail(self):
+        """Test a failing recovery step returns an Err with all messages."""
+        result = Err(cause="a").with_error("first").or_else(lambda _: Err(cause="b").with_error("second"))
+        assert result.cause == "b"
+        assert [m.message for m in result.messages] == ["first", "second"]
+
+    def test_ok_passes_through(self):
+        """Test Ok.or_else returns the instance without calling the step."""
+        ok = Ok(value=1)
+        assert ok.or_else(pytest.fail) is ok
+
+
+class TestMapErrAndInspect:
+    """Test map_err and inspect."""
+
+    def test_map_err(self):
+        """Test map_err transforms an Err cause and leaves Ok alone."""
+        ok = Ok(value=1)
+        assert ok.map_err(str) is ok
+        err = Err(cause=ValueError("bad")).with_error("e")
+        mapped = err.map_err(str)
+        assert mapped.cause == "bad"
+        assert mapped.messages == err.messages
+
+    def test_inspect(self):
+        """Test inspect sees Ok values only and returns the instance."""
+        seen = []
+        ok = Ok(value=5)
+        err = Err(cause="x")
+        assert ok.inspect(seen.append) is ok
+        assert err.inspect(seen.append) is err
+        assert seen == [5]
+
+
+class TestPipeline:
+    """Test steps composed with pipeline()."""
+
+    def test_all_steps_run(self):
+        """Test values flow through the steps and messages are merged in order."""
+        result = pipeline(parse_int, require_positive, double)("21")
+        assert result.value == 42
+        assert [m.message for m in result.messages] == ["parsed", "doubled"]
+        assert result.metadata == {"checked": True}
+        assert result.has_successes() and result.has_info()
+
+    def test_stops_at_first_err(self):
+        """Test steps after an Err do not run."""
+        result = pipeline(parse_int, require_positive, pytest.fail)("-3")
+        assert result.cause == -3
+        assert [m.message for m in result.messages] == ["parsed", "not positive"]
+        assert result.metadata == {"rejected": -3}
+
+    def test_last_result_reused(self):
+        """Test the last result is returned as-is when it holds every message."""
+        last = Ok(value=3).with_info("only")
+        assert pipeline(lambda v: Ok(value=v), lambda v: last)(1) is last
+
+    def test_empty_pipeline(self):
+        """Test a pipeline without steps wraps the value in an Ok."""
+        assert pipeline()(7) == Ok(value=7)
+
+    def test_as_and_then_step(self):
+        """Test a pipeline is itself a step."""
+        result = Ok(value="4").with_info("start").and_then(pipeline(parse_int, double))
+        assert result.value == 8
+        assert [m.message for m in result.messages] == ["start", "parsed", "doubled"]
+
+    def test_many_steps(self):
+        """Test long pipelines keep every message."""
+        steps = [lambda n: Ok(value=n + 1).with_info(f"step {n}")] * 1_000
+        result = pipeline(*steps)(0)
+        assert result.value == 1_000
+        assert len(result.messages) == 1_000
+        assert result.messages[-1].message == "step 999"
+
+    def test_shared_prefix_not_corrupted(self):
+        """Test steps returning results that share a log do not see each other's messages."""
+        base = Ok(value=0).with_info("base")
+        first = pipeline(lambda _: base, lambda _: Ok(value=1).with_info("a"))(None)
+        second = pipeline(lambda _: base, lambda _: Ok(value=2).with_info("b"))(None)
+        assert [m.message for m in first.messages] == ["base", "a"]
+        assert [m.message for m in second.messages] == ["base", "b"]
+        assert [m.message for m in base.messages] == ["base"]
+
+    def test_non_result_rejected(self):
+        """Test a step returning a plain value raises TypeError."""
+        with pytest.raises(TypeError):
+            pipeline(lambda v: v)(1)
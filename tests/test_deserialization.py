@@ -0,0 +1,204 @@
+"""Tests for rebuilding results and messages from their serialized form."""
+import json
+import pytest
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict
+
+from resokerr.core import (
+    Ok, Err, MessageTrace, TraceSeverityLevel, TypeUtils,
+    register_deserializer, unregister_deserializer, result_from_dict, result_from_json,
+)
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Profile:
+    """Type implementing both to_dict() and from_dict()."""
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Profile":
+        return cls(data["name"])
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Profile) and other.name == self.name
+
+
+@pytest.fixture
+def loaders():
+    """Track deserializer registrations made by a test and remove them afterwards."""
+    registered = []
+
+    def register(cls, loader):
+        register_deserializer(cls, loader)
+        registered.append(cls)
+
+    yield register
+    for cls in registered:
+        unregister_deserializer(cls)
+
+
+class TestMessageTraceFromDict:
+    """Test MessageTrace.from_dict()."""
+
+    def test_round_trip(self):
+        """Test every field survives to_dict() / from_dict()."""
+        trace = MessageTrace.warning("slow", code="W1", details={"ms": 250}, stack_trace="trace")
+        assert MessageTrace.from_dict(trace.to_dict()) == trace
+
+    def test_optional_fields_default_to_none(self):
+        """Test omitted optional fields are None."""
+        trace = MessageTrace.from_dict({"message": "done", "severity": "success"})
+        assert trace.severity == TraceSeverityLevel.SUCCESS
+        assert trace.code is None and trace.details is None and trace.stack_trace is None
+
+    def test_message_type(self):
+        """Test messages are rebuilt with the given type."""
+        trace = MessageTrace.from_dict({"message": {"name": "x"}, "severity": "info"}, message_type=Profile)
+        assert trace.message == Profile("x")
+
+    def test_unknown_severity_raises(self):
+        """Test unknown severities are rejected."""
+        with pytest.raises(ValueError):
+            MessageTrace.from_dict({"message": "x", "severity": "fatal"})
+
+
+class TestResultFromDict:
+    """Test Ok.from_dict(), Err.from_dict() and result_from_dict()."""
+
+    def test_ok_round_trip(self):
+        """Test an Ok with messages and metadata round-trips."""
+        ok = Ok(value={"rows": [1, 2]}, metadata={"request": "abc"}).with_info("loaded").with_warning("slow")
+        assert Ok.from_dict(ok.to_dict()) == ok
+
+    def test_err_round_trip(self):
+        """Test an Err with messages and metadata round-trips."""
+        err = Err(cause="not found", metadata={"id": 7}).with_error("failed", code="E404").with_info("retrying")
+        assert Err.from_dict(err.to_dict()) == err
+
+    def test_value_and_cause_types(self):
+        """Test values and causes are rebuilt with the given types."""
+        ok = Ok.from_dict(Ok(value=Profile("ada")).to_dict(), value_type=Profile)
+        err = Err.from_dict({"is_ok": False, "is_err": True, "cause": "red"}, cause_type=Color)
+
+        assert ok.value == Profile("ada")
+        assert err.cause is Color.RED
+
+    def test_metadata_is_read_only_copy(self):
+        """Test metadata is copied into a read-only mapping."""
+        data = Ok(value=1, metadata={"a": 1}).to_dict()
+        ok = Ok.from_dict(data)
+        data["metadata"]["a"] = 2
+
+        assert ok.metadata == {"a": 1}
+        with pytest.raises(TypeError):
+            ok.metadata["a"] = 3  # type: ignore[index]
+
+    def test_constructor_rules_applied(self):
+        """Test untrusted input goes through the severity conversion."""
+        data = {"is_ok": True, "is_err": False, "value": 1,
+                "messages": [{"message": "bad", "severity": "error"}]}
+        ok = Ok.from_dict(data)
+        assert ok.messages[0].severity == TraceSeverityLevel.WARNING
+        assert "_converted_from" in ok.messages[0].details
+
+    def test_wrong_kind_raises(self):
+        """Test loading an Err as an Ok (and vice versa) is rejected."""
+        with pytest.raises(ValueError):
+            Ok.from_dict(Err(cause="x").to_dict())
+        with pytest.raises(ValueError):
+            Err.from_dict(Ok(value=1).to_dict())
+
+    def test_result_from_dict_dispatches(self):
+        """Test result_from_dict() picks the type from the flags."""
+        assert result_from_dict(Ok(value=1).to_dict()) == Ok(value=1)
+        assert result_from_dict(Err(cause="x").to_dict()) == Err(cause="x")
+        with pytest.raises(ValueError):
+            result_from_dict({"value": 1})
+
+    def test_result_from_json(self):
+        """Test result_from_json() reverses to_json()."""
+        err = Err(cause={"code": 500}).with_error("boom", details={"retry": False})
+        assert result_from_json(err.to_json()) == err
+        assert result_from_json(err.to_json().encode("ascii")) == err
+
+
+class TestTrustedMode:
+    """Test the trusted fast path."""
+
+    @pytest.mark.parametrize("result", [
+        Ok(value=None),
+        Ok(value=[1, 2], metadata={"a": {"b": 1}}).with_success("ok").with_info("i", code="C", details={"x": 1}),
+        Err(cause="x").with_error("e", stack_trace="trace").with_warning("w"),
+    ])
+    def test_same_result_as_untrusted(self, result):
+        """Test trusted loading builds an equal result."""
+        data = result.to_dict()
+        trusted = result_from_dict(data, trusted=True)
+
+        assert trusted == result_from_dict(data)
+        assert trusted.messages == result.messages
+        assert trusted.to_dict() == data
+
+    def test_messages_stored_as_is(self):
+        """Test trusted loading skips the severity conversion."""
+        data = {"value": 1, "messages": [{"message": "bad", "severity": "error"}]}
+        ok = Ok.from_dict(data, trusted=True)
+        assert ok.messages[0].severity == TraceSeverityLevel.ERROR
+
+    def test_trusted_result_can_be_extended(self):
+        """Test results loaded in trusted mode support with_* and map."""
+        ok = Ok.from_dict(Ok(value=1).with_info("a").to_dict(), trusted=True)
+        derived = ok.with_info("b").map(lambda v: v + 1)
+
+        assert derived.value == 2
+        assert [m.message for m in derived.messages] == ["a", "b"]
+        assert derived.has_info()
+
+    def test_message_type(self):
+        """Test message types apply in trusted mode."""
+        ok = Ok.from_dict(Ok(value=1).with_info(Profile("p")).to_dict(), message_type=Profile, trusted=True)
+        assert ok.messages[0].message == Profile("p")
+
+
+class TestDeserializerRegistry:
+    """Test TypeUtils.deserialize() and registered loaders."""
+
+    def test_default_rules(self):
+        """Test from_dict(), passthrough and constructor fallbacks."""
+        assert TypeUtils.deserialize({"name": "x"}, Profile) == Profile("x")
+        assert TypeUtils.deserialize("red", Color) is Color.RED
+        assert TypeUtils.deserialize(3, int) == 3
+        assert TypeUtils.deserialize([1], None) == [1]
+        assert TypeUtils.deserialize(None, Profile) is None
+
+    def test_registered_loader(self, loaders):
+        """Test a registered loader is used for values."""
+        loaders(Decimal, Decimal)
+        ok = Ok.from_dict({"is_ok": True, "value": "1.50"}, value_type=Decimal)
+        assert ok.value == Decimal("1.50")
+
+    def test_registered_loader_beats_from_dict(self, loaders):
+        """Test registered loaders take precedence over from_dict()."""
+        loaders(Profile, lambda data: Profile(data["name"].upper()))
+        assert TypeUtils.deserialize({"name": "x"}, Profile) == Profile("X")
+
+    def test_unregister_restores_default(self, loaders):
+        """Test unregistering falls back to the built-in rules."""
+        register_deserializer(Color, lambda data: Color.BLUE)
+        assert TypeUtils.deserialize("red", Color) is Color.BLUE
+        unregister_deserializer(Color)
+        assert TypeUtils.deserialize("red", Color) is Color.RED
+
+    def test_unregister_unknown_type_raises(self):
+        """Test unregistering a type without a loader raises KeyError."""
+        with pytest.raises(KeyError):
+            unregister_deserializer(Profile)
@@ -0,0 +1,186 @@
+"""Tests for exception serialization and traceback detaching."""
+import gc
+import json
+import pickle
+import weakref
+import pytest
+
+from resokerr import Err, configure_exception_serialization
+from resokerr.core import TypeUtils
+
+
+class Payload:
+    """Object kept alive by a frame's locals."""
+
+
+def _raise_with_local(payload: Payload) -> None:
+    local = payload  # noqa: F841 - referenced from the frame
+    raise ValueError("failed")
+
+
+def _caught(func, *args) -> BaseException:
+    try:
+        func(*args)
+    except BaseException as exc:
+        return exc
+    raise AssertionError("no exception raised")
+
+
+def _implicit_context() -> None:
+    try:
+        raise KeyError("missing")
+    except KeyError:
+        raise RuntimeError("while handling")
+
+
+def _explicit_cause() -> None:
+    try:
+        raise KeyError("missing")
+    except KeyError as exc:
+        raise RuntimeError("wrapped") from exc
+
+
+@pytest.fixture
+def options():
+    """Restore the default exception settings after a test."""
+    yield configure_exception_serialization
+    configure_exception_serialization()
+
+
+class TestExceptionChains:
+    """Test the parts of an exception included in its serialized form."""
+
+    def test_plain_exception(self):
+        """Test a plain exception has only name and message."""
+        assert TypeUtils.serialize(ValueError("bad")) == {"name": "ValueError", "message": "bad"}
+
+    def test_explicit_cause(self):
+        """Test `raise ... from` gives a cause and no context."""
+        data = TypeUtils.serialize(_caught(_explicit_cause))
+        assert data == {
+            "name": "RuntimeError",
+            "message": "wrapped",
+            "cause": {"name": "KeyError", "message": "'missing'"},
+        }
+
+    def test_default_shape(self):
+        """Test by default only name, message and cause are emitted, even with a context or notes."""
+        exc = _caught(_explicit_cause)
+        exc.add_note("note")
+        exc.__cause__.__context__ = OSError("handled")
+        assert Err(cause=exc).to_dict()["cause"] == {
+            "name": "RuntimeError",
+            "message": "wrapped",
+            "cause": {"name": "KeyError", "message": "'missing'"},
+        }
+        assert TypeUtils.serialize(_caught(_implicit_context)) == {"name": "RuntimeError", "message": "while handling"}
+
+    def test_implicit_context(self, options):
+        """Test an exception raised while handling another keeps it as context."""
+        options(context=True)
+        data = TypeUtils.serialize(_caught(_implicit_context))
+        assert data["context"] == {"name": "KeyError", "message": "'missing'"}
+        assert "cause" not in data
+
+    def test_notes(self, options):
+        """Test notes added with add_note() are included."""
+        options(notes=True)
+        exc = ValueError("bad")
+        exc.add_note("while loading config")
+        assert TypeUtils.serialize(exc)["notes"] == ["while loading config"]
+
+    def test_exception_group(self):
+        """Test ExceptionGroup members are serialized."""
+        group = ExceptionGroup("several", [ValueError("a"), ExceptionGroup("inner", [KeyError("b")])])
+        data = TypeUtils.serialize(group)
+        assert data["exceptions"][0] == {"name": "ValueError", "message": "a"}
+        assert data["exceptions"][1]["exceptions"] == [{"name": "KeyError", "message": "'b'"}]
+
+    def test_cycle_cut(self):
+        """Test a cause chain looping back is cut with the cycle marker."""
+        first, second = ValueError("first"), ValueError("second")
+        first.__cause__ = second
+        second.__cause__ = first
+        data = TypeUtils.serialize(first)
+        assert data["cause"]["cause"] == TypeUtils.CYCLE_MARKER
+
+    def test_result_json(self, options):
+        """Test streamed JSON matches to_dict() for rich exceptions."""
+        options(context=True, notes=True)
+        err = Err(cause=ExceptionGroup("group", [_caught(_implicit_context)]))
+        assert err.to_json() == json.dumps(err.to_dict())
+
+
+class TestExceptionOptions:
+    """Test configure_exception_serialization()."""
+
+    def test_depth_limit(self, options):
+        """Test nested exceptions beyond max_depth are truncated."""
+        options(max_depth=1)
+        exc = _caught(_explicit_cause)
+        exc.__cause__.__cause__ = OSError("root")
+        assert TypeUtils.serialize(exc)["cause"]["cause"] == TypeUtils.TRUNCATED_MARKER
+
+    def test_long_chain_does_not_overflow(self):
+        """Test chains longer than the recursion limit serialize within the default depth."""
+        exc = ValueError(0)
+        for index in range(1, 5_000):
+            outer = ValueError(index)
+            outer.__cause__ = exc
+            exc = outer
+        assert TypeUtils.serialize(exc)["message"] == "4999"
+
+    def test_frames(self, options):
+        """Test max_frames includes the innermost frames."""
+        options(max_frames=1)
+        data = TypeUtils.serialize(_caught(_raise_with_local, Payload()))
+        assert len(data["frames"]) == 1
+        assert data["frames"][0]["function"] == "_raise_with_local"
+        assert data["frames"][0]["file"] == __file__
+
+    def test_frames_left_out_by_default(self):
+        """Test frames are not serialized unless configured."""
+        assert "frames" not in TypeUtils.serialize(_caught(_raise_with_local, Payload()))
+
+    def test_context_and_notes_opt_in(self, options):
+        """Test context and notes are left out unless enabled."""
+        exc = _caught(_implicit_context)
+        exc.add_note("note")
+        assert TypeUtils.serialize(exc) == {"name": "RuntimeError", "message": "while handling"}
+        options(context=True, notes=True)
+        assert set(TypeUtils.serialize(exc)) == {"name", "message", "context", "notes"}
+
+    def test_negative_limits_rejected(self):
+        """Test negative limits raise ValueError."""
+        with pytest.raises(ValueError):
+            configure_exception_serialization(max_frames=-1)
+
+
+class TestDetachTraceback:
+    """Test dropping tracebacks held by Err causes."""
+
+    def test_frames_released(self):
+        """Test frame locals are released once the traceback is detached."""
+        payload = Payload()
+        ref = weakref.ref(payload)
+        err = Err(cause=_caught(_raise_with_local, payload), detach_traceback=True)
+        del payload
+        gc.collect()
+        assert ref() is None
+        assert err.cause.__traceback__ is None
+
+    def test_traceback_kept_by_default(self):
+        """Test Err keeps the traceback unless asked to detach it."""
+        err = Err(cause=_caught(_raise_with_local, Payload()))
+        assert err.cause.__traceback__ is not None
+
+    def test_summary_serialized(self, options):
+        """Test recorded frames serialize like live ones and survive pickling."""
+        options(max_frames=10)
+        exc = _caught(_explicit_cause)
+        live = TypeUtils.serialize(exc)
+        err = Err(cause=exc, detach_traceback=True)
+        assert exc.__cause__.__traceback__ is None
+        assert err.to_dict()["cause"] == live
+        # Pickled exceptions keep their attributes but not their chain
+        assert pickle.loads(pickle.dumps(err)).to_dict()["cause"]["frames"] == live["frames"]
@@ -0,0 +1,191 @@
+"""Conformance suite for JSON backends.
+
+Every installed backend must encode the output of `to_dict()` to JSON that
+parses back to the same structure as the stdlib encoder's. Run it against
+a custom backend by registering it with `register_json_backend()` and
+adding its name to BACKENDS.
+"""
+import io
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from resokerr import (
+    Err,
+    JSONBackend,
+    NDJSONWriter,
+    Ok,
+    get_json_backend,
+    register_json_backend,
+    result_from_json,
+    serialization_profile,
+    set_json_backend,
+)
+
+
+@dataclass
+class Point:
+    x: int
+    y: float
+
+
+def _deep(levels: int):
+    root = node = {}
+    for _ in range(levels):
+        node["next"] = node = {}
+    return root
+
+
+def _backend_available(name: str) -> bool:
+    try:
+        set_json_backend(name)
+    except ImportError:
+        return False
+    finally:
+        set_json_backend("json")
+    return True
+
+
+BACKENDS = [
+    pytest.param(name, marks=pytest.mark.skipif(not _backend_available(name), reason=f"{name} not installed"))
+    for name in ("json", "orjson")
+]
+
+RESULTS = [
+    Ok(value=None),
+    Ok(value=[1, -2, 3.25, 1e-7, 1e300, True, False, None, ""]),
+    Ok(value={"nested": {"list": [[], {}, [{"a": [1]}]]}}, metadata={"request": "r-1"}),
+    Ok(value="unicode: é ü 日本 \U0001F600, escapes: \" \\ / \n \t \x00  "),
+    Ok(value={1: "int key", 2.5: "float key", True: "bool key", None: "null key"}),
+    Ok(value=[2 ** 64, -(2 ** 70), 12345678901234567890123]),
+    Ok(value=_deep(300)),
+    Ok(value=[float("nan"), float("inf"), -float("inf"), None], metadata={"ratio": float("nan")}),
+    Err(cause={float("inf"): "key"}),
+    Ok(value=(1, 2)).with_info("loaded", code="I1", details={"rows": 3}).with_warning("slow", stack_trace="tb"),
+    Err(cause=ValueError("bad input")).with_error("failed", code="E1", details={"field": "name"}),
+    Err(cause={"code": 500}, metadata={"attempt": 2, "tags": ["a", "b"]}),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Select a backend for one test, restoring the stdlib one afterwards."""
+    yield set_json_backend(request.param)
+    set_json_backend("json")
+
+
+def _reference(result):
+    """Structure of the stdlib encoding of `result`."""
+    return json.loads(json.dumps(result.to_dict()))
+
+
+class TestConformance:
+    """Test backends produce the same structure as the stdlib encoder."""
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_dumps_shape(self, backend, result):
+        """Test the backend's encoding of to_dict() parses to the stdlib structure."""
+        assert json.loads(backend.dumps(result.to_dict())) == _reference(result)
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_to_json_shape(self, backend, result):
+        """Test to_json() goes through the backend and keeps the structure."""
+        assert json.loads(result.to_json()) == _reference(result)
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_loads_round_trip(self, backend, result):
+        """Test the backend parses stdlib output and result_from_json() rebuilds the result."""
+        text = json.dumps(result.to_dict())
+        assert backend.loads(text) == json.loads(text)
+        assert backend.loads(text.encode()) == json.loads(text)
+        assert result_from_json(result.to_json()).to_dict() == result_from_json(text).to_dict()
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_write_json_shape(self, backend, result):
+        """Test write_json() writes the same structure to text and binary streams."""
+        text, data = io.StringIO(), io.BytesIO()
+        result.write_json(text)
+        result.write_json(data)
+        assert json.loads(text.getvalue()) == _reference(result)
+        assert json.loads(data.getvalue().decode("utf-8")) == _reference(result)
+
+    def test_ndjson_shape(self, backend):
+        """Test NDJSON lines keep the structure and bytes are counted after encoding."""
+        stream = io.BytesIO()
+        with NDJSONWriter(stream, flush_interval=None) as writer:
+            writer.write_many(RESULTS)
+        # Only "\n" separates records: non-ASCII output may hold U+2028
+        lines = stream.getvalue().decode("utf-8").split("\n")[:-1]
+        assert [json.loads(line) for line in lines] == [_reference(result) for result in RESULTS]
+        assert writer.report.bytes_encoded == len(stream.getvalue())
+
+    def test_profiles_respected(self, backend):
+        """Test serialization profiles apply before the backend encodes."""
+        with serialization_profile("dataclass"):
+            result = Ok(value=[Point(1, 0.5)])
+            assert json.loads(result.to_json()) == _reference(result)
+
+    def test_deep_value_beyond_recursion_limit(self, backend):
+        """Test values too deep for a recursive encoder still encode."""
+        text = Ok(value=_deep(5_000)).to_json()
+        assert text.count('"next"') == 5_000
+        assert text.count("{") == text.count("}") == 5_002
+
+
+class TestBackendSelection:
+    """Test registering and selecting backends."""
+
+    def test_default_is_stdlib(self):
+        """Test the stdlib backend is used unless another one is selected."""
+        assert get_json_backend().name == "json"
+        assert Ok(value=1).to_json() == json.dumps(Ok(value=1).to_dict())
+
+    def test_unknown_backend_rejected(self):
+        """Test selecting an unregistered backend raises ValueError."""
+        with pytest.raises(ValueError):
+            set_json_backend("no-such-backend")
+        assert get_json_backend().name == "json"
+
+    def test_auto_falls_back_to_stdlib(self):
+        """Test "auto" selects an installed backend."""
+        try:
+            assert set_json_backend("auto").name in ("json", "orjson")
+        finally:
+            set_json_backend("json")
+
+    def test_custom_backend(self):
+        """Test a registered backend is used by to_json() and keyed separately in the cache."""
+        register_json_backend("indented", lambda: JSONBackend("indented", lambda obj: json.dumps(obj, indent=1), json.loads))
+        result = Ok(value=[1])
+        compact = result.to_json(cache=True)
+        try:
+            set_json_backend("indented")
+            assert result.to_json(cache=True) == json.dumps(result.to_dict(), indent=1)
+        finally:
+            set_json_backend("json")
+        assert result.to_json(cache=True) == compact
+
+    def test_missing_library_raises_import_error(self):
+        """Test a backend whose library is missing raises ImportError when selected."""
+        def factory():
+            raise ImportError("not installed")
+        register_json_backend("missing", factory)
+        with pytest.raises(ImportError):
+            set_json_backend("missing")
+        assert get_json_backend().name == "json"
+
+    def test_builtin_names_reserved(self):
+        """Test the stdlib and auto names cannot be replaced."""
+        with pytest.raises(ValueError):
+            register_json_backend("json", lambda: JSONBackend("json", json.dumps, json.loads))
+
+    def test_environment_variable(self):
+        """Test RESOKERR_JSON_BACKEND is read at import, with a warning for unknown names."""
+        code = "import warnings; warnings.simplefilter('error'); import resokerr"
+        env = {"RESOKERR_JSON_BACKEND": "no-such-backend"}
+        process = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+        assert process.returncode != 0
+        assert "RESOKERR_JSON_BACKEND ignored" in process.stderr
@@ -0,0 +1,174 @@
+"""Tests for streaming JSON output of Ok and Err (to_json / write_json)."""
+import io
+import json
+import pytest
+from enum import IntEnum
+from typing import Any, Dict
+
+from resokerr import Ok, Err, MessageTrace, register_serializer, unregister_serializer
+from resokerr.jsonio import dump, dumps
+
+
+class Priority(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Profile:
+    """Value type implementing to_dict()."""
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "tags": ("a", "b")}
+
+
+class Opaque:
+    """Value type falling back to str()."""
+    def __str__(self) -> str:
+        return "Opaque<é>"
+
+
+def _chained_error() -> Exception:
+    try:
+        try:
+            raise ValueError("inner")
+        except ValueError as inner:
+            raise RuntimeError("outer") from inner
+    except RuntimeError as exc:
+        return exc
+
+
+RESULTS = [
+    Ok(value=None),
+    Ok(value=42),
+    Ok(value="naïve \"quoted\"\n"),
+    Ok(value=[1, 2.5, float("inf"), float("nan"), True, None, (3, 4), [], {}]),
+    Ok(value={"k": {"nested": [Profile("x"), Opaque()]}, 1: "int key", 2.5: "float key",
+              None: "none key", True: "bool key"}),
+    Ok(value=Priority.HIGH, metadata={"request": "abc", "n": [1, 2]}),
+    Ok(value=Profile("y")).with_info("loaded", code="I1", details={"rows": 3})
+                        .with_warning("slow", stack_trace="trace"),
+    Ok(value=1, messages=[MessageTrace.error("converted")]),
+    Err(cause=None),
+    Err(cause=_chained_error(), metadata={"exc": ValueError("in metadata")}),
+    Err(cause="boom").with_error(Profile("msg")).with_info({"structured": [1, 2]}),
+    Err(cause={"code": 500}, messages=[MessageTrace.success("converted")]),
+]
+
+
+class TestToJson:
+    """Test to_json() matches json.dumps(to_dict()) exactly."""
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_matches_json_dumps_of_to_dict(self, result):
+        """Test byte-for-byte compatibility with the dict-based path."""
+        assert result.to_json() == json.dumps(result.to_dict())
+
+    def test_module_dumps_matches_method(self):
+        """Test resokerr.jsonio.dumps is the same as the method."""
+        result = Ok(value={"a": [1, 2]}).with_info("x")
+        assert dumps(result) == result.to_json()
+
+    def test_custom_serializer_respected(self):
+        """Test registered handlers apply to streamed output too."""
+        register_serializer(Opaque, lambda obj: {"opaque": True})
+        try:
+            result = Ok(value=[Opaque()], metadata={"o": Opaque()})
+            assert result.to_json() == json.dumps(result.to_dict())
+            assert '{"opaque": true}' in result.to_json()
+        finally:
+            unregister_serializer(Opaque)
+
+    def test_invalid_key_raises_like_json(self):
+        """Test unsupported dict keys raise TypeError as json.dumps does."""
+        with pytest.raises(TypeError):
+            Ok(value={(1, 2): "tuple key"}).to_json()
+
+
+class TestWriteJson:
+    """Test write_json() streaming into text and binary streams."""
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_text_stream(self, result):
+        """Test writing to a text stream."""
+        buffer = io.StringIO()
+        result.write_json(buffer)
+        assert buffer.getvalue() == json.dumps(result.to_dict())
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_binary_stream(self, result):
+        """Test writing to a binary stream produces ASCII bytes."""
+        buffer = io.BytesIO()
+        result.write_json(buffer)
+        assert buffer.getvalue() == json.dumps(result.to_dict()).encode("ascii")
+
+    def test_writes_in_chunks(self):
+        """Test large values are written in several bounded chunks."""
+        chunks = []
+
+        class Sink:
+            def write(self, text: str) -> None:
+                chunks.append(text)
+
+        result = Ok(value=[{"row": i, "name": f"row {i}"} for i in range(5_000)])
+        dump(result, Sink(), chunk_size=4_096)
+
+        assert len(chunks) > 10
+        assert max(len(chunk) for chunk in chunks) < 4_096 + 256
+        assert "".join(chunks) == json.dumps(result.to_dict())
+
+    def test_large_container_nested_in_small_one_is_streamed(self):
+        """Test a large list wrapped in small dicts is still written in chunks."""
+        chunks = []
+
+        class Sink:
+            def write(self, text: str) -> None:
+                chunks.append(text)
+
+        result = Err(cause={"data": {"rows": list(range(20_000))}})
+        dump(result, Sink(), chunk_size=1_024)
+
+        assert len(chunks) > 10
+        assert "".join(chunks) == json.dumps(result.to_dict())
+
+    def test_large_metadata_is_streamed(self):
+        """Test large metadata is written in bounded chunks too."""
+        chunks = []
+
+        class Sink:
+            def write(self, text: str) -> None:
+                chunks.append(text)
+
+        result = Ok(value=1, metadata={"rows": [{"row": i} for i in range(20_000)]})
+        dump(result, Sink(), chunk_size=1_000)
+
+        assert len(chunks) > 10
+        assert max(len(chunk) for chunk in chunks) < 1_000 + 256
+        assert "".join(chunks) == json.dumps(result.to_dict())
+
+
+class TestNestedStructures:
+    """Test cyclic and deep values in streamed output."""
+
+    def test_cycles_match_to_dict(self):
+        """Test cycles are written with the same marker as to_dict()."""
+        data = {"rows": list(range(200))}
+        data["self"] = data
+        data["nested"] = [{"back": data}, data["rows"]]
+        result = Ok(value=data, metadata={"data": data})
+
+        assert result.to_json() == json.dumps(result.to_dict())
+        assert '"<cycle>"' in result.to_json()
+
+    def test_deep_value(self):
+        """Test values nested beyond the recursion limit can be written."""
+        root = node = []
+        for _ in range(5_000):
+            child = []
+            node.append(child)
+            node = child
+
+        text = Err(cause=root).to_json()
+        assert text.startswith('{"is_ok": false, "is_err": true, "cause": [[[')
+        assert text.count("[") == 5_002
@@ -0,0 +1,188 @@
+"""Tests for LazyResult deferred pipelines."""
+import pytest
+
+from resokerr import Ok, Err, LazyResult, TraceSeverityLevel
+
+
+class Counter:
+    """Callable recording how often it ran."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
+
+
+def parse_int(text):
+    try:
+        return Ok(value=int(text)).with_info("parsed")
+    except ValueError as exc:
+        return Err(cause=exc).with_error("not a number")
+
+
+class TestDeferral:
+    """Test operations run only when the chain is forced."""
+
+    def test_nothing_runs_until_forced(self):
+        """Test recording operations does not call them."""
+        step = Counter(lambda v: v + 1)
+        lazy = LazyResult(Ok(value=1)).map(step).map(step)
+        assert step.calls == 0
+        assert not lazy.forced
+        assert lazy.unwrap() == 3
+        assert step.calls == 2
+
+    def test_source_callable_deferred(self):
+        """Test a callable source runs on first force only."""
+        source = Counter(lambda: Ok(value="7"))
+        lazy = LazyResult(source).and_then(parse_int)
+        assert source.calls == 0
+        assert lazy.is_ok()
+        assert source.calls == 1
+
+    def test_forced_result_memoized(self):
+        """Test forcing twice runs the chain once and returns the same instance."""
+        step = Counter(lambda v: v * 2)
+        lazy = LazyResult(Ok(value=2)).map(step).with_info("doubled")
+        first = lazy.force()
+        assert lazy.force() is first
+        assert lazy.to_dict() == first.to_dict()
+        assert step.calls == 1
+        assert lazy.forced
+
+    def test_unused_branch_never_runs(self):
+        """Test branches that are not forced cost nothing."""
+        expensive = Counter(lambda v: v ** 100)
+        base = LazyResult(Ok(value=3)).map(lambda v: v + 1)
+        unused = base.map(expensive)  # noqa: F841
+        assert base.map(str).unwrap() == "4"
+        assert expensive.calls == 0
+
+    def test_shared_prefix_memoized(self):
+        """Test a step shared by two branches runs once."""
+        shared = Counter(lambda v: v + 1)
+        base = LazyResult(Ok(value=1)).map(shared)
+        left, right = base.map(lambda v: v * 10), base.map(lambda v: v * 100)
+        assert (left.unwrap(), right.unwrap()) == (20, 200)
+        assert shared.calls == 1
+
+    def test_branch_created_after_forcing(self):
+        """Test a step runs once when a second branch is recorded after the first was forced."""
+        shared = Counter(lambda v: v + 1)
+        base = LazyResult(Ok(value=1)).map(shared)
+        first = base.with_info("a").force()
+        second = base.with_info("b").force()
+        assert shared.calls == 1
+        assert (first.value, second.value) == (2, 2)
+        assert [m.message for m in second.messages] == ["b"]
+        assert base.force().value == 2
+        assert shared.calls == 1
+
+    def test_exception_not_memoized(self):
+        """Test a failing step raises when forced and runs again next time, after the steps before it."""
+        state = {"fail": True}
+
+        def flaky(v):
+            if state["fail"]:
+                raise RuntimeError("flaky")
+            return v
+
+        lazy = LazyResult(Ok(value=1)).map(flaky)
+        with pytest.raises(RuntimeError):
+            lazy.force()
+        state["fail"] = False
+        assert lazy.unwrap() == 1
+
+
+class TestShortCircuit:
+    """Test Ok-side operations are skipped after the first Err."""
+
+    def test_skips_after_err(self):
+        """Test map/and_then/inspect/with_success after an Err do not run."""
+        after = Counter(lambda v: v)
+        lazy = (LazyResult(Ok(value="x")).and_then(parse_int)
+                .map(after).and_then(after).inspect(after).with_success("never"))
+        assert lazy.is_err()
+        assert after.calls == 0
+        assert [m.message for m in lazy.messages] == ["not a number"]
+
+    def test_err_source_returned_unchanged(self):
+        """Test an Err passing through Ok-side operations is not rebuilt."""
+        err = Err(cause="boom").with_error("failed")
+        assert LazyResult(err).map(str).and_then(parse_int).force() is err
+
+    def test_recovery(self):
+        """Test or_else and map_err run on the Err side only."""
+        lazy = (LazyResult(Ok(value="x")).and_then(parse_int)
+                .map_err(str).or_else(lambda cause: Ok(value=0).with_info(f"default for {cause!r}"))
+                .map(lambda v: v + 1).map_err(pytest.fail))
+        result = lazy.force()
+        assert result.value == 1
+        assert result.messages[0].severity is TraceSeverityLevel.WARNING
+
+    def test_side_specific_messages(self):
+        """Test with_error only applies to Err and with_success only to Ok."""
+        ok = LazyResult(Ok(value=1)).with_error("ignored").with_success("done").force()
+        err = LazyResult(Err(cause=1)).with_success("ignored").with_error("failed").force()
+        assert [m.message for m in ok.messages] == ["done"]
+        assert [m.message for m in err.messages] == ["failed"]
+
+
+class TestEagerEquivalence:
+    """Test forced chains match the same chain run eagerly."""
+
+    @pytest.mark.parametrize("text", ["21", "x", "-1"])
+    def test_matches_eager(self, text):
+        """Test values, messages and metadata match the eager combinators."""
+        def check(n):
+            return Ok(value=n, metadata={"checked": True}) if n > 0 else Err(cause=n).with_error("not positive")
+
+        def recover(cause):
+            return Ok(value=0).with_warning("recovered")
+
+        eager = (Ok(value=text).with_success("received").and_then(parse_int).and_then(check)
+                 .with_info("checked").or_else(recover).with_metadata({"request": 1}))
+        lazy = (LazyResult(Ok(value=text)).with_success("received").and_then(parse_int).and_then(check)
+                .with_info("checked").or_else(recover).with_metadata({"request": 1}))
+        assert lazy.force() == eager
+        assert lazy.to_dict() == eager.to_dict()
+
+    def test_metadata_copied_when_recorded(self):
+        """Test metadata changed after with_metadata() is not seen."""
+        metadata = {"a": 1}
+        lazy = LazyResult(Ok(value=1)).with_metadata(metadata)
+        metadata["a"] = 2
+        assert lazy.metadata == {"a": 1}
+
+
+class TestForcingAccessors:
+    """Test the attributes that force the chain."""
+
+    def test_delegated_attributes(self):
+        """Test result attributes are read from the forced result."""
+        lazy = LazyResult(Ok(value=5)).with_warning("slow")
+        assert lazy.value == 5
+        assert lazy.has_warnings()
+        assert lazy.to_json() == lazy.force().to_json()
+
+    def test_repr(self):
+        """Test the repr tells pending chains apart."""
+        lazy = LazyResult(Ok(value=1)).map(str)
+        assert repr(lazy) == "LazyResult(<pending>)"
+        lazy.force()
+        assert repr(lazy) == "LazyResult(Ok(value='1', messages=(), metadata=None))"
+
+    def test_invalid_source(self):
+        """Test sources other than results and callables are rejected."""
+        with pytest.raises(TypeError):
+            LazyResult(42)  # type: ignore[arg-type]
+
+    def test_long_chain(self):
+        """Test chains longer than the recursion limit are forced iteratively."""
+        lazy = LazyResult(Ok(value=0))
+        for _ in range(5_000):
+            lazy = lazy.map(lambda v: v + 1)
+        assert lazy.unwrap() == 5_000
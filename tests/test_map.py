@@ -630,3 +630,53 @@ class TestMapPatterns:
         
         assert name_result.value == "Alice"
         assert phone_result.value is None  # Extracted None from dict
+
+
+# ============================================================================
+# Derived Instance Fast Path Tests
+# ============================================================================
+
+class TestDerivedInstanceFastPath:
+    """Test that map/with_metadata reuse validated state without changing invariants."""
+
+    def test_ok_map_shares_messages_and_metadata(self):
+        """Test Ok.map carries the normalized messages and frozen metadata over."""
+        ok = Ok(value=1, messages=[MessageTrace.error("e")], metadata={"k": "v"})
+        mapped = ok.map(lambda x: x + 1)
+
+        assert mapped.messages is ok.messages
+        assert mapped.metadata is ok.metadata
+        assert mapped.warning_messages[0].details["_converted_from"]["from"] == "error"
+
+    def test_err_map_shares_messages_and_metadata(self):
+        """Test Err.map carries the normalized messages and frozen metadata over."""
+        err = Err(cause="x", messages=[MessageTrace.success("s")], metadata={"k": "v"})
+        mapped = err.map(str.upper)
+
+        assert mapped.messages is err.messages
+        assert mapped.metadata is err.metadata
+        assert mapped.has_info()
+        assert all(m.severity != TraceSeverityLevel.SUCCESS for m in mapped.messages)
+
+    def test_derived_instance_equals_constructed_instance(self):
+        """Test fast-path instances are indistinguishable from constructed ones."""
+        ok = Ok(value=2, metadata={"k": 1}).with_info("i")
+        mapped = ok.map(lambda x: x * 2)
+
+        assert mapped == Ok(value=4, messages=ok.messages, metadata={"k": 1})
+
+    def test_with_metadata_copies_new_mapping(self):
+        """Test with_metadata still freezes a copy of the given mapping."""
+        source: Dict[str, Any] = {"k": "v"}
+        ok = Ok(value=1).with_info("i").with_metadata(source)
+        source["k"] = "changed"
+
+        assert isinstance(ok.metadata, MappingProxyType)
+        assert ok.metadata["k"] == "v"
+        assert len(ok.messages) == 1
+
+    def test_derived_instance_is_frozen(self):
+        """Test fast-path instances remain immutable."""
+        mapped = Err(cause="x").map(str.upper)
+        with pytest.raises(AttributeError):
+            mapped.cause = "y"
@@ -0,0 +1,157 @@
+"""Tests for the persistent message log backing Ok and Err messages."""
+import pytest
+
+from resokerr.core import Ok, Err, MessageTrace, TraceSeverityLevel, _MessageLog
+
+
+class TestMessageLog:
+    """Test _MessageLog persistence and structural sharing."""
+
+    def test_empty_log(self):
+        """Test an empty log materializes to an empty tuple."""
+        log = _MessageLog()
+        assert len(log) == 0
+        assert log.as_tuple() == ()
+
+    def test_append_returns_new_version(self):
+        """Test append leaves the original version unchanged."""
+        first = MessageTrace.info("first")
+        second = MessageTrace.info("second")
+        log1 = _MessageLog((first,))
+        log2 = log1.append(second)
+
+        assert log1.as_tuple() == (first,)
+        assert log2.as_tuple() == (first, second)
+
+    def test_sequential_appends_share_backing_list(self):
+        """Test appending to the newest version reuses the same backing list."""
+        log = _MessageLog()
+        versions = []
+        for i in range(10):
+            log = log.append(MessageTrace.info(f"msg {i}"))
+            versions.append(log)
+
+        backing = versions[0]._items
+        assert all(version._items is backing for version in versions)
+        assert [len(version) for version in versions] == list(range(1, 11))
+
+    def test_branching_copies_prefix(self):
+        """Test appending to an older version branches off without corrupting others."""
+        base = _MessageLog().append(MessageTrace.info("base"))
+        left = base.append(MessageTrace.info("left"))
+        right = base.append(MessageTrace.info("right"))
+
+        assert [m.message for m in base.as_tuple()] == ["base"]
+        assert [m.message for m in left.as_tuple()] == ["base", "left"]
+        assert [m.message for m in right.as_tuple()] == ["base", "right"]
+        assert left._items is not right._items
+
+    def test_repeated_branching_does_not_grow_shared_list(self):
+        """Test fanning out from one version leaves the shared backing list alone."""
+        base = _MessageLog().append(MessageTrace.info("base"))
+        head = base.append(MessageTrace.info("head"))
+        for i in range(50):
+            base.append(MessageTrace.info(f"branch {i}"))
+
+        assert len(head._items) == 2
+
+    def test_as_tuple_is_cached(self):
+        """Test the tuple view is built once per version."""
+        log = _MessageLog().append(MessageTrace.info("a"))
+        assert log.as_tuple() is log.as_tuple()
+
+
+class TestResultMessageLog:
+    """Test Ok/Err messages behave like tuples while backed by the log."""
+
+    def test_ok_long_chain_keeps_every_version(self):
+        """Test each intermediate Ok keeps its own messages."""
+        results = [Ok(value=1)]
+        for i in range(200):
+            results.append(results[-1].with_info(f"step {i}"))
+
+        for n, result in enumerate(results):
+            assert isinstance(result.messages, tuple)
+            assert len(result.messages) == n
+            assert [m.message for m in result.messages] == [f"step {i}" for i in range(n)]
+
+    def test_err_branching_from_same_instance(self):
+        """Test appending twice to the same Err gives independent results."""
+        base = Err(cause="boom").with_error("failed")
+        left = base.with_info("left")
+        right = base.with_warning("right")
+
+        assert len(base.messages) == 1
+        assert [m.message for m in left.messages] == ["failed", "left"]
+        assert [m.message for m in right.messages] == ["failed", "right"]
+        assert right.messages[-1].severity == TraceSeverityLevel.WARNING
+
+    def test_messages_materialized_once(self):
+        """Test repeated reads of messages return the same tuple."""
+        ok = Ok(value=1).with_info("a").with_warning("b")
+        assert ok.messages is ok.messages
+
+    def test_derived_messages_still_frozen(self):
+        """Test lazily materialized messages cannot be reassigned."""
+        ok = Ok(value=1).with_info("a")
+        with pytest.raises(AttributeError):
+            ok.messages = ()
+
+    def test_equality_with_constructor_built_instance(self):
+        """Test derived instances compare equal to directly constructed ones."""
+        derived = Ok(value=1).with_info("a").with_success("b")
+        direct = Ok(value=1, messages=(MessageTrace.info("a"), MessageTrace.success("b")))
+        assert derived == direct
+        assert repr(derived) == repr(direct)
+
+    def test_constructor_still_normalizes_messages(self):
+        """Test ERROR messages from another result are still converted for Ok."""
+        err = Err(cause="x").with_error("bad")
+        ok = Ok(value=1, messages=err.messages).with_info("after")
+
+        assert [m.severity for m in ok.messages] == [TraceSeverityLevel.WARNING, TraceSeverityLevel.INFO]
+
+
+class TestSeverityIndex:
+    """Test the per-instance severity index used by has_* and *_messages."""
+
+    def test_has_checks_match_messages(self):
+        """Test has_* checks agree with the per-severity tuples."""
+        ok = Ok(value=1).with_info("i").with_success("s")
+        assert ok.has_info() and ok.has_successes()
+        assert not ok.has_warnings()
+
+        err = Err(cause="x", messages=[MessageTrace.warning("w")]).with_error("e")
+        assert err.has_errors() and err.has_warnings()
+        assert not err.has_info()
+
+    def test_severity_views_are_cached(self):
+        """Test *_messages properties return the same tuple on every call."""
+        ok = Ok(value=1, messages=[MessageTrace.info("a"), MessageTrace.warning("b")]).with_info("c")
+        assert ok.info_messages is ok.info_messages
+        assert ok.warning_messages is ok.warning_messages
+        assert [m.message for m in ok.info_messages] == ["a", "c"]
+
+    def test_missing_severity_returns_empty_tuple(self):
+        """Test a severity that is absent yields an empty tuple."""
+        err = Err(cause="x").with_error("e")
+        assert err.info_messages == ()
+        assert err.warning_messages == ()
+
+    def test_converted_messages_are_indexed_by_new_severity(self):
+        """Test the index reflects ERROR to WARNING and SUCCESS to INFO conversion."""
+        ok = Ok(value=1, messages=[MessageTrace.error("e")])
+        assert ok.has_warnings()
+        assert len(ok.warning_messages) == 1
+
+        err = Err(cause="x", messages=[MessageTrace.success("s")])
+        assert err.has_info()
+        assert not err.has_errors()
+
+    def test_index_is_per_version(self):
+        """Test appending does not change the index of the original instance."""
+        base = Ok(value=1).with_info("i")
+        extended = base.with_warning("w")
+        assert not base.has_warnings()
+        assert extended.has_warnings()
+        assert base.warning_messages == ()
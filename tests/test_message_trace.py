@@ -1,5 +1,7 @@
 """Tests for MessageTrace class."""
+import pickle
 import pytest
+import weakref
 from types import MappingProxyType
 from typing import Any, Dict
 
@@ -133,6 +135,53 @@ class TestMessageTraceImmutability:
         assert isinstance(msg.details, MappingProxyType)
         assert msg.details["key"] == "value"
 
+    def test_message_trace_has_no_instance_dict(self):
+        """Test that MessageTrace is slotted and carries no per-instance __dict__."""
+        msg = MessageTrace.info("Test", details={"key": "value"})
+        assert not hasattr(msg, "__dict__")
+
+    def test_details_snapshot_of_mapping_proxy_source(self):
+        """Test that details are copied even when passed as a MappingProxyType."""
+        source = {"key": "value"}
+        msg = MessageTrace.warning("Test", details=MappingProxyType(source))
+        source["key"] = "modified"
+        assert msg.details["key"] == "value"
+
+    def test_empty_details_preserved(self):
+        """Test that empty details stay an empty mapping rather than None."""
+        msg = MessageTrace.info("Test", details={})
+        assert msg.details is not None
+        assert dict(msg.details) == {}
+
+    def test_details_keep_insertion_order_and_equality(self):
+        """Test that packed details round-trip with order and compare equal."""
+        details = {"b": 1, "a": [1, 2], "c": None}
+        msg = MessageTrace.error("Test", details=details)
+        assert list(msg.details.items()) == list(details.items())
+        assert msg == MessageTrace.error("Test", details=dict(details))
+
+    def test_details_view_cached(self):
+        """Test reading details returns the same view each time, and serialization is unchanged."""
+        msg = MessageTrace.info("Test", details={"a": 1})
+        before = msg.to_dict()
+        assert msg.details is msg.details
+        assert msg.to_dict() == before
+        assert pickle.loads(pickle.dumps(msg)) == msg
+
+    def test_weak_references(self):
+        """Test traces support weak references."""
+        msg = MessageTrace.info("Test")
+        assert weakref.ref(msg)() is msg
+
+    def test_equality_ignores_details_order(self):
+        """Test traces with the same details in another order, or none, compare as dicts do."""
+        msg = MessageTrace.info("Test", details={"a": 1, "b": 2})
+        assert msg == MessageTrace.info("Test", details={"b": 2, "a": 1})
+        assert msg != MessageTrace.info("Test", details={"a": 1})
+        assert msg != MessageTrace.info("Test")
+        assert MessageTrace.info("Test", details={}) != MessageTrace.info("Test")
+        assert MessageTrace.info("Test") == MessageTrace.info("Test")
+
 
 class TestMessageTraceSeverityLevels:
     """Test TraceSeverityLevel enum."""
@@ -0,0 +1,141 @@
+"""Tests for the NDJSON batch writer."""
+import asyncio
+import gzip
+import io
+import json
+import lzma
+import pytest
+
+from resokerr import Ok, Err, NDJSONWriter, NDJSONReport, write_ndjson, write_ndjson_async
+
+
+def _results(count: int):
+    for i in range(count):
+        if i % 3 == 0:
+            yield Err(cause=f"failure {i}").with_error("failed", code="E1")
+        else:
+            yield Ok(value={"row": i}, metadata={"batch": 1}).with_info("processed")
+
+
+def _expected_lines(count: int):
+    return [json.dumps(result.to_dict()) for result in _results(count)]
+
+
+class CountingBytesIO(io.BytesIO):
+    """BytesIO recording how many write calls it received."""
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+class TestNDJSONWriter:
+    """Test writing results as NDJSON lines."""
+
+    def test_lines_match_to_dict_schema(self):
+        """Test each line is json.dumps(result.to_dict())."""
+        buffer = io.BytesIO()
+        report = write_ndjson(_results(50), buffer)
+
+        assert buffer.getvalue().decode("ascii").splitlines() == _expected_lines(50)
+        assert report.records == 50
+
+    def test_report_counts_bytes(self):
+        """Test the report counts encoded and written bytes."""
+        buffer = io.BytesIO()
+        report = write_ndjson(_results(20), buffer)
+
+        assert isinstance(report, NDJSONReport)
+        assert report.bytes_encoded == len(buffer.getvalue())
+        assert report.bytes_written == len(buffer.getvalue())
+        assert report.seconds >= 0
+        assert report.records_per_second >= 0
+
+    def test_bulk_writes_bounded_by_flush_size(self):
+        """Test lines are written in bulk rather than one write per record."""
+        buffer = CountingBytesIO()
+        write_ndjson(_results(1_000), buffer, flush_size=16 * 1024, flush_interval=None)
+
+        assert 1 < buffer.writes < 100
+
+    def test_deep_value_streamed(self):
+        """Test values too deep for the recursive encoder are still written."""
+        root = node = {}
+        for _ in range(5_000):
+            node["next"] = node = {}
+        results = [Ok(value=1), Ok(value=root), Err(cause="x")]
+        buffer = io.BytesIO()
+        write_ndjson(results, buffer)
+
+        assert buffer.getvalue().decode("ascii").split("\n")[:-1] == [result.to_json() for result in results]
+
+    def test_flush_interval_zero_flushes_every_record(self):
+        """Test a zero flush interval writes each record out immediately."""
+        buffer = CountingBytesIO()
+        with NDJSONWriter(buffer, flush_interval=0) as writer:
+            writer.write(Ok(value=1))
+            assert buffer.getvalue().endswith(b"\n")
+
+    def test_gzip_compression(self):
+        """Test gzip-compressed output decompresses to the same lines."""
+        buffer = io.BytesIO()
+        report = write_ndjson(_results(200), buffer, compression="gzip")
+
+        lines = gzip.decompress(buffer.getvalue()).decode("ascii").splitlines()
+        assert lines == _expected_lines(200)
+        assert report.bytes_written == len(buffer.getvalue())
+        assert report.bytes_written < report.bytes_encoded
+
+    def test_lzma_compression(self):
+        """Test lzma-compressed output decompresses to the same lines."""
+        buffer = io.BytesIO()
+        write_ndjson(_results(200), buffer, compression="lzma")
+
+        assert lzma.decompress(buffer.getvalue()).decode("ascii").splitlines() == _expected_lines(200)
+
+    def test_write_to_path(self, tmp_path):
+        """Test writing to a path creates and closes the file."""
+        path = tmp_path / "results.ndjson.gz"
+        write_ndjson(_results(10), path, compression="gzip")
+
+        with gzip.open(path, "rt") as fp:
+            assert fp.read().splitlines() == _expected_lines(10)
+
+    def test_stream_target_left_open(self):
+        """Test a stream passed in is not closed by the writer."""
+        buffer = io.BytesIO()
+        write_ndjson(_results(3), buffer, compression="gzip")
+        assert not buffer.closed
+
+    def test_write_after_close_raises(self):
+        """Test writing to a closed writer raises ValueError."""
+        writer = NDJSONWriter(io.BytesIO())
+        writer.close()
+        assert writer.closed
+        with pytest.raises(ValueError):
+            writer.write(Ok(value=1))
+
+    def test_invalid_compression(self):
+        """Test unknown compression names are rejected."""
+        with pytest.raises(ValueError):
+            NDJSONWriter(io.BytesIO(), compression="zip")  # type: ignore[arg-type]
+
+
+class TestNDJSONAsync:
+    """Test writing async iterables of results."""
+
+    def test_async_iterable(self):
+        """Test write_ndjson_async consumes an async generator."""
+        async def produce():
+            for result in _results(30):
+                await asyncio.sleep(0)
+                yield result
+
+        buffer = io.BytesIO()
+        report = asyncio.run(write_ndjson_async(produce(), buffer))
+
+        assert report.records == 30
+        assert buffer.getvalue().decode("ascii").splitlines() == _expected_lines(30)
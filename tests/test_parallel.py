@@ -0,0 +1,91 @@
+"""Tests for parallel batch serialization with serialize_many."""
+import gc
+import multiprocessing
+import weakref
+from dataclasses import dataclass
+
+import pytest
+
+from resokerr import Ok, Err, serialize_many, serialization_profile
+from resokerr import parallel
+
+
+@dataclass
+class Row:
+    id: int
+
+
+def _results(count: int):
+    for i in range(count):
+        if i % 5 == 0:
+            yield Err(cause=f"failure {i}", metadata={"i": i}).with_error("failed", code="E1")
+        else:
+            yield Ok(value={"row": i}).with_info("processed", details={"i": i})
+
+
+class TestSerializeMany:
+    """Test serialize_many output and ordering."""
+
+    def test_in_process_below_threshold(self, monkeypatch):
+        """Test small batches never start a process pool."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("pool started")
+
+        monkeypatch.setattr(parallel, "ProcessPoolExecutor", no_pool)
+        output = list(serialize_many(_results(50), workers=4, min_parallel=100))
+        assert output == [result.to_dict() for result in _results(50)]
+
+    def test_parallel_preserves_order(self):
+        """Test output from worker processes comes back in input order."""
+        output = list(serialize_many(_results(2_000), workers=2, chunk_size=64, min_parallel=100))
+        assert output == [result.to_dict() for result in _results(2_000)]
+
+    def test_json_output(self):
+        """Test output="json" yields to_json() strings."""
+        output = list(serialize_many(_results(300), workers=2, chunk_size=50, min_parallel=10, output="json"))
+        assert output == [result.to_json() for result in _results(300)]
+
+    def test_streams_lazily(self):
+        """Test the input is consumed as output is requested, not all at once."""
+        consumed = []
+
+        def produce():
+            for result in _results(100_000):
+                consumed.append(1)
+                yield result
+
+        output = serialize_many(produce(), workers=2, chunk_size=100, min_parallel=100)
+        assert next(output) == next(_results(1)).to_dict()
+        assert len(consumed) < 10_000
+        output.close()
+
+    def test_read_ahead_released(self):
+        """Test results read ahead are not kept alive once consumed."""
+        refs = []
+
+        def produce():
+            for i in range(5):
+                row = Row(i)
+                refs.append(weakref.ref(row))
+                yield row
+
+        source, small = parallel._peek(produce(), 3)
+        assert not small
+        for _ in range(4):
+            next(source)
+        gc.collect()
+        assert refs[0]() is None
+
+    def test_profiles_applied_in_spawned_workers(self):
+        """Test the caller's serialization profiles reach fresh worker processes."""
+        results = [Ok(value=Row(i)) for i in range(20)]
+        with serialization_profile("dataclass"):
+            output = list(serialize_many(results, workers=2, chunk_size=5, min_parallel=1,
+                                         mp_context=multiprocessing.get_context("spawn")))
+        assert [data["value"] for data in output] == [{"id": i} for i in range(20)]
+
+    @pytest.mark.parametrize("kwargs", [{"workers": 0}, {"chunk_size": 0}, {"output": "yaml"}])
+    def test_invalid_arguments(self, kwargs):
+        """Test invalid arguments are rejected when called."""
+        with pytest.raises(ValueError):
+            serialize_many([], **kwargs)
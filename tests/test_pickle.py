@@ -0,0 +1,149 @@
+"""Tests for pickling Ok, Err and MessageTrace."""
+import array
+import copy
+import pickle
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+
+from resokerr import Ok, Err, MessageTrace, TraceSeverityLevel
+
+
+def _process(n: int):
+    """Worker returning results with metadata and details from a child process."""
+    if n % 2:
+        return Err(cause=ValueError(f"odd {n}"), metadata={"n": n}).with_error("rejected", details={"n": n})
+    return Ok(value=n * 10, metadata={"n": n}).with_info("accepted", code="I1", details={"n": n})
+
+
+def _echo(result):
+    """Worker returning its argument after a round-trip through the pool."""
+    return result.with_warning("seen by worker")
+
+
+RESULTS = [
+    Ok(value=None),
+    Ok(value=[1, 2], metadata={"request": "abc", "nested": {"a": [1]}}),
+    Ok(value="x").with_success("done").with_info("i", code="I1", details={"rows": 3}).with_warning("w", stack_trace="tb"),
+    Err(cause="boom"),
+    Err(cause={"code": 500}, metadata={"attempt": 2}).with_error("e", details={"retry": True}).with_info("i"),
+]
+
+
+class TestPickleRoundTrip:
+    """Test pickle round-trips keep values and immutability."""
+
+    @pytest.mark.parametrize("result", RESULTS)
+    @pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+    def test_round_trip(self, result, protocol):
+        """Test results survive pickling with every supported protocol."""
+        restored = pickle.loads(pickle.dumps(result, protocol=protocol))
+
+        assert restored == result
+        assert restored.to_dict() == result.to_dict()
+
+    def test_message_trace_round_trip(self):
+        """Test every MessageTrace field survives pickling."""
+        trace = MessageTrace.error("failed", code="E1", details={"path": ["a"]}, stack_trace="tb")
+        assert pickle.loads(pickle.dumps(trace)) == trace
+
+    def test_immutable_after_unpickling(self):
+        """Test metadata and details are read-only again after unpickling."""
+        restored = pickle.loads(pickle.dumps(RESULTS[2].with_metadata({"a": 1})))
+
+        with pytest.raises(TypeError):
+            restored.metadata["a"] = 2  # type: ignore[index]
+        with pytest.raises(TypeError):
+            restored.messages[1].details["rows"] = 4  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            restored.value = "changed"  # type: ignore[misc]
+
+    def test_severity_queries_after_unpickling(self):
+        """Test the severity index is rebuilt for unpickled results."""
+        restored = pickle.loads(pickle.dumps(RESULTS[4]))
+        assert restored.has_errors() and restored.has_info() and not restored.has_warnings()
+        assert restored.error_messages[0].severity is TraceSeverityLevel.ERROR
+
+    def test_compact_layout(self):
+        """Test the severity enum and unset fields are not written."""
+        payload = pickle.dumps(MessageTrace.info("x"), protocol=pickle.HIGHEST_PROTOCOL)
+        assert b"TraceSeverityLevel" not in payload
+        assert b"stack_trace" not in payload
+        assert len(payload) < 64
+
+    def test_copy_and_deepcopy(self):
+        """Test copy and deepcopy go through the same reduction."""
+        result = RESULTS[1]
+        assert copy.copy(result) == result
+        assert copy.deepcopy(result) == result
+
+
+class TestProcessPool:
+    """Test results crossing process boundaries."""
+
+    def test_results_returned_from_workers(self):
+        """Test workers can return results with metadata and details."""
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_process, range(8)))
+
+        assert [r.is_ok() for r in results] == [n % 2 == 0 for n in range(8)]
+        assert results[2].value == 20 and results[2].metadata == {"n": 2}
+        assert results[3].error_messages[0].details == {"n": 3}
+
+    def test_results_sent_to_workers(self):
+        """Test results can be passed to workers and extended there."""
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_echo, RESULTS))
+
+        for original, returned in zip(RESULTS, results):
+            assert returned.messages[:-1] == original.messages
+            assert returned.metadata == original.metadata
+            assert returned.has_warnings()
+
+
+class TestOutOfBandBuffers:
+    """Test bytes-like payloads pickled with protocol 5."""
+
+    def test_out_of_band_not_copied(self):
+        """Test the payload travels out-of-band and unwraps to a view over the same memory."""
+        tile = bytearray(1_000_000)
+        buffers = []
+        data = pickle.dumps(Ok(value=tile).with_info("tile"), protocol=5, buffer_callback=buffers.append)
+
+        assert len(data) < 200
+        restored = pickle.loads(data, buffers=buffers)
+        tile[0] = 255
+        view = restored.unwrap()
+        assert isinstance(view, memoryview)
+        assert view[0] == 255
+        assert restored.info_messages[0].message == "tile"
+
+    def test_err_cause(self):
+        """Test Err causes are sent out-of-band as well."""
+        buffers = []
+        data = pickle.dumps(Err(cause=b"blob"), protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        assert bytes(pickle.loads(data, buffers=buffers).cause) == b"blob"
+
+    @pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+    def test_in_band_types_kept(self, protocol):
+        """Test in-band bytes, bytearray and array.array payloads keep their type."""
+        for value in (b"blob", bytearray(b"blob"), array.array("i", [1, 2, 3]), array.array("B", b"ab")):
+            restored = pickle.loads(pickle.dumps(Ok(value=value), protocol=protocol))
+            assert type(restored.value) is type(value)
+            assert restored.value == value
+
+    @pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+    def test_memoryview_payload(self, protocol):
+        """Test memoryviews, which pickle rejects on their own, keep their format and shape."""
+        grid = memoryview(bytearray(range(24))).cast("i", (2, 3))
+        restored = pickle.loads(pickle.dumps(Ok(value=grid), protocol=protocol)).value
+        assert restored.format == "i" and restored.shape == (2, 3)
+        assert restored.tolist() == grid.tolist()
+
+    def test_array_payload(self):
+        """Test array.array payloads come back as typed memoryviews with protocol 5."""
+        samples = array.array("d", [0.5, 1.5])
+        buffers = []
+        data = pickle.dumps(Ok(value=samples), protocol=5, buffer_callback=buffers.append)
+        restored = pickle.loads(data, buffers=buffers).value
+        assert restored.format == "d" and restored.tolist() == [0.5, 1.5]
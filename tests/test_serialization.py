@@ -1,5 +1,6 @@
 """Tests for Ok and Err to_dict() serialization methods."""
 import json
+import pickle
 import pytest
 from typing import Any, Dict
 
@@ -449,3 +450,86 @@ class TestToDictWithConvertedMessages:
         assert result["messages"][0]["severity"] == "info"
         assert result["messages"][0]["message"] == "This was a success"
         assert "_converted_from" in result["messages"][0]["details"]
+
+
+class TestSerializationCache:
+    """Test opt-in memoized serialization on Ok and Err."""
+
+    def test_to_dict_cache_returns_same_view(self):
+        """Test cached to_dict() is built once and reused."""
+        ok = Ok(value={"items": [1, 2]}, metadata={"k": "v"}).with_info("done")
+        first = ok.to_dict(cache=True)
+
+        assert first is ok.to_dict(cache=True)
+        assert first["value"]["items"] == [1, 2]
+        assert first["metadata"]["k"] == "v"
+        assert first == ok.to_dict()
+
+    def test_cached_view_is_read_only(self):
+        """Test callers cannot corrupt the cached serialized form."""
+        err = Err(cause={"code": 1, "tags": ["a"]}).with_error("failed")
+        view = err.to_dict(cache=True)
+
+        with pytest.raises(TypeError):
+            view["cause"] = "other"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            view["cause"]["code"] = 2  # type: ignore[index]
+        with pytest.raises(TypeError):
+            view["cause"]["tags"].append("b")  # type: ignore[union-attr]
+        with pytest.raises(TypeError):
+            view["cause"].update(code=2)  # type: ignore[union-attr]
+        assert err.to_dict(cache=True)["cause"]["code"] == 1
+
+    def test_cached_dict_json_encodable(self):
+        """Test the cached output encodes like the uncached one."""
+        err = Err(cause={"code": 1, "tags": ["a"]}, metadata={"k": [1]}).with_error("failed")
+        assert json.dumps(err.to_dict(cache=True)) == json.dumps(err.to_dict())
+        assert pickle.loads(pickle.dumps(err.to_dict(cache=True))) == err.to_dict()
+
+    def test_cached_deep_value(self):
+        """Test values nested beyond the recursion limit can be cached."""
+        root = node = {}
+        for _ in range(5_000):
+            node["next"] = node = {}
+        cached = Ok(value=root).to_dict(cache=True)
+        depth, node = 0, cached["value"]
+        while node:
+            node = node["next"]
+            depth += 1
+        assert depth == 5_000
+
+    def test_uncached_to_dict_unaffected(self):
+        """Test the default to_dict() still returns fresh mutable dicts."""
+        ok = Ok(value=[1, 2])
+        ok.to_dict(cache=True)
+        fresh = ok.to_dict()
+
+        assert isinstance(fresh, dict)
+        assert fresh["value"] == [1, 2]
+        fresh["value"].append(3)
+        assert ok.to_dict()["value"] == [1, 2]
+
+    def test_to_json_cache(self):
+        """Test cached to_json() returns the memoized string."""
+        err = Err(cause=ValueError("bad"), metadata={"k": 1})
+        encoded = err.to_json(cache=True)
+
+        assert encoded is err.to_json(cache=True)
+        assert encoded == json.dumps(err.to_dict())
+
+    def test_cache_is_per_instance(self):
+        """Test derived instances do not share the parent's cache."""
+        ok = Ok(value=1)
+        ok.to_dict(cache=True)
+        mapped = ok.map(lambda v: v + 1)
+
+        assert mapped.to_dict(cache=True)["value"] == 2
+
+    def test_results_stay_slotted(self):
+        """Test the cache lives in a slot, not in a dataclass field."""
+        from dataclasses import fields
+        ok = Ok(value=1)
+        ok.to_json(cache=True)
+
+        assert "_serialized" not in getattr(ok, "__dict__", {})
+        assert [f.name for f in fields(ok)] == ["value", "messages", "metadata"]
@@ -0,0 +1,140 @@
+"""Tests for size-budgeted serialization with SerializationBudget."""
+import json
+import pytest
+
+from resokerr import Ok, Err, MessageTrace, SerializationBudget, SerializationOptions
+from resokerr.core import TypeUtils
+
+MARKER = TypeUtils.TRUNCATED_MARKER
+
+
+class Exploding:
+    """Value whose serializer must never run."""
+    def to_dict(self):
+        raise AssertionError("serialized past the budget")
+
+
+class TestLimits:
+    """Test each limit on TypeUtils.serialize."""
+
+    def test_no_limits_matches_serialize(self):
+        """Test an empty budget gives the plain serialize() output."""
+        data = {"a": [1, 2.5, None, True, {"b": ("c", "d")}], "e": ValueError("x")}
+        assert TypeUtils.serialize(data, budget=SerializationBudget()) == TypeUtils.serialize(data)
+
+    def test_max_string(self):
+        """Test long strings keep their prefix followed by the marker."""
+        budget = SerializationBudget(max_string=3)
+        assert TypeUtils.serialize(["abcdef", "abc"], budget=budget) == ["abc" + MARKER, "abc"]
+
+    def test_max_items(self):
+        """Test lists end with the marker and dicts count the entries left out."""
+        budget = SerializationBudget(max_items=2)
+        assert TypeUtils.serialize(list(range(5)), budget=budget) == [0, 1, MARKER]
+        assert TypeUtils.serialize({"a": 1, "b": 2, "c": 3, "d": 4}, budget=budget) == {"a": 1, "b": 2, MARKER: 2}
+
+    def test_max_items_skips_rest_of_container(self):
+        """Test items past the limit are never serialized."""
+        budget = SerializationBudget(max_items=1)
+        assert TypeUtils.serialize([1, Exploding()], budget=budget) == [1, MARKER]
+
+    def test_max_depth(self):
+        """Test containers below max_depth levels become the marker."""
+        budget = SerializationBudget(max_depth=2)
+        assert TypeUtils.serialize({"a": {"b": {"c": 1}}, "d": 1}, budget=budget) == {"a": {"b": MARKER}, "d": 1}
+
+    def test_max_bytes(self):
+        """Test output stops around max_bytes, marking every cut container."""
+        data = {"rows": [{"id": i, "name": "x" * 20} for i in range(10_000)], "tail": "end"}
+        output = TypeUtils.serialize(data, budget=SerializationBudget(max_bytes=500))
+
+        assert len(json.dumps(output)) < 600
+        assert output["rows"][-1] == MARKER
+        assert output[MARKER] == 1
+        assert "tail" not in output
+
+    def test_max_bytes_stops_serializing(self):
+        """Test values after the budget runs out are never serialized."""
+        output = TypeUtils.serialize(["x" * 100, Exploding()], budget=SerializationBudget(max_bytes=50))
+        assert output == [MARKER]
+
+    def test_handler_output_budgeted(self):
+        """Test the output of to_dict() and str() fallbacks is limited too."""
+        class Big:
+            def to_dict(self):
+                return {"blob": "y" * 1_000}
+
+        budget = SerializationBudget(max_string=4)
+        assert TypeUtils.serialize([Big(), object()], budget=budget)[0] == {"blob": "yyyy" + MARKER}
+        assert TypeUtils.serialize(object(), budget=budget) == "<obj" + MARKER
+
+    def test_cycles_and_deep_values(self):
+        """Test cycles are cut and deep values do not hit the recursion limit."""
+        data: list = [1]
+        data.append(data)
+        assert TypeUtils.serialize(data, budget=SerializationBudget()) == [1, TypeUtils.CYCLE_MARKER]
+
+        root = node = []
+        for _ in range(5_000):
+            node.append([])
+            node = node[0]
+        node = TypeUtils.serialize(root, budget=SerializationBudget())
+        depth = 0
+        while node:
+            node = node[0]
+            depth += 1
+        assert depth == 5_000
+
+    def test_negative_limit(self):
+        """Test negative limits are rejected."""
+        with pytest.raises(ValueError):
+            SerializationBudget(max_bytes=-1)
+
+
+class TestResultBudgets:
+    """Test budgets on results and messages."""
+
+    def test_err_cause_and_details(self):
+        """Test the cause, details and metadata of an Err are limited."""
+        err = (Err(cause="x" * 10_000, metadata={"ids": list(range(1_000))})
+               .with_error("failed", details={"payload": "y" * 10_000}))
+        data = err.to_dict(budget=SerializationBudget(max_string=8, max_items=3))
+
+        assert data["cause"] == "x" * 8 + MARKER
+        assert data["messages"][0]["details"] == {"payload": "y" * 8 + MARKER}
+        assert data["metadata"] == {"ids": [0, 1, 2, MARKER]}
+
+    def test_shared_byte_budget(self):
+        """Test the value, messages and metadata share max_bytes."""
+        result = Ok(value="v" * 200, metadata={"m": 1}).with_info("a").with_info("b")
+        data = result.to_dict(budget=SerializationBudget(max_bytes=100))
+        assert data["value"] == MARKER
+        assert data["messages"] == [MARKER]
+        assert data["metadata"] == MARKER
+
+    def test_messages_limited_by_max_items(self):
+        """Test the message list follows max_items."""
+        result = Ok(value=1).with_info("a").with_info("b").with_info("c")
+        data = result.to_dict(budget=SerializationBudget(max_items=2))
+        assert [message if message == MARKER else message["message"] for message in data["messages"]] == ["a", "b", MARKER]
+
+    def test_combined_with_options(self):
+        """Test budgets apply on top of serialization options."""
+        result = Ok(value="abcdef").with_warning("w" * 10, code="W1").with_info("i")
+        options = SerializationOptions(min_severity="warning", compact_keys=True)
+        data = result.to_dict(options=options, budget=SerializationBudget(max_string=2))
+        assert data == {"ok": True, "err": False, "v": "ab" + MARKER,
+                        "ms": [{"m": "ww" + MARKER, "s": "warning", "k": "W1"}]}
+
+    def test_unwrap_and_message_trace(self):
+        """Test unwrap(as_dict=True) and MessageTrace.to_dict accept a budget."""
+        budget = SerializationBudget(max_items=1)
+        assert Ok(value=[1, 2]).unwrap(as_dict=True, budget=budget) == [1, MARKER]
+        assert Err(cause=(1, 2)).unwrap(as_dict=True, budget=budget) == [1, MARKER]
+        trace = MessageTrace.info("m", details={"a": 1, "b": 2})
+        assert trace.to_dict(budget=budget)["details"] == {"a": 1, MARKER: 1}
+
+    def test_cache_cannot_be_combined(self):
+        """Test budgets cannot be used with the serialization cache."""
+        with pytest.raises(ValueError):
+            Ok(value=1).to_dict(cache=True, budget=SerializationBudget())
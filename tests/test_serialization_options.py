@@ -0,0 +1,135 @@
+"""Tests for projecting and filtering to_dict() output with SerializationOptions."""
+import pytest
+
+from resokerr import Ok, Err, MessageTrace, SerializationOptions, TraceSeverityLevel
+
+
+def _result() -> Ok:
+    return (Ok(value={"id": 1}, metadata={"request": "abc"})
+            .with_success("done")
+            .with_info("loaded", code="I1", details={"rows": 3})
+            .with_warning("slow", code="W1", stack_trace="Traceback ...")
+            .with_warning("retried", code="W2", details={"attempts": 2}))
+
+
+class TestDefaults:
+    """Test options left at their defaults."""
+
+    def test_default_options_match_plain_output(self):
+        """Test default options produce the same dict as to_dict()."""
+        result = _result()
+        assert result.to_dict(options=SerializationOptions()) == result.to_dict()
+
+    def test_err_default_options(self):
+        """Test default options on Err match to_dict()."""
+        err = Err(cause=ValueError("bad"), metadata={"m": 1}).with_error("failed", stack_trace="tb")
+        assert err.to_dict(options=SerializationOptions()) == err.to_dict()
+
+    def test_cache_cannot_be_combined(self):
+        """Test options cannot be used with the serialization cache."""
+        with pytest.raises(ValueError):
+            _result().to_dict(cache=True, options=SerializationOptions())
+
+
+class TestFiltering:
+    """Test message filtering options."""
+
+    def test_min_severity(self):
+        """Test messages below the minimum severity are left out."""
+        options = SerializationOptions(min_severity=TraceSeverityLevel.WARNING)
+        messages = _result().to_dict(options=options)["messages"]
+        assert [message["code"] for message in messages] == ["W1", "W2"]
+
+    def test_min_severity_by_name(self):
+        """Test the minimum severity can be given by its value."""
+        options = SerializationOptions(min_severity="error")
+        assert _result().to_dict(options=options)["messages"] == []
+
+    def test_max_messages(self):
+        """Test only the first messages after filtering are kept."""
+        options = SerializationOptions(min_severity="info", max_messages=2)
+        messages = _result().to_dict(options=options)["messages"]
+        assert [message["message"] for message in messages] == ["loaded", "slow"]
+
+    def test_stack_traces_dropped(self):
+        """Test stack traces can be left out."""
+        options = SerializationOptions(stack_traces=False)
+        messages = _result().to_dict(options=options)["messages"]
+        assert all("stack_trace" not in message for message in messages)
+
+
+class TestProjection:
+    """Test field selection and compact keys."""
+
+    def test_include_restricts_both_levels(self):
+        """Test include names fields of results and of messages."""
+        options = SerializationOptions(min_severity="warning", include={"value", "messages", "code"})
+        assert _result().to_dict(options=options) == {
+            "value": {"id": 1},
+            "messages": [{"code": "W1"}, {"code": "W2"}],
+        }
+
+    def test_include_result_level_only(self):
+        """Test messages keep every field when include names none of them."""
+        options = SerializationOptions(include={"cause", "messages"})
+        err = Err(cause="boom").with_error("failed", code="E1")
+        assert err.to_dict(options=options) == {
+            "cause": "boom",
+            "messages": [{"message": "failed", "severity": "error", "code": "E1"}],
+        }
+
+    def test_exclude(self):
+        """Test excluded fields are left out at either level."""
+        options = SerializationOptions(exclude={"metadata", "details", "is_err"})
+        data = _result().to_dict(options=options)
+        assert "metadata" not in data and "is_err" not in data
+        assert all("details" not in message for message in data["messages"])
+
+    def test_excluded_parts_not_serialized(self):
+        """Test excluded values are never passed to their serializer."""
+        class Explosive:
+            def to_dict(self):
+                raise AssertionError("serialized")
+
+        options = SerializationOptions(exclude={"value", "details"})
+        result = Ok(value=Explosive()).with_info("x", details={"bad": Explosive()})
+        assert result.to_dict(options=options)["messages"] == [{"message": "x", "severity": "info"}]
+
+    def test_compact_keys(self):
+        """Test compact mode shortens keys at both levels."""
+        options = SerializationOptions(compact_keys=True, min_severity="warning", max_messages=1)
+        assert _result().to_dict(options=options) == {
+            "ok": True,
+            "err": False,
+            "v": {"id": 1},
+            "ms": [{"m": "slow", "s": "warning", "k": "W1", "t": "Traceback ..."}],
+            "md": {"request": "abc"},
+        }
+
+    def test_message_trace_options(self):
+        """Test MessageTrace.to_dict accepts the same options."""
+        trace = MessageTrace.error("failed", code="E1", details={"a": 1}, stack_trace="tb")
+        options = SerializationOptions(exclude={"details"}, stack_traces=False, compact_keys=True)
+        assert trace.to_dict(options) == {"m": "failed", "s": "error", "k": "E1"}
+
+
+class TestOptionsObject:
+    """Test building and reusing options."""
+
+    def test_reusable_and_hashable(self):
+        """Test one options instance serves many calls and compares by value."""
+        options = SerializationOptions(include=["value", "messages"], exclude=("details",))
+        first = SerializationOptions(include={"messages", "value"}, exclude={"details"})
+        assert options == first and hash(options) == hash(first)
+        assert [Ok(value=i).to_dict(options=options) for i in range(3)][2] == {"value": 2, "messages": []}
+
+    @pytest.mark.parametrize("kwargs", [
+        {"include": {"values"}},
+        {"exclude": {"trace"}},
+        {"min_severity": "critical"},
+        {"max_messages": -1},
+    ])
+    def test_invalid_options(self, kwargs):
+        """Test unknown names and negative limits are rejected up front."""
+        with pytest.raises(ValueError):
+            SerializationOptions(**kwargs)
@@ -0,0 +1,321 @@
+"""Tests for opt-in serialization profiles."""
+import base64
+import ipaddress
+import json
+import pytest
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from enum import Enum, IntEnum
+from fractions import Fraction
+from typing import Any, Dict, List, NamedTuple, Optional
+from uuid import UUID
+
+from resokerr import (
+    Ok, Err, binary,
+    enable_serialization_profile, disable_serialization_profile, serialization_profile,
+    register_serializer, unregister_serializer, invalidate_serializer,
+)
+from resokerr.core import TypeUtils, _ExpandingHandler, _type_serializers
+
+
+@dataclass
+class Address:
+    city: str
+    zip_code: str
+
+
+@dataclass
+class User:
+    name: str
+    address: Address
+    tags: List[str] = field(default_factory=list)
+    friend: Optional["User"] = None
+
+
+@dataclass
+class Pending:
+    name: str
+    result: List[int] = field(init=False)
+
+
+@dataclass
+class WithToDict:
+    value: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"custom": self.value}
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Color(Enum):
+    RED = "red"
+    PAIR = (1, 2)
+
+
+class Level(IntEnum):
+    HIGH = 3
+
+
+class Slotted:
+    __slots__ = ("x", "__secret")
+
+    def __init__(self, x: Any, secret: Any = None) -> None:
+        self.x = x
+        self.__secret = secret
+
+
+class SlottedChild(Slotted):
+    __slots__ = ("label",)
+
+    def __init__(self, x: Any, label: str) -> None:
+        super().__init__(x)
+        self.label = label
+
+
+UID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest.fixture
+def native():
+    """Enable every profile for one test."""
+    with serialization_profile("native"):
+        yield
+
+
+class TestDefaultOutput:
+    """Test output without profiles is unchanged."""
+
+    def test_types_fall_back_to_str(self):
+        """Test the previous str() fallback is kept by default."""
+        user = User("ada", Address("Paris", "75001"))
+        assert TypeUtils.active_profiles() == ()
+        assert TypeUtils.serialize(user) == str(user)
+        assert TypeUtils.serialize({1, 2}) == str({1, 2})
+        assert TypeUtils.serialize(b"ab") == "b'ab'"
+        assert TypeUtils.serialize(Decimal("1.50")) == "1.50"
+        assert TypeUtils.serialize(Color.RED) == "Color.RED"
+        assert TypeUtils.serialize(Point(1, 2)) == [1, 2]
+
+
+class TestProfiles:
+    """Test each profile."""
+
+    def test_dataclass_by_field(self, native):
+        """Test dataclasses serialize field by field, recursively."""
+        user = User("ada", Address("Paris", "75001"), ["admin"])
+        assert TypeUtils.serialize(user) == {
+            "name": "ada",
+            "address": {"city": "Paris", "zip_code": "75001"},
+            "tags": ["admin"],
+            "friend": None,
+        }
+
+    def test_unset_dataclass_fields_skipped(self, native):
+        """Test init=False fields never assigned are left out."""
+        pending = Pending("job")
+        assert TypeUtils.serialize(pending) == {"name": "job"}
+        pending.result = [1]
+        assert TypeUtils.serialize(pending) == {"name": "job", "result": [1]}
+
+    def test_dataclass_with_to_dict_keeps_it(self, native):
+        """Test dataclasses implementing to_dict() still use it."""
+        assert TypeUtils.serialize(WithToDict(1)) == {"custom": 1}
+
+    def test_dataclass_cycle_cut(self, native):
+        """Test self-referencing dataclasses are cut with the cycle marker."""
+        user = User("ada", Address("Paris", "75001"))
+        user.friend = user
+        assert TypeUtils.serialize(user)["friend"] == TypeUtils.CYCLE_MARKER
+
+    def test_namedtuple_by_field(self, native):
+        """Test NamedTuples serialize as a dict of fields."""
+        assert TypeUtils.serialize([Point(1, 2)]) == [{"x": 1, "y": 2}]
+
+    def test_slots_by_attribute(self, native):
+        """Test slotted classes serialize as a dict of their slots, base classes first."""
+        assert TypeUtils.serialize(Slotted(1, "s")) == {"x": 1, "__secret": "s"}
+        assert TypeUtils.serialize(SlottedChild([1], "c")) == {"x": [1], "__secret": None, "label": "c"}
+
+    def test_stdlib_slotted_classes_kept(self, native):
+        """Test slotted stdlib classes keep their str() form."""
+        assert TypeUtils.serialize([Fraction(1, 3), ipaddress.ip_address("10.0.0.1")]) == ["1/3", "10.0.0.1"]
+
+    def test_unset_slots_skipped(self, native):
+        """Test slots never assigned are left out."""
+        child = SlottedChild.__new__(SlottedChild)
+        child.label = "only"
+        assert TypeUtils.serialize(child) == {"label": "only"}
+
+    def test_enum_value(self, native):
+        """Test Enum members serialize to their serialized value."""
+        assert TypeUtils.serialize([Color.RED, Color.PAIR, Level.HIGH]) == ["red", [1, 2], 3]
+
+    def test_datetime_iso(self, native):
+        """Test datetime, date and time use ISO 8601."""
+        moment = datetime(2026, 1, 23, 12, 30, tzinfo=timezone.utc)
+        assert TypeUtils.serialize([moment, date(2026, 1, 23), time(8, 15)]) == [
+            "2026-01-23T12:30:00+00:00", "2026-01-23", "08:15:00",
+        ]
+
+    def test_decimal_and_uuid(self, native):
+        """Test Decimal and UUID keep their exact string forms."""
+        assert TypeUtils.serialize([Decimal("1.50"), UID]) == ["1.50", "12345678-1234-5678-1234-567812345678"]
+
+    def test_sets_as_lists(self, native):
+        """Test sets and frozensets become lists of serialized items."""
+        assert sorted(TypeUtils.serialize({3, 1, 2})) == [1, 2, 3]
+        assert TypeUtils.serialize(frozenset({Decimal("1")})) == ["1"]
+
+    def test_bytes_as_base64(self, native):
+        """Test bytes-like objects become base64 strings."""
+        data = bytes(range(256))
+        expected = base64.b64encode(data).decode("ascii")
+        assert TypeUtils.serialize(data) == expected
+        assert TypeUtils.serialize(bytearray(data)) == expected
+        assert TypeUtils.serialize(memoryview(data)[10:20]) == base64.b64encode(data[10:20]).decode("ascii")
+
+
+class TestProfileSelection:
+    """Test enabling and disabling profiles."""
+
+    def test_single_profile(self):
+        """Test only the enabled profile applies."""
+        enable_serialization_profile("decimal")
+        try:
+            assert TypeUtils.active_profiles() == ("decimal",)
+            assert TypeUtils.serialize([Decimal("2.5"), {1}]) == ["2.5", "{1}"]
+        finally:
+            disable_serialization_profile("decimal")
+        assert TypeUtils.active_profiles() == ()
+
+    def test_context_manager_keeps_enabled_profiles(self):
+        """Test profiles enabled before the block stay enabled after it."""
+        enable_serialization_profile("set")
+        try:
+            with serialization_profile("set", "bytes"):
+                assert TypeUtils.active_profiles() == ("set", "bytes")
+            assert TypeUtils.active_profiles() == ("set",)
+        finally:
+            disable_serialization_profile("set")
+
+    def test_profile_change_invalidates_cache(self):
+        """Test types cached before enabling a profile pick it up."""
+        assert TypeUtils.serialize(b"x") == "b'x'"
+        with serialization_profile("bytes"):
+            assert TypeUtils.serialize(b"x") == "eA=="
+        assert TypeUtils.serialize(b"x") == "b'x'"
+
+    def test_registered_handler_wins(self, native):
+        """Test registered handlers take precedence over profiles."""
+        register_serializer(Decimal, float)
+        try:
+            assert TypeUtils.serialize(Decimal("1.5")) == 1.5
+        finally:
+            unregister_serializer(Decimal)
+
+    def test_unknown_profile(self):
+        """Test unknown profile names are rejected."""
+        with pytest.raises(ValueError):
+            enable_serialization_profile("yaml")
+
+
+class TestProfilesInResults:
+    """Test profiles apply to every output path of results."""
+
+    RESULTS = [
+        Ok(value=User("ada", Address("Paris", "75001"), ["a"]),
+           metadata={"at": date(2026, 1, 23), "ids": {UID}}).with_info(Point(1, 2), details={"raw": b"\x00\xff"}),
+        Err(cause=Color.RED, metadata={"amount": Decimal("9.90")}).with_error("failed", details={"level": Level.HIGH}),
+    ]
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_to_json_matches_to_dict(self, native, result):
+        """Test streamed JSON matches json.dumps(to_dict())."""
+        assert result.to_json() == json.dumps(result.to_dict())
+
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_binary_matches_json(self, native, result):
+        """Test the binary codec encodes the same data."""
+        assert binary.loads(binary.dumps(result)).to_json() == result.to_json()
+
+    def test_large_dataclass_list_streamed(self, native):
+        """Test lists of dataclasses stream with the same output."""
+        result = Ok(value=[Address(f"city {i}", str(i)) for i in range(2_000)])
+        assert result.to_json() == json.dumps(result.to_dict())
+
+
+class TestCompiledPlans:
+    """Test the per-class serializers compiled for record-like types."""
+
+    def test_plan_compiled_once_per_class(self, native):
+        """Test record types get a handler with a compiled plan, cached per class."""
+        TypeUtils.serialize(Address("Paris", "75001"))
+        handler = _type_serializers[Address]
+        assert type(handler) is _ExpandingHandler and handler.plan is not None
+        TypeUtils.serialize(Address("Lyon", "69001"))
+        assert _type_serializers[Address] is handler
+
+    @pytest.mark.parametrize("record, expected", [
+        (Address("Paris", "75001"), {"city": "Paris", "zip_code": "75001"}),
+        (Point(1, 2), {"x": 1, "y": 2}),
+        (Slotted(1.5, True), {"x": 1.5, "__secret": True}),
+    ])
+    def test_plan_output(self, native, record, expected):
+        """Test compiled plans produce the same dict as the generic walk."""
+        handler = _type_serializers.get(type(record)) or TypeUtils._resolve_serializer(type(record))
+        generic = _ExpandingHandler(handler.is_dict, handler.entries, handler.size)
+        assert handler.plan(record) == expected
+        assert generic(record) == expected
+        assert TypeUtils.serialize([record, record]) == [expected, expected]
+
+    def test_non_primitive_field_falls_back(self, native):
+        """Test records holding containers are walked, keeping cycle detection."""
+        data: Dict[str, Any] = {}
+        data["self"] = Point(data, 1)
+        assert TypeUtils.serialize(data) == {"self": {"x": TypeUtils.CYCLE_MARKER, "y": 1}}
+
+    def test_streamed_output_matches(self, native):
+        """Test JSON and binary outputs use the same plans."""
+        result = Ok(value=[Address(f"city {i}", str(i)) for i in range(100)] + [Point(1, Address("a", "b"))])
+        assert result.to_json() == json.dumps(result.to_dict())
+        assert binary.loads(binary.dumps(result)).to_json() == result.to_json()
+
+    def test_to_dict_method_called_directly(self):
+        """Test classes with a to_dict() method use it as their handler."""
+        assert TypeUtils.serialize(WithToDict(2)) == {"custom": 2}
+        assert _type_serializers[WithToDict] is WithToDict.to_dict
+
+
+class TestInvalidateSerializer:
+    """Test dropping cached serializers."""
+
+    def test_changed_class_picked_up(self):
+        """Test a class changed at runtime is serialized with its new to_dict()."""
+        class Changing:
+            def to_dict(self) -> Dict[str, Any]:
+                return {"version": 1}
+
+        assert TypeUtils.serialize(Changing()) == {"version": 1}
+        Changing.to_dict = lambda self: {"version": 2}  # type: ignore[method-assign]
+        assert TypeUtils.serialize(Changing()) == {"version": 1}
+        invalidate_serializer(Changing)
+        assert TypeUtils.serialize(Changing()) == {"version": 2}
+
+    def test_subclasses_dropped(self):
+        """Test invalidating a class also drops the serializers of its subclasses."""
+        TypeUtils.serialize([Slotted(1), SlottedChild(1, "c"), Address("a", "b")])
+        invalidate_serializer(Slotted)
+        assert Slotted not in _type_serializers
+        assert SlottedChild not in _type_serializers
+        assert Address in _type_serializers
+
+    def test_invalidate_all(self):
+        """Test invalidating without a class clears every cached serializer."""
+        TypeUtils.serialize([Slotted(1), Address("a", "b")])
+        invalidate_serializer()
+        assert not _type_serializers
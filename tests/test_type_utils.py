@@ -0,0 +1,240 @@
+"""Tests for TypeUtils serialization dispatch."""
+import pytest
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from resokerr.core import Ok, Err, MessageTrace, TypeUtils, _type_serializers
+
+
+class Point:
+    """Plain class without to_dict()."""
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+    def __str__(self) -> str:
+        return f"Point({self.x}, {self.y})"
+
+
+class Point3D(Point):
+    """Subclass used to check MRO-based handler lookup."""
+
+
+class WithToDict:
+    """Class implementing the to_dict() protocol."""
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": "with_to_dict"}
+
+
+@pytest.fixture
+def registry():
+    """Track registrations made by a test and remove them afterwards."""
+    registered = []
+
+    def register(cls, handler):
+        TypeUtils.register_serializer(cls, handler)
+        registered.append(cls)
+
+    yield register
+    for cls in registered:
+        TypeUtils.unregister_serializer(cls)
+
+
+class TestSerializeDispatch:
+    """Test that serialize() output is unchanged and handlers are cached."""
+
+    def test_builtin_rules_unchanged(self):
+        """Test output for the built-in rules."""
+        value = {
+            "s": "text", "i": 1, "f": 1.5, "b": True, "n": None,
+            "list": [1, (2, 3)], "obj": WithToDict(), "point": Point(1, 2),
+            "exc": ValueError("bad"),
+        }
+        assert TypeUtils.serialize(value) == {
+            "s": "text", "i": 1, "f": 1.5, "b": True, "n": None,
+            "list": [1, [2, 3]], "obj": {"kind": "with_to_dict"}, "point": "Point(1, 2)",
+            "exc": {"name": "ValueError", "message": "bad"},
+        }
+
+    def test_results_and_traces_use_to_dict(self):
+        """Test Ok and MessageTrace values are serialized through to_dict()."""
+        ok = Ok(value=1).with_info("done")
+        assert TypeUtils.serialize([ok, MessageTrace.info("x")]) == [
+            ok.to_dict(), {"message": "x", "severity": "info"},
+        ]
+
+    def test_handler_cached_per_type(self):
+        """Test the resolved handler is cached for the concrete type."""
+        TypeUtils.serialize(Point(1, 2))
+        assert Point in _type_serializers
+
+    def test_has_to_dict(self):
+        """Test has_to_dict() still detects the protocol."""
+        assert TypeUtils.has_to_dict(WithToDict())
+        assert not TypeUtils.has_to_dict("plain string")
+
+    def test_instance_to_dict(self):
+        """Test to_dict() set on an instance only is used, as has_to_dict() reports."""
+        obj = SimpleNamespace(to_dict=lambda: {"kind": "namespace"})
+        assert TypeUtils.has_to_dict(obj)
+        assert TypeUtils.serialize([obj, SimpleNamespace(a=1)]) == [{"kind": "namespace"}, "namespace(a=1)"]
+        assert Ok(value=obj).to_json() == '{"is_ok": true, "is_err": false, "value": {"kind": "namespace"}, "messages": []}'
+
+
+class TestRegisterSerializer:
+    """Test user-registered serialization handlers."""
+
+    def test_registered_handler_used(self, registry):
+        """Test a registered handler replaces the string fallback."""
+        registry(Decimal, str)
+        registry(Point, lambda p: {"x": p.x, "y": p.y})
+
+        assert TypeUtils.serialize([Decimal("1.50"), Point(1, 2)]) == ["1.50", {"x": 1, "y": 2}]
+
+    def test_registered_handler_applies_to_subclasses(self, registry):
+        """Test a handler registered on a base class handles subclasses."""
+        registry(Point, lambda p: [p.x, p.y])
+        assert TypeUtils.serialize(Point3D(3, 4)) == [3, 4]
+
+    def test_nearest_registered_class_wins(self, registry):
+        """Test the handler of the nearest class in the MRO takes precedence."""
+        registry(Point, lambda p: "base")
+        registry(Point3D, lambda p: "derived")
+
+        assert TypeUtils.serialize(Point(0, 0)) == "base"
+        assert TypeUtils.serialize(Point3D(0, 0)) == "derived"
+
+    def test_registration_invalidates_cache(self, registry):
+        """Test registering after a type was cached takes effect."""
+        assert TypeUtils.serialize(Point(1, 2)) == "Point(1, 2)"
+        registry(Point, lambda p: p.x)
+        assert TypeUtils.serialize(Point(1, 2)) == 1
+
+    def test_unregister_restores_builtin_rule(self):
+        """Test unregistering falls back to the built-in rules."""
+        TypeUtils.register_serializer(Point, lambda p: p.x)
+        TypeUtils.unregister_serializer(Point)
+        assert TypeUtils.serialize(Point(1, 2)) == "Point(1, 2)"
+
+    def test_unregister_unknown_type_raises(self):
+        """Test unregistering a type without a handler raises KeyError."""
+        with pytest.raises(KeyError):
+            TypeUtils.unregister_serializer(Point)
+
+
+class TestSerializeNesting:
+    """Test deep, cyclic and shared structures."""
+
+    def test_deep_nesting(self):
+        """Test values nested far beyond the recursion limit."""
+        root = node = {}
+        for _ in range(5_000):
+            child = {}
+            node["child"] = [child]
+            node = child
+
+        result = TypeUtils.serialize(root)
+        depth = 0
+        while result:
+            result = result["child"][0]
+            depth += 1
+        assert depth == 5_000
+
+    def test_self_reference_replaced(self):
+        """Test a container containing itself is cut with the marker."""
+        data = {"name": "root", "items": [1, 2]}
+        data["self"] = data
+        data["items"].append(data["items"])
+
+        assert TypeUtils.serialize(data) == {
+            "name": "root",
+            "items": [1, 2, TypeUtils.CYCLE_MARKER],
+            "self": TypeUtils.CYCLE_MARKER,
+        }
+
+    def test_indirect_cycle_cut_on_each_path(self):
+        """Test cycles are cut where they close, whatever the entry point."""
+        a = {}
+        b = {"a": a}
+        a["b"] = b
+
+        assert TypeUtils.serialize([b, a]) == [
+            {"a": {"b": TypeUtils.CYCLE_MARKER}},
+            {"b": {"a": TypeUtils.CYCLE_MARKER}},
+        ]
+
+    def test_shared_subobject_serialized_once(self, registry):
+        """Test an object referenced by many entries is serialized once per call."""
+        calls = []
+        registry(Point, lambda p: calls.append(p) or {"x": p.x})
+        shared = {"point": Point(1, 2), "tags": ["a", "b"]}
+        entries = [{"id": i, "meta": shared} for i in range(10_000)]
+
+        result = TypeUtils.serialize(entries)
+
+        assert len(calls) == 1
+        assert all(entry["meta"] == {"point": {"x": 1}, "tags": ["a", "b"]} for entry in result)
+        assert result[0]["meta"] is result[-1]["meta"]
+
+    def test_shared_but_acyclic_is_not_a_cycle(self):
+        """Test the same list used twice in one container is serialized twice."""
+        shared = [1, 2]
+        assert TypeUtils.serialize({"a": shared, "b": (shared, shared)}) == {
+            "a": [1, 2], "b": [[1, 2], [1, 2]],
+        }
+
+
+    def test_shared_output_is_aliased(self):
+        """Test occurrences of a shared object are one output object, and separate calls are independent."""
+        d = {"k": [1]}
+        result = TypeUtils.serialize([d, [d]])
+        assert result[0] is result[1][0]
+        result[0]["k"].append(2)
+        assert result[1][0]["k"] == [1, 2]
+        assert TypeUtils.serialize([d, [d]]) == [{"k": [1]}, [{"k": [1]}]]
+        assert d == {"k": [1]}
+
+
+class TestIterSerialized:
+    """Test chunked serialization of large containers."""
+
+    def test_list_chunks_concatenate_to_serialize(self):
+        """Test list chunks are bounded and join into the serialize() output."""
+        rows = [{"row": i, "point": Point(i, i)} for i in range(2_500)]
+        chunks = list(TypeUtils.iter_serialized(rows, chunk_items=1_000))
+
+        assert [len(chunk) for chunk in chunks] == [1_000, 1_000, 500]
+        assert [item for chunk in chunks for item in chunk] == TypeUtils.serialize(rows)
+
+    def test_dict_chunks_merge_to_serialize(self):
+        """Test dict chunks hold disjoint entries covering the whole dict."""
+        data = {f"key {i}": [i] for i in range(25)}
+        chunks = list(TypeUtils.iter_serialized(data, chunk_items=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert {key: value for chunk in chunks for key, value in chunk.items()} == TypeUtils.serialize(data)
+
+    def test_non_container_single_chunk(self):
+        """Test non-container values are yielded whole."""
+        assert list(TypeUtils.iter_serialized(Point(1, 2))) == ["Point(1, 2)"]
+        assert list(TypeUtils.iter_serialized([])) == []
+
+    def test_reference_to_root_is_cycle(self):
+        """Test items referencing the container are cut as in serialize()."""
+        rows: list[Any] = [1, 2]
+        rows.append({"all": rows})
+        chunks = list(TypeUtils.iter_serialized(rows, chunk_items=2))
+        assert chunks == [[1, 2], [{"all": TypeUtils.CYCLE_MARKER}]]
+
+    def test_invalid_chunk_items(self):
+        """Test chunk_items must be positive."""
+        with pytest.raises(ValueError):
+            TypeUtils.iter_serialized([1], chunk_items=0)
+
+    def test_result_methods(self):
+        """Test Ok and Err stream their value and cause."""
+        ok = Ok(value=list(range(7)))
+        assert list(ok.iter_serialized(chunk_items=3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        err = Err(cause=("a", Point(0, 0)))
+        assert list(err.iter_serialized()) == [["a", "Point(0, 0)"]]